@@ -71,7 +71,7 @@ class MLModelProvider(PythonProvider):
 
     def get_artifacts(self) -> ArtifactCollection:
         """Return model binaries"""
-        artifacts = _RelativePathWrapper(self.model.artifact_any, MODEL_BIN_PATH)
+        artifacts = _RelativePathWrapper(self.model.artifact_readable, MODEL_BIN_PATH)
         if len(self.server.additional_binaries) > 0:
             artifacts = CompositeArtifactCollection([
                 artifacts,
@@ -53,7 +53,7 @@ class MLModelMultiProvider(MLModelProvider):
         """Returns binaries of models artifacts"""
         # TODO additional server binaries
         return CompositeArtifactCollection([
-            _RelativePathWrapper(m.artifact_any, os.path.join(MODEL_BIN_PATH, str(i)))
+            _RelativePathWrapper(m.artifact_readable, os.path.join(MODEL_BIN_PATH, str(i)))
             for i, m in enumerate(self.models)
         ])
 
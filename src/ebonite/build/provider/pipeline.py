@@ -80,7 +80,7 @@ class PipelineProvider(PythonProvider):
         """Return model binaries"""
 
         artifacts = CompositeArtifactCollection(
-            [_RelativePathWrapper(m.artifact_any, os.path.join(MODEL_BIN_PATH, m.name)) for m in
+            [_RelativePathWrapper(m.artifact_readable, os.path.join(MODEL_BIN_PATH, m.name)) for m in
              self.pipeline.models.values()])
         if len(self.server.additional_binaries) > 0:
             artifacts = CompositeArtifactCollection([
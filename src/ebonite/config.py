@@ -114,6 +114,10 @@ class Core(Config):
                                    doc='Set to true to automatically load available extensions on ebonite import',
                                    parser=bool)
     RUNTIME = Param('runtime', default='false', doc='is this instance a runtime', parser=bool)
+    SPOOL_MAX_SIZE = Param('spool_max_size', default=str(16 * 2 ** 20),
+                           doc='max size in bytes of dumped model artifacts kept in memory, '
+                               'larger ones are written to temporary files',
+                           parser=int)
 
 
 class Logging(Config):
@@ -125,6 +129,9 @@ class Logging(Config):
 class Runtime(Config):
     SERVER = Param('server', doc='server for runtime')
     LOADER = Param('loader', doc='interface loader for runtime')
+    SWITCH_CURDIR = Param('switch_curdir', default='true',
+                          doc='set to false to never switch current directory to model directory on model method calls',
+                          parser=bool)
 
 
 if Core.DEBUG:
@@ -152,6 +152,13 @@ class ModelWithoutIdError(MetadataError):
         super(ModelWithoutIdError, self).__init__('Model "{}" id is None'.format(model))
 
 
+class ShallowModelError(MetadataError):
+    def __init__(self, model: ModelIntStr):
+        model = model.name if isinstance(model, Model) else model
+        super(ShallowModelError, self).__init__(f'Model "{model}" is loaded without wrapper and artifacts '
+                                                f'and can not be saved')
+
+
 class UnboundObjectError(MetadataError):
     pass
 
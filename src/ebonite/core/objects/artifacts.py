@@ -6,11 +6,13 @@ import sys
 import tempfile
 import typing
 from abc import abstractmethod
+from collections import defaultdict
 from copy import copy
 
 from pyjackson.core import Unserializable
 from pyjackson.decorators import make_string, type_field
 
+from ebonite.config import Core
 from ebonite.core.objects.base import EboniteParams
 
 StreamContextManager = typing.Iterable[typing.BinaryIO]
@@ -48,6 +50,26 @@ class Blob(EboniteParams):
         """
         pass  # pragma: no cover
 
+    @classmethod
+    def materialize_many(cls, blobs: typing.Dict[str, 'Blob']):
+        """
+        Writes payloads of several blobs of this type as files to local fs.
+        Implementations could override it to transfer payloads concurrently
+
+        :param blobs: dict of path to write file -> blob
+        """
+        for path, blob in blobs.items():
+            blob.materialize(path)
+
+    def version(self) -> typing.Optional[str]:
+        """
+        Returns token which changes whenever blob's payload changes (e.g. S3 ETag), it is used to validate cached
+        payloads. Implementations return `None` if there is no cheap way to get it
+
+        :return: version token or `None`
+        """
+        return None
+
     def bytes(self) -> bytes:
         """
         Returns blob's bytes
@@ -143,6 +165,56 @@ class InMemoryBlob(Blob, Unserializable):
         yield io.BytesIO(self.payload)
 
 
+class SpooledBlobWriter(io.RawIOBase):
+    """
+    Writable file-like object which keeps payload in memory until it exceeds `max_memory_size` bytes
+    and then spools it to a temporary file, so that large models could be dumped without buffering them in memory.
+    Use it as a context manager: temporary file is removed on exit, so blob is valid only inside of the context
+
+    :param max_memory_size: max size in bytes of payload kept in memory, `EBONITE_SPOOL_MAX_SIZE` if `None`
+    """
+
+    def __init__(self, max_memory_size: int = None):
+        super(SpooledBlobWriter, self).__init__()
+        self.max_memory_size = Core.SPOOL_MAX_SIZE if max_memory_size is None else max_memory_size
+        self._buffer = io.BytesIO()
+        self._file = None
+        self._tmpdir = None
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        size = memoryview(b).nbytes
+        if self._file is None and self._size + size > self.max_memory_size:
+            self._tmpdir = tempfile.mkdtemp()
+            self._file = open(os.path.join(self._tmpdir, 'payload'), 'wb')
+            self._file.write(self._buffer.getbuffer())
+            self._buffer = None
+        (self._file or self._buffer).write(b)
+        self._size += size
+        return size
+
+    def tell(self) -> int:
+        return self._size
+
+    def blob(self) -> Blob:
+        """
+        :return: :class:`InMemoryBlob` with payload if it is kept in memory, :class:`LocalFileBlob` otherwise
+        """
+        if self._file is None:
+            return InMemoryBlob(self._buffer.getvalue())
+        self._file.flush()
+        return LocalFileBlob(self._file.name)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+        super(SpooledBlobWriter, self).close()
+
+
 @type_field('type')
 class ArtifactCollection(EboniteParams):
     """
@@ -212,8 +284,11 @@ class Blobs(ArtifactCollection):
         :param path: target dir
         """
         os.makedirs(path, exist_ok=True)
+        by_type = defaultdict(dict)
         for name, blob in self.blobs.items():
-            blob.materialize(os.path.join(path, name))
+            by_type[type(blob)][os.path.join(path, name)] = blob
+        for blob_type, blobs in by_type.items():
+            blob_type.materialize_many(blobs)
 
     def bytes_dict(self) -> typing.Dict[str, bytes]:
         return {name: b.bytes() for name, b in self.blobs.items()}
@@ -7,7 +7,7 @@ import warnings
 from abc import abstractmethod
 from copy import copy
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from pyjackson import deserialize, serialize
 from pyjackson.core import Comparable
@@ -21,6 +21,7 @@ from ebonite.core.analyzer.requirement import RequirementAnalyzer
 from ebonite.core.objects.artifacts import ArtifactCollection, CompositeArtifactCollection
 from ebonite.core.objects.base import EboniteParams
 from ebonite.core.objects.dataset_type import DatasetType
+from ebonite.core.objects.execution import PIPELINE_INPUT, PipelinePlan, check_step_inputs
 from ebonite.core.objects.requirements import AnyRequirements, Requirements, resolve_requirements
 from ebonite.core.objects.wrapper import ModelWrapper, WrapperArtifactCollection
 from ebonite.utils.index_dict import IndexDict, IndexDictAccessor
@@ -552,7 +553,7 @@ class Model(EboniteObject):
         if get_python_version() != self.params.get(self.PYTHON_VERSION):
             warnings.warn(f'Loading model from different python version {self.params.get(self.PYTHON_VERSION)}')
         with tempfile.TemporaryDirectory(prefix='ebonite_run_') as tmpdir:
-            self.artifact.materialize(tmpdir)
+            self.artifact_readable.materialize(tmpdir)
             self.wrapper.load(tmpdir)
 
     def ensure_loaded(self):
@@ -630,6 +631,20 @@ class Model(EboniteObject):
         arts = [a for a in [self._persisted_artifacts, self._unpersisted_artifacts] if a is not None]
         return CompositeArtifactCollection(arts) if len(arts) != 1 else arts[0]
 
+    @property
+    def artifact_readable(self) -> 'ArtifactCollection':
+        """
+        Similar to `artifact_any` but persisted artifacts are read through bound artifact repository
+        (e.g. through local cache of :class:`.CachedArtifactRepository`)
+
+        :return: artifacts in any state (persisted or not) to read payloads of
+        """
+        persisted = self._persisted_artifacts
+        if persisted is not None and self.has_artifact_repo:
+            persisted = self._art.read_artifact(persisted)
+        arts = [a for a in [persisted, self._unpersisted_artifacts] if a is not None]
+        return CompositeArtifactCollection(arts) if len(arts) != 1 else arts[0]
+
     @property
     def artifact_req_persisted(self) -> 'ArtifactCollection':
         """
@@ -833,11 +848,15 @@ class PipelineStep(EboniteParams):
     """A class to represent one step of a Pipeline - a Model with one of its' methods name
 
     :param model_name: name of the Model (in the same Task as Pipeline object)
-    :param method_name: name of the method in Model's wrapper to use"""
+    :param method_name: name of the method in Model's wrapper to use
+    :param inputs: indices of previous steps which outputs are passed to this step, `Pipeline.INPUT` stands for
+        pipeline input. if several indices are given, list of outputs is passed.
+        if omitted, output of previous step (or pipeline input for the first step) is passed"""
 
-    def __init__(self, model_name: str, method_name: str):
+    def __init__(self, model_name: str, method_name: str, inputs: List[int] = None):
         self.model_name = model_name
         self.method_name = method_name
+        self.inputs = inputs
 
 
 @make_string('id', 'name')
@@ -846,6 +865,10 @@ class Pipeline(EboniteObject):
     They can be used to reuse different models (for example, pre-processing functions) in different pipelines.
     Pipelines must have exact same in and out data types as tasks they are in
 
+    Steps could also form a directed acyclic graph via their `inputs`: several steps could take the same input
+    (fan out) and a step could combine outputs of several steps (fan in). Output of the last step is pipeline output.
+    Independent steps are executed concurrently
+
     :param name: name of the pipeline
     :param steps: sequence of :class:`.PipelineStep`s the pipeline consists of
     :param input_data: datatype of input dataset
@@ -868,6 +891,10 @@ class Pipeline(EboniteObject):
         self.task_id = task_id
         self.steps = steps
         self.models: Dict[str, Model] = {}  # not using direct fk to models as it is pain
+        self._plan: Optional[Tuple[tuple, PipelinePlan]] = None
+
+    #: index which stands for pipeline input in `PipelineStep.inputs`
+    INPUT = PIPELINE_INPUT
 
     @property
     @_with_meta
@@ -902,25 +929,52 @@ class Pipeline(EboniteObject):
 
         :param data: data to apply pipeline to. must have type `Pipeline.input_data`
         :returns: processed data of type `Pipeline.output_data`"""
-        for step in self.steps:
-            model = self.models[step.model_name]
-            data = model.wrapper.call_method(step.method_name, data)
-        return data
+        return self.plan().run(data)
+
+    def run_batch(self, inputs: list) -> list:
+        """Applies sequence of pipeline steps to each of given inputs.
+        If pipeline input and output types support batching, inputs are passed through all steps in one pass
+
+        :param inputs: list of data to apply pipeline to. each must have type `Pipeline.input_data`
+        :returns: list of processed data of type `Pipeline.output_data`"""
+        return self.plan().run_batch(inputs)
+
+    def plan(self) -> PipelinePlan:
+        """Returns execution plan of this pipeline, which could be reused to run it many times.
+        Plan is cached until steps, models or data types of pipeline change
+
+        :returns: :class:`.PipelinePlan` instance"""
+        key = self._plan_key()
+        if self._plan is None or self._plan[0] != key:
+            self._plan = (key, PipelinePlan(self))
+        return self._plan[1]
+
+    def _plan_key(self) -> tuple:
+        # steps could be changed in place, so they are compared by value and models by identity
+        steps = tuple((s.model_name, s.method_name, None if s.inputs is None else tuple(s.inputs),
+                       id(self.models.get(s.model_name))) for s in self.steps)
+        return steps, id(self.input_data), id(self.output_data)
 
-    def append(self, model: Union[Model, _WrapperMethodAccessor], method_name: str = None):
+    def append(self, model: Union[Model, _WrapperMethodAccessor], method_name: str = None, inputs: List[int] = None):
         """Appends another Model to the sequence of this pipeline steps
 
         :param model: either Model instance, or model method (as in `model.method` where `method` is method name)
         :param method_name: if Model was provided in `model`, this should be method name.
-        can be omitted if model have only one method"""
+        can be omitted if model have only one method
+        :param inputs: indices of steps which outputs are passed to new step, `Pipeline.INPUT` for pipeline input.
+        if omitted, output of the last step is passed"""
         # TODO datatype validaiton
         if isinstance(model, _WrapperMethodAccessor):
             method_name = model.method_name
             model = model.model
         method_name = model.wrapper.resolve_method(method_name)
+        if inputs is not None:
+            inputs = list(inputs)
+            check_step_inputs(len(self.steps), inputs)
 
-        self.steps.append(PipelineStep(model.name, method_name))
+        self.steps.append(PipelineStep(model.name, method_name, inputs))
         self.models[model.name] = model
+        self._plan = None
         self.output_data = model.wrapper.methods[method_name][2]  # TODO change it to namedtuple
         return self
 
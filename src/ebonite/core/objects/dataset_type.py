@@ -1,6 +1,6 @@
 import builtins
 from abc import abstractmethod
-from typing import Dict, List, Sized
+from typing import Dict, Iterable, List, Optional, Sized
 
 from pyjackson import deserialize, serialize
 from pyjackson.core import ArgList, Field
@@ -44,6 +44,104 @@ class LibDatasetTypeMixin(DatasetType):
         return Requirements([InstallableRequirement.from_module(lib) for lib in self.libraries])
 
 
+class BatchableDatasetTypeMixin(DatasetType):
+    """
+    :class:`.DatasetType` mixin for types which objects could be concatenated and split along their first axis.
+    Runtime uses it to group several requests into a single model call.
+    """
+
+    @abstractmethod
+    def get_batch_size(self, obj) -> int:
+        """
+        :param obj: object of this dataset type
+        :return: size of object along its first axis
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def concat(self, objs: List[object]) -> object:
+        """
+        :param objs: list of objects of this dataset type
+        :return: single object which consists of given objects concatenated along first axis
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def split(self, obj, sizes: List[int]) -> List[object]:
+        """
+        :param obj: object of this dataset type
+        :param sizes: sizes of parts along first axis, should sum up to size of given object
+        :return: list of parts of given object
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def empty(self) -> object:
+        """
+        :return: object of this dataset type of size 0 along first axis
+        """
+        pass  # pragma: no cover
+
+
+class BinaryDatasetTypeMixin(DatasetType):
+    """
+    :class:`.DatasetType` mixin for types which objects could be (de)serialized to/from binary payload
+    of `content_type` MIME type. Runtime uses it as an alternative to JSON wire format.
+    """
+    content_type: str = None
+
+    @abstractmethod
+    def serialize_binary(self, instance) -> bytes:
+        """
+        :param instance: object of this dataset type
+        :return: binary payload
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def deserialize_binary(self, payload: bytes) -> object:
+        """
+        :param payload: binary payload
+        :return: object of this dataset type
+        """
+        pass  # pragma: no cover
+
+    def buffers(self, instance) -> Iterable:
+        """
+        Binary buffers which identify object, e.g. for hashing. Implementations could return raw memory of objects
+        to avoid copies, by default binary payload is returned
+
+        :param instance: object of this dataset type
+        :return: iterable of bytes-like objects
+        """
+        return [self.serialize_binary(instance)]
+
+
+class ColumnarDatasetTypeMixin(DatasetType):
+    """
+    :class:`.DatasetType` mixin for tabular types which objects could be serialized to JSON in columnar form
+    in addition to their default form. Runtime uses it if client requests columnar output.
+    """
+
+    @abstractmethod
+    def serialize_columnar(self, instance) -> dict:
+        """
+        :param instance: object of this dataset type
+        :return: JSON-compatible columnar representation of object
+        """
+        pass  # pragma: no cover
+
+
+def binary_content_type(dataset_type) -> Optional[str]:
+    """
+    :param dataset_type: :class:`.DatasetType` to check
+    :return: binary content type supported by given dataset type or `None` if it doesn't support one
+    """
+    if not issubclass(dataset_type, BinaryDatasetTypeMixin):
+        return None
+    return dataset_type.content_type
+
+
 PRIMITIVES = {int, str, bool, complex, float}
 
 
@@ -0,0 +1,247 @@
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ebonite.config import Config, Core, Param
+from ebonite.core.objects.dataset_type import BatchableDatasetTypeMixin, DatasetType
+from ebonite.core.objects.hooks import CallInfo, current_call, has_hooks, hooked_call, in_call
+from ebonite.utils.log import logger
+
+
+class PipelineConfig(Config):
+    PIPELINE_THREADS = Param('pipeline_threads', default='8',
+                             doc='number of threads to execute independent steps of DAG pipelines in', parser=int)
+
+
+if Core.DEBUG:
+    PipelineConfig.log_params()
+
+#: index which stands for pipeline input in :attr:`.PipelineStep.inputs`
+PIPELINE_INPUT = -1
+
+Converter = Callable[[object], object]
+ConverterFactory = Callable[[DatasetType, DatasetType], Optional[Converter]]
+
+_converters: List[Tuple[type, type, ConverterFactory]] = []
+
+
+def register_converter(from_type: type, to_type: type):
+    """
+    Decorator which registers factory of converters between objects of two kinds of dataset types.
+    Factory is called once per pipeline plan with concrete source and target :class:`.DatasetType` s and should return
+    conversion function or `None` if these types could not be converted.
+
+    :param from_type: :class:`.DatasetType` subclass of source objects
+    :param to_type: :class:`.DatasetType` subclass of target objects
+    :return: decorator
+    """
+
+    def decorator(factory: ConverterFactory):
+        _converters.append((from_type, to_type, factory))
+        return factory
+
+    return decorator
+
+
+def find_converter(from_type: DatasetType, to_type: DatasetType) -> Optional[Converter]:
+    """
+    :param from_type: dataset type of source objects
+    :param to_type: dataset type of target objects
+    :return: function which converts objects of `from_type` to objects of `to_type` or `None` if no conversion
+        is needed or there is no registered converter for these types
+    """
+    if from_type is None or to_type is None or from_type == to_type:
+        return None
+    for source, target, factory in _converters:
+        if issubclass(from_type, source) and issubclass(to_type, target):
+            converter = factory(from_type, to_type)
+            if converter is not None:
+                return converter
+    return None
+
+
+def check_step_inputs(index: int, inputs: List[int]):
+    """
+    Checks that pipeline step with given index takes outputs of previous steps only
+
+    :param index: index of step
+    :param inputs: indices of steps which outputs are passed to the step
+    :raises ValueError: if inputs are invalid
+    """
+    if not inputs:
+        raise ValueError(f'step {index} should have at least one input')
+    for i in inputs:
+        if not PIPELINE_INPUT <= i < index:
+            raise ValueError(f'step {index} could take only pipeline input or outputs of previous steps, got {i}')
+
+
+class _PlanStep:
+    def __init__(self, wrapper, method_name: str, inputs: List[int], converter: Optional[Converter]):
+        self.wrapper = wrapper
+        self.method_name = method_name
+        self.inputs = inputs
+        self.converter = converter
+        self.lock: Optional[threading.Lock] = None
+
+    def gather(self, outputs: Dict[int, object]):
+        if len(self.inputs) == 1:
+            return outputs[self.inputs[0]]
+        return [outputs[i] for i in self.inputs]
+
+    def call(self, data):
+        if self.converter is not None:
+            data = self.converter(data)
+        if self.lock is None:
+            return self.wrapper.call_method(self.method_name, data)
+        with self.lock:
+            return self.wrapper.call_method(self.method_name, data)
+
+
+class PipelinePlan:
+    """
+    Execution plan of :class:`.Pipeline`: wrappers of steps and conversions of data between them are resolved once
+    and reused for all runs.
+
+    If output type of a step differs from input type of the next one and there is a converter registered
+    for these types (see :func:`register_converter`), output is converted once before the next step.
+
+    Steps of DAG pipelines are grouped into levels of steps which depend on previous levels only.
+    Steps of a level are executed concurrently in a pool of `EBONITE_PIPELINE_THREADS` threads,
+    calls of the same model which is not thread-safe are serialized.
+
+    :param pipeline: pipeline to plan execution of, its models should be loaded
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.input_data = pipeline.input_data
+        self.output_data = pipeline.output_data
+        self.steps: List[_PlanStep] = []
+        out_types = {PIPELINE_INPUT: pipeline.input_data}
+        for index, step in enumerate(pipeline.steps):
+            if step.model_name not in pipeline.models:
+                raise ValueError(f'model of step {index} {step} is not loaded, load pipeline first')
+            wrapper = pipeline.models[step.model_name].wrapper
+            if step.method_name not in wrapper.methods:
+                raise ValueError(f'step {index} {step} refers to unknown method {step.method_name} '
+                                 f'of model {step.model_name}, expected one of {list(wrapper.methods)}')
+            _, in_type, out_type = wrapper.methods[step.method_name]
+            inputs = step.inputs if step.inputs is not None else [index - 1]
+            check_step_inputs(index, inputs)
+            converter = find_converter(out_types[inputs[0]], in_type) if len(inputs) == 1 else None
+            if converter is not None:
+                logger.debug('Converting input of step %s from %s to %s', step, out_types[inputs[0]], in_type)
+            self.steps.append(_PlanStep(wrapper, step.method_name, inputs, converter))
+            out_types[index] = out_type
+
+        self.linear = all(s.inputs == [i - 1] for i, s in enumerate(self.steps))
+        self.levels = _levels(self.steps)
+        self.parallel = any(len(level) > 1 for level in self.levels)
+        if self.parallel:
+            wrappers = Counter(id(s.wrapper) for s in self.steps)
+            locks = {key: threading.Lock() for key, count in wrappers.items() if count > 1}
+            for s in self.steps:
+                if not s.wrapper.thread_safe:
+                    s.lock = locks.get(id(s.wrapper))
+
+    @property
+    def batchable(self) -> bool:
+        """
+        `True` if inputs of pipeline could be concatenated into one batch and its output could be split back
+        """
+        return issubclass(self.input_data, BatchableDatasetTypeMixin) and \
+            issubclass(self.output_data, BatchableDatasetTypeMixin)
+
+    def run(self, data):
+        """
+        Applies pipeline steps to data
+
+        :param data: data of pipeline input type
+        :return: data of pipeline output type
+        """
+        if not has_hooks():
+            return self._run_steps(data)
+        with hooked_call(self.pipeline, self.pipeline.name, data) as info:
+            info.output_data = self._run_steps(data)
+        return info.output_data
+
+    def _run_steps(self, data):
+        if self.linear:
+            for step in self.steps:
+                data = step.call(data)
+            return data
+
+        outputs = {PIPELINE_INPUT: data}
+        if not self.parallel or getattr(_local, 'in_pool', False):
+            # steps are not executed in pool from pool threads as pool could be exhausted by waiting callers
+            for index, step in enumerate(self.steps):
+                outputs[index] = step.call(step.gather(outputs))
+        else:
+            parent = current_call()
+            for level in self.levels:
+                futures = [(i, _get_pool().submit(self._call_in_pool, parent, self.steps[i],
+                                                  self.steps[i].gather(outputs)))
+                           for i in level[1:]]
+                try:
+                    first = self.steps[level[0]]
+                    outputs[level[0]] = first.call(first.gather(outputs))
+                finally:
+                    wait([f for _, f in futures])
+                for i, future in futures:
+                    outputs[i] = future.result()
+        return outputs[len(self.steps) - 1]
+
+    @staticmethod
+    def _call_in_pool(parent: Optional[CallInfo], step: _PlanStep, data):
+        _local.in_pool = True
+        with in_call(parent):
+            return step.call(data)
+
+    def run_batch(self, inputs: list) -> list:
+        """
+        Applies pipeline steps to each of given inputs.
+        If pipeline is :attr:`batchable` inputs are concatenated and passed through all steps in one pass,
+        otherwise they are processed one by one
+
+        :param inputs: list of data of pipeline input type
+        :return: list of outputs for each input
+        """
+        if len(inputs) <= 1 or not self.batchable:
+            return [self.run(data) for data in inputs]
+
+        sizes = [self.input_data.get_batch_size(data) for data in inputs]
+        output = self.run(self.input_data.concat(inputs))
+        if self.output_data.get_batch_size(output) != sum(sizes):
+            logger.debug('Batched pipeline run returned output of unexpected size, running inputs one by one')
+            return [self.run(data) for data in inputs]
+        return self.output_data.split(output, sizes)
+
+
+def _levels(steps: List[_PlanStep]) -> List[List[int]]:
+    depths = {PIPELINE_INPUT: 0}
+    levels = []
+    for index, step in enumerate(steps):
+        depth = depths[index] = max(depths[i] for i in step.inputs) + 1
+        if depth > len(levels):
+            levels.append([])
+        levels[depth - 1].append(index)
+    return levels
+
+
+_local = threading.local()
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool, _pool_pid
+    # threads of pool are not inherited by forked processes
+    if _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool_pid != os.getpid():
+                _pool = ThreadPoolExecutor(PipelineConfig.PIPELINE_THREADS, thread_name_prefix='ebonite-pipeline')
+                _pool_pid = os.getpid()
+    return _pool
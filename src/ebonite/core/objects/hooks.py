@@ -0,0 +1,158 @@
+import contextlib
+import sys
+import threading
+import time
+from typing import List, Optional
+
+
+class CallInfo:
+    """
+    Information about a single call of :meth:`.ModelWrapper.call_method` or :meth:`.Pipeline.run`
+    which is passed to :class:`CallHook` callbacks
+
+    :param obj: called wrapper or pipeline
+    :param name: name of called method for wrapper or name of pipeline
+    :param input_data: call argument
+    :param parent: info of enclosing call (e.g. pipeline run for calls of its steps) or `None`
+    :param frame: stack frame of called method
+    """
+
+    def __init__(self, obj, name: str, input_data, parent: Optional['CallInfo'], frame):
+        self.obj = obj
+        self.name = name
+        self.input_data = input_data
+        self.parent = parent
+        self.frame = frame
+        self.output_data = None
+        self.error: Optional[BaseException] = None
+        self.start: float = None
+        self.duration: float = None
+
+    @property
+    def input_size(self) -> Optional[int]:
+        """
+        Number of rows in call argument or `None` if it is not sized
+        """
+        return data_size(self.input_data)
+
+    @property
+    def output_size(self) -> Optional[int]:
+        """
+        Number of rows in call result or `None` if it is not sized or call failed
+        """
+        return data_size(self.output_data)
+
+
+class CallHook:
+    """
+    Base class for hooks of :meth:`.ModelWrapper.call_method` and :meth:`.Pipeline.run` calls.
+    Hooks are registered via :func:`add_hook` and are called in the thread which performs the call
+    """
+
+    def pre(self, info: CallInfo):
+        """
+        Called before the call
+
+        :param info: info of call, its output and timing are not known yet
+        """
+
+    def post(self, info: CallInfo):
+        """
+        Called after the call, including failed ones
+
+        :param info: info of call with filled output data (or error) and duration in seconds
+        """
+
+
+_hooks: List[CallHook] = []
+_local = threading.local()
+
+
+def add_hook(hook: CallHook):
+    """
+    Registers hook to be called on every wrapper method call and pipeline run
+
+    :param hook: hook to register
+    """
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: CallHook):
+    """
+    Unregisters previously registered hook
+
+    :param hook: hook to unregister
+    """
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def has_hooks() -> bool:
+    """
+    :return: `True` if any hook is registered. Callers skip hook machinery entirely otherwise
+    """
+    return bool(_hooks)
+
+
+def current_call() -> Optional[CallInfo]:
+    """
+    :return: info of call being performed in current thread or `None`
+    """
+    return getattr(_local, 'current', None)
+
+
+@contextlib.contextmanager
+def in_call(info: Optional[CallInfo]):
+    """
+    Context manager which makes calls inside it nested into given call. Used to run parts of a call in other threads
+
+    :param info: info of enclosing call
+    """
+    prev = current_call()
+    _local.current = info
+    try:
+        yield
+    finally:
+        _local.current = prev
+
+
+class hooked_call:
+    """
+    Context manager which calls registered hooks around the call performed inside it.
+    Result of the call should be put to `output_data` field of returned :class:`CallInfo`
+
+    :param obj: called wrapper or pipeline
+    :param name: name of called method for wrapper or name of pipeline
+    :param input_data: call argument
+    """
+
+    def __init__(self, obj, name: str, input_data):
+        self.info = CallInfo(obj, name, input_data, current_call(), sys._getframe(1))
+
+    def __enter__(self) -> CallInfo:
+        _local.current = self.info
+        for hook in list(_hooks):
+            hook.pre(self.info)
+        self.info.start = time.perf_counter()
+        return self.info
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.info.duration = time.perf_counter() - self.info.start
+        self.info.error = exc_val
+        _local.current = self.info.parent
+        for hook in list(_hooks):
+            hook.post(self.info)
+
+
+def data_size(data) -> Optional[int]:
+    """
+    :param data: object to get size of
+    :return: number of rows in given object or `None` if it is not sized
+    """
+    if data is None or isinstance(data, (str, bytes)):
+        return None
+    try:
+        return len(data)
+    except TypeError:
+        return None
@@ -1,11 +1,11 @@
 import contextlib
 import os
 import pickle
+import threading
 import typing
 from abc import abstractmethod
 from functools import wraps
 from importlib import import_module
-from io import BytesIO
 from pickle import _Unpickler
 from uuid import uuid4
 
@@ -14,10 +14,13 @@ from pyjackson.core import Unserializable
 from pyjackson.decorators import type_field
 from pyjackson.utils import get_class_fields
 
+from ebonite.config import Runtime
 from ebonite.core.analyzer.dataset import DatasetAnalyzer
-from ebonite.core.objects.artifacts import ArtifactCollection, Blob, Blobs, CompositeArtifactCollection, InMemoryBlob
+from ebonite.core.objects.artifacts import (ArtifactCollection, Blob, Blobs, CompositeArtifactCollection, InMemoryBlob,
+                                            SpooledBlobWriter)
 from ebonite.core.objects.base import EboniteParams
 from ebonite.core.objects.dataset_type import DatasetType
+from ebonite.core.objects.hooks import has_hooks, hooked_call
 from ebonite.core.objects.requirements import InstallableRequirement, Requirements
 from ebonite.utils.fs import switch_curdir
 from ebonite.utils.module import get_object_requirements
@@ -29,6 +32,8 @@ MethodReturn = DatasetType
 Method = typing.Tuple[str, MethodArg, MethodReturn]
 Methods = typing.Dict[str, Method]
 
+_curdir_lock = threading.RLock()
+
 
 @type_field('type')
 class ModelIO(EboniteParams):
@@ -66,6 +71,13 @@ class ModelWrapper(EboniteParams):
     type = None
     methods_json = 'methods.json'
     requirements_json = 'requirements.json'
+    #: if `True` methods are called with current directory switched to the one model was loaded from,
+    #: so model could access its files by relative paths. Current directory is process-wide,
+    #: thus wrappers which need it could not be called concurrently from several threads
+    needs_curdir = True
+    #: if `True` methods of model could be called concurrently from several threads,
+    #: otherwise runtime serializes calls of model methods
+    thread_safe = False
 
     def __init__(self, io: ModelIO):
         self.model = None
@@ -83,8 +95,18 @@ class ModelWrapper(EboniteParams):
             })
 
     def load(self, path):
-        self.curdir = os.path.abspath(path)
+        self.load_meta(path)
         self.model = self.io.load(path)
+
+    def load_meta(self, path):
+        """
+        Loads methods and requirements of model from given path without loading model object itself.
+        Wrapper is able to describe its methods afterwards, so model object could be loaded later on demand
+
+        :param path: path to load from
+        """
+        self.curdir = os.path.abspath(path)
+        self.needs_curdir = self.needs_curdir and Runtime.SWITCH_CURDIR
         self.methods = read(os.path.join(path, self.methods_json), typing.Optional[Methods])
         self.requirements = read(os.path.join(path, self.requirements_json), Requirements)
 
@@ -144,7 +166,7 @@ class ModelWrapper(EboniteParams):
         :param name: name of the method to determine input / output types
         :return: input / output type of method with given name
         """
-        self._check_method(name)
+        self._check_method_exposed(name)
         _, *signature = self.methods[name]
         return signature
 
@@ -158,20 +180,34 @@ class ModelWrapper(EboniteParams):
         """
         self._check_method(name)
         wrapped, *_ = self.methods[name]
-        output_data = self._call_method(wrapped, input_data)
-        return output_data
+        if not has_hooks():
+            return self._call_method(wrapped, input_data)
+        with hooked_call(self, name, input_data) as info:
+            info.output_data = self._call_method(wrapped, input_data)
+        return info.output_data
 
     def _check_method(self, name):
         if self.model is None:
             raise ValueError('Wrapper {} has no model yet'.format(self))
+        self._check_method_exposed(name)
+
+    def _check_method_exposed(self, name):
+        if self.methods is None:
+            raise ValueError('Wrapper {} has no model yet'.format(self))
         if name not in self.methods:
             raise ValueError(f"Wrapper '{self}' obj doesn't expose method '{name}'")
 
     def _call_method(self, wrapped, input_data):
-        with switch_curdir(self.curdir):
-            if hasattr(self, wrapped):
-                return getattr(self, wrapped)(input_data)
-            return getattr(self.model, wrapped)(input_data)
+        if self.needs_curdir and self.curdir != '.':
+            # calls which switch current directory are serialized, others run concurrently
+            with _curdir_lock, switch_curdir(self.curdir):
+                return self._call_wrapped(wrapped, input_data)
+        return self._call_wrapped(wrapped, input_data)
+
+    def _call_wrapped(self, wrapped, input_data):
+        if hasattr(self, wrapped):
+            return getattr(self, wrapped)(input_data)
+        return getattr(self.model, wrapped)(input_data)
 
     def _model_requirements(self) -> Requirements:
         """
@@ -301,6 +337,9 @@ class PickleModelIO(ModelIO):
     """
     model_filename = 'model.pkl'
     io_ext = '.io'
+    #: type -> factory of :class:`ModelIO` for objects of this type which should be dumped aside of pickle payload
+    #: (e.g. large arrays which could be memory-mapped on load). Factory returns `None` to pickle object as usual
+    out_of_band_ios = {}
 
     @contextlib.contextmanager
     def dump(self, model) -> ArtifactCollection:
@@ -309,21 +348,23 @@ class PickleModelIO(ModelIO):
 
         :return: context manager with :class:`~ebonite.core.objects.ArtifactCollection`
         """
-        model_blob, refs = self._serialize_model(model)
-        blobs = {self.model_filename: InMemoryBlob(model_blob)}
-        artifact_cms = []
-        uuids = []
+        with SpooledBlobWriter() as model_file:
+            refs = self._serialize_model(model, model_file)
+            blobs = {self.model_filename: model_file.blob()}
+            artifact_cms = []
+            uuids = []
 
-        for uuid, (io, obj) in refs.items():
-            blobs[uuid + self.io_ext] = InMemoryBlob(self._serialize_io(io))
-            artifact_cms.append(io.dump(obj))
-            uuids.append(uuid)
+            for uuid, (io, obj) in refs.items():
+                blobs[uuid + self.io_ext] = InMemoryBlob(self._serialize_io(io))
+                artifact_cms.append(io.dump(obj))
+                uuids.append(uuid)
 
-        from ebonite.core.objects.artifacts import _enter_all_cm, _ExitAllCm, _RelativePathWrapper
-        additional_artifacts = _enter_all_cm(artifact_cms)
-        with _ExitAllCm(artifact_cms):
-            additional_artifacts = [_RelativePathWrapper(art, uuid) for art, uuid in zip(additional_artifacts, uuids)]
-            yield CompositeArtifactCollection([Blobs(blobs)] + additional_artifacts)
+            from ebonite.core.objects.artifacts import _enter_all_cm, _ExitAllCm, _RelativePathWrapper
+            additional_artifacts = _enter_all_cm(artifact_cms)
+            with _ExitAllCm(artifact_cms):
+                additional_artifacts = [_RelativePathWrapper(art, uuid)
+                                        for art, uuid in zip(additional_artifacts, uuids)]
+                yield CompositeArtifactCollection([Blobs(blobs)] + additional_artifacts)
 
     def load(self, path):
         """
@@ -346,16 +387,16 @@ class PickleModelIO(ModelIO):
             return self._deserialize_model(f, refs)
 
     @staticmethod
-    def _serialize_model(model):
+    def _serialize_model(model, out_file):
         """
-        Helper method to pickle model and get payload and refs
+        Helper method to pickle model to file and get refs
 
-        :return: tuple of payload and refs
+        :param out_file: file-like object to write payload to
+        :return: refs
         """
-        f = BytesIO()
-        pklr = _ModelPickler(model, f, recurse=True)
+        pklr = _ModelPickler(model, out_file, recurse=True)
         pklr.dump(model)
-        return f.getvalue(), pklr.refs
+        return pklr.refs
 
     @staticmethod
     def _deserialize_model(in_file, refs):
@@ -406,6 +447,7 @@ class _ModelPickler(EbonitePickler):
         super().__init__(*args, **kwargs)
         self.model = model
         self.refs = {}
+        self._ref_ids = {}
 
         # we couldn't import hook and analyzer at top as it leads to circular import failure
         from ebonite.core.analyzer.model import CallableMethodModelHook, ModelAnalyzer
@@ -430,6 +472,11 @@ class _ModelPickler(EbonitePickler):
             # at starting point, follow usual path not to fall into infinite loop
             return super().save(obj, save_persistent_id)
 
+        obj_uuid = self._ref_ids.get(id(obj))
+        if obj_uuid is not None:
+            # object is referenced several times, keep it a single object after load
+            return super().save(_ExternalRef(obj_uuid), save_persistent_id)
+
         io = self._get_non_pickle_io(obj)
         if io is None:
             # no non-Pickle IO found, follow usual path
@@ -439,6 +486,7 @@ class _ModelPickler(EbonitePickler):
         # replace with `_ExternalRef` stub and memorize IO to serialize model aside later
         obj_uuid = str(uuid4())
         self.refs[obj_uuid] = (io, obj)
+        self._ref_ids[id(obj)] = obj_uuid
         return super().save(_ExternalRef(obj_uuid), save_persistent_id)
 
     def _get_non_pickle_io(self, obj):
@@ -449,6 +497,10 @@ class _ModelPickler(EbonitePickler):
         :return: non-Pickle :class:`ModelIO` instance or None
         """
 
+        for obj_type, io_factory in PickleModelIO.out_of_band_ios.items():
+            if isinstance(obj, obj_type):
+                return io_factory(obj)
+
         # avoid calling heavy analyzer machinery for "unknown" objects:
         # they are either non-models or callables
         if not isinstance(obj, self.known_types):
@@ -0,0 +1,120 @@
+import asyncio
+
+import aiohttp
+from pyjackson import deserialize, serialize
+
+from ebonite.runtime.client.base import BaseClient, _join_outputs, _split_input
+from ebonite.runtime.interface.base import ExecutionError, InterfaceDescriptor
+from ebonite.utils.log import logger
+
+RETRY_STATUSES = (502, 503, 504)
+
+
+class AsyncHTTPClient(BaseClient):
+    """
+    aiohttp-based asynchronous client of HTTP-based Ebonite runtime.
+
+    Client should be connected to server before method calls, method calls return coroutines:
+
+    .. code-block:: python
+
+        async with AsyncHTTPClient('localhost', 9000) as client:
+            result = await client.predict(data)
+
+    Connections are kept alive and reused, calls which fail to connect or get 502, 503 or 504 response
+    are retried with exponential backoff.
+
+    :param host: host of server to connect to, if no host given connects to host `localhost`
+    :param port: port of server to connect to, if no port given connects to port 9000
+    :param pool_size: max number of simultaneous connections
+    :param timeout: timeout in seconds for whole call, `None` to wait forever
+    :param retries: max number of retries of failed calls
+    :param backoff: delay in seconds before first retry, doubled for each next one
+    """
+
+    def __init__(self, host=None, port=None, pool_size: int = 100, timeout: float = 60, retries: int = 3,
+                 backoff: float = .1):
+        # interface is acquired asynchronously in `connect`
+        self.methods = {}
+        self.base_url = f'http://{host or "localhost"}:{port or 9000}'
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session: aiohttp.ClientSession = None
+
+    async def connect(self):
+        """
+        Opens connection pool and acquires interface definition from server
+        """
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.pool_size),
+                                             timeout=aiohttp.ClientTimeout(total=self.timeout))
+        self._set_interface(await self._interface_factory())
+
+    async def close(self):
+        """
+        Closes connection pool
+        """
+        await self.session.close()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _request(self, method: str, url: str, **kwargs):
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                async with self.session.request(method, url, **kwargs) as resp:
+                    if resp.status not in RETRY_STATUSES or last:
+                        return await self._process_response(resp)
+                    logger.debug('Got %s from %s, retrying...', resp.status, url)
+            except aiohttp.ClientConnectionError:
+                if last:
+                    raise
+                logger.debug('Failed to connect to %s, retrying...', url)
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+
+    async def _interface_factory(self) -> InterfaceDescriptor:
+        return InterfaceDescriptor.from_dict(await self._request('GET', f'{self.base_url}/interface.json'))
+
+    async def _call(self, method, args: dict):
+        data = {arg.name: serialize(args[arg.name], arg.type) for arg in method.args}
+        logger.debug('Calling server method "%s", args: %s ...', method.name, data)
+        out = await self._call_method(method.name, data)
+        logger.debug('Server call returned %s', out)
+        return deserialize(out, method.out_type)
+
+    async def _call_method(self, name, args):
+        return (await self._request('POST', f'{self.base_url}/{name}', json=args))['data']
+
+    async def map(self, method: str, data, chunk_size: int = 1000, workers: int = 4):
+        """
+        Asynchronous counterpart of :meth:`.BaseClient.map`
+
+        :param method: name of method to call
+        :param data: method argument to split or iterable of method arguments
+        :param chunk_size: number of rows in a chunk
+        :param workers: max number of concurrent calls
+        :return: method result for whole data or list of results
+        """
+        meth = self._single_arg_method(method)
+        chunks, batchable = _split_input(meth, data, chunk_size)
+        semaphore = asyncio.Semaphore(workers)
+
+        async def call(chunk):
+            async with semaphore:
+                return await self._call(meth, {meth.args[0].name: chunk})
+
+        results = await asyncio.gather(*[call(chunk) for chunk in chunks])
+        return _join_outputs(meth, list(results), batchable)
+
+    @staticmethod
+    async def _process_response(resp: aiohttp.ClientResponse):
+        if resp.status == 400:
+            raise ExecutionError((await resp.json())['error'])
+        resp.raise_for_status()
+        return await resp.json()
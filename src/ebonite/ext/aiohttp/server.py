@@ -1,57 +1,327 @@
+import asyncio
+import io
+import json
+import multiprocessing
+import os
+import signal
 import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict
 
 import yaml
 from aiohttp import web
 from aiohttp_swagger import setup_swagger
 
+from ebonite.config import Config, Core, Param
 from ebonite.runtime.interface import Interface
 from ebonite.runtime.interface.base import InterfaceDescriptor
 from ebonite.runtime.openapi.spec import create_spec
 from ebonite.runtime.server import BaseHTTPServer, HTTPServerConfig, MalformedHTTPRequestException
+from ebonite.runtime.server.base import NDJSON_CONTENT_TYPE, create_json_decoder
+from ebonite.runtime.server.metrics import METRICS_CONTENT_TYPE, RequestTracker, ServerMetrics
 from ebonite.utils.log import rlogger
 
+#: default number of requests in flight per worker of execution pool, other requests are rejected
+IN_FLIGHT_PER_WORKER = 4
 
-def create_executor_function(interface: Interface, method: str, spec: dict):
+
+class AIOHTTPConfig(Config):
+    EXECUTOR = Param('aiohttp_executor', default='thread',
+                     doc='pool to execute interface methods in: "thread" or "process" (for GIL-bound models)',
+                     parser=str)
+    WORKERS = Param('aiohttp_workers', default=str(os.cpu_count() or 1),
+                    doc='number of workers in execution pool, number of CPUs by default', parser=int)
+    MAX_IN_FLIGHT = Param('aiohttp_max_in_flight', default='-1',
+                          doc=f'max number of requests being processed at once, 0 means no limit, '
+                              f'{IN_FLIGHT_PER_WORKER} times number of workers by default',
+                          parser=int)
+
+    def max_in_flight(self) -> int:
+        """
+        :return: `MAX_IN_FLIGHT` or its default derived from number of workers if it is not set
+        """
+        max_in_flight = self.MAX_IN_FLIGHT
+        if max_in_flight < 0:
+            return IN_FLIGHT_PER_WORKER * self.WORKERS
+        return max_in_flight
+
+
+if Core.DEBUG:
+    AIOHTTPConfig.log_params()
+
+# interface to execute in forked workers of process pool and decoders of its methods,
+# set in parent process before workers are forked
+_worker_interface: Interface = None
+_worker_decoders: Dict[str, Callable[[dict], dict]] = None
+
+
+def _execute_in_worker(method: str, request_data, ebonite_id: str, binary: bool, columnar: bool):
+    tracker = RequestTracker()
+    result = BaseHTTPServer._execute_method(_worker_interface, method, request_data, ebonite_id, binary, tracker,
+                                            columnar)
+    return result, tracker.phases
+
+
+def _execute_batch_in_worker(method: str, payloads: list, ebonite_id: str):
+    return BaseHTTPServer._execute_batch(_worker_interface, method, payloads, ebonite_id, _worker_decoders[method])
+
+
+class ExecutionPool:
+    """
+    Executes interface methods in a pool of threads or processes so event loop is never blocked by model calls,
+    and keeps track of requests in flight to reject new ones when server is saturated.
+
+    :param interface: :class:`.Interface` instance to execute methods of
+    :param executor: "thread" or "process"
+    :param workers: number of workers in pool
+    :param max_in_flight: max number of requests processed at once, 0 means no limit
+    """
+
+    def __init__(self, interface: Interface, executor: str, workers: int, max_in_flight: int):
+        global _worker_interface, _worker_decoders
+
+        self.interface = interface
+        self.decoders = {method: create_json_decoder(interface, method) for method in interface.exposed_methods()}
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.is_process = executor == 'process'
+        if self.is_process:
+            _worker_interface = interface
+            _worker_decoders = self.decoders
+            self.executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+        elif executor == 'thread':
+            self.executor = ThreadPoolExecutor(workers)
+        else:
+            raise ValueError(f'unknown executor type {executor}, expected "thread" or "process"')
+
+    def try_acquire(self) -> bool:
+        """
+        Registers new request in flight
+
+        :return: `False` if server is saturated and request should be rejected
+        """
+        if 0 < self.max_in_flight <= self.in_flight:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self):
+        """
+        Unregisters finished request
+        """
+        self.in_flight -= 1
+
+    async def execute(self, method: str, request_data, ebonite_id: str, binary: bool, tracker: RequestTracker = None,
+                      columnar: bool = False):
+        loop = asyncio.get_event_loop()
+        tracker = tracker or RequestTracker()
+        if not self.is_process:
+            func = partial(BaseHTTPServer._execute_method, self.interface, method, request_data, ebonite_id, binary,
+                           tracker, columnar)
+            return await loop.run_in_executor(self.executor, func)
+
+        # uploaded files could not be sent to worker process, so they are read into picklable file-like objects
+        request_data = {k: io.BytesIO(v.read()) if hasattr(v, 'read') else v for k, v in request_data.items()}
+        func = partial(_execute_in_worker, method, request_data, ebonite_id, binary, columnar)
+        result, phases = await loop.run_in_executor(self.executor, func)
+        tracker.phases.update(phases)
+        return result
+
+    async def execute_batch(self, method: str, payloads: list, ebonite_id: str):
+        if self.is_process:
+            func = partial(_execute_batch_in_worker, method, payloads, ebonite_id)
+        else:
+            func = partial(BaseHTTPServer._execute_batch, self.interface, method, payloads, ebonite_id,
+                           self.decoders[method])
+        return await asyncio.get_event_loop().run_in_executor(self.executor, func)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
+
+
+def _saturated_response():
+    return web.json_response({'ok': False, 'error': 'Server is saturated, try again later'}, status=503)
+
+
+def create_executor_function(pool: ExecutionPool, method: str, spec: dict, metrics: ServerMetrics = None):
     """
     Creates a view function for specific interface method
 
-    :param interface: :class:`.Interface` instance
+    :param pool: :class:`ExecutionPool` instance to execute method in
     :param method: method name
     :param spec: openapi spec for this instance
+    :param metrics: :class:`.ServerMetrics` to record request metrics to
     :return: callable view function
     """
+    interface = pool.interface
+    decode = pool.decoders[method]
+    metrics = metrics or ServerMetrics()
 
-    async def ef(request):
-        ebonite_id = str(uuid.uuid4())
-        rlogger.debug('Headers for [%s]: %s', request.headers)
-
+    async def execute(request, ebonite_id: str, tracker: RequestTracker):
         try:
             if request.content_type == 'application/json':
-                request_data = BaseHTTPServer._deserialize_json(interface, method, await request.json())
+                body = await request.text()
+                with tracker.phase('deserialize'):
+                    request_data = decode(json.loads(body))
+            elif BaseHTTPServer._binary_request_arg(interface, method, request.content_type) is not None:
+                body = await request.read()
+                with tracker.phase('deserialize'):
+                    request_data = BaseHTTPServer._deserialize_binary(interface, method, request.content_type, body)
             else:
                 request_data = {k: v.file for k, v in dict(await request.post()).items()}
 
-            result = BaseHTTPServer._execute_method(interface, method, request_data, ebonite_id)
+            response_type = BaseHTTPServer._binary_response_type(interface, method, request.headers.get('Accept'))
+            columnar = BaseHTTPServer._columnar_response(interface, method, request.query.get('orient'))
+            result = await pool.execute(method, request_data, ebonite_id, response_type is not None, tracker, columnar)
 
+            if response_type is not None:
+                return web.Response(body=result, content_type=response_type)
             if isinstance(result, bytes):
                 return web.Response(body=result, content_type='image/png')
-            return web.json_response(result)
+            with tracker.phase('serialize'):
+                return web.json_response(result)
         except MalformedHTTPRequestException as e:
+            tracker.error = True
             return web.json_response(e.response_body(), status=e.code())
 
+    async def ef(request):
+        ebonite_id = str(uuid.uuid4())
+        rlogger.debug('Headers for [%s]: %s', ebonite_id, request.headers)
+
+        if not pool.try_acquire():
+            return _saturated_response()
+
+        try:
+            with metrics.track(method) as tracker:
+                tracker.request_size = request.content_length
+                response = await execute(request, ebonite_id, tracker)
+                tracker.response_size = response.content_length
+                return response
+        finally:
+            pool.release()
+
     ef.__doc__ = f"\n---\n{yaml.dump(spec)}\n"
 
     return ef
 
 
-def create_interface_routes(app, interface: Interface):
+def create_batch_function(pool: ExecutionPool, method: str, metrics: ServerMetrics = None):
+    """
+    Creates a view function which executes specific interface method for a list of arguments
+
+    :param pool: :class:`ExecutionPool` instance to execute method in
+    :param method: method name
+    :param metrics: :class:`.ServerMetrics` to record request metrics to
+    :return: callable view function
+    """
+    metrics = metrics or ServerMetrics()
+
+    async def bf(request):
+        if not pool.try_acquire():
+            return _saturated_response()
+
+        try:
+            with metrics.track(method + '/batch') as tracker:
+                tracker.request_size = request.content_length
+                try:
+                    payloads = await request.json()
+                except ValueError:
+                    payloads = None
+                try:
+                    responses = await pool.execute_batch(method, payloads, str(uuid.uuid4()))
+                    return web.json_response({'ok': True, 'data': responses})
+                except MalformedHTTPRequestException as e:
+                    tracker.error = True
+                    return web.json_response(e.response_body(), status=e.code())
+        finally:
+            pool.release()
+
+    return bf
+
+
+def create_stream_function(pool: ExecutionPool, method: str, metrics: ServerMetrics = None):
+    """
+    Creates a view function which executes specific interface method for newline-delimited JSON stream
+    without reading whole request into memory
+
+    :param pool: :class:`ExecutionPool` instance to execute method in
+    :param method: method name
+    :param metrics: :class:`.ServerMetrics` to record request metrics to
+    :return: callable view function
+    """
+    metrics = metrics or ServerMetrics()
+
+    async def sf(request):
+        if not pool.try_acquire():
+            return _saturated_response()
+
+        try:
+            with metrics.track(method + '/stream') as tracker:
+                tracker.request_size = request.content_length
+                try:
+                    BaseHTTPServer._check_json_output(pool.interface, method)
+                except MalformedHTTPRequestException as e:
+                    tracker.error = True
+                    return web.json_response(e.response_body(), status=e.code())
+
+                ebonite_id = str(uuid.uuid4())
+                response = web.StreamResponse(headers={'Content-Type': NDJSON_CONTENT_TYPE})
+                await response.prepare(request)
+                tracker.response_size = 0
+
+                async def write(payloads):
+                    data = BaseHTTPServer._dump_ndjson(await pool.execute_batch(method, payloads, ebonite_id))
+                    tracker.response_size += len(data)
+                    await response.write(data)
+
+                chunk = []
+                async for line in _read_lines(request.content):
+                    payload = BaseHTTPServer._parse_ndjson_line(line)
+                    if payload is None:
+                        continue
+                    chunk.append(payload)
+                    if len(chunk) >= HTTPServerConfig.stream_chunk_size:
+                        await write(chunk)
+                        chunk = []
+                if chunk:
+                    await write(chunk)
+            # request is recorded before response is completed, so that it is visible to client afterwards
+            await response.write_eof()
+            return response
+        finally:
+            pool.release()
+
+    return sf
+
+
+async def _read_lines(content, chunk_size: int = 2 ** 16):
+    # unlike iteration over StreamReader, this does not limit length of lines
+    parts = []
+    async for data in content.iter_chunked(chunk_size):
+        lines = data.split(b'\n')
+        if len(lines) > 1:
+            yield b''.join(parts + [lines[0]])
+            for line in lines[1:-1]:
+                yield line
+            parts = []
+        parts.append(lines[-1])
+    if parts:
+        yield b''.join(parts)
+
+
+def create_interface_routes(app, pool: ExecutionPool, metrics: ServerMetrics = None):
+    interface = pool.interface
+    metrics = metrics or ServerMetrics()
     for method in interface.exposed_methods():
         sig = interface.exposed_method_signature(method)
         rlogger.debug('registering %s with input type %s and output type %s', method, sig.args, sig.output)
 
         spec = create_spec(method, sig)
-        executor_function = create_executor_function(interface, method, spec)
+        executor_function = create_executor_function(pool, method, spec, metrics)
         app.router.add_post('/' + method, executor_function)
+        app.router.add_post(f'/{method}/batch', create_batch_function(pool, method, metrics))
+        app.router.add_post(f'/{method}/stream', create_stream_function(pool, method, metrics))
 
 
 def create_schema_route(app, interface: Interface):
@@ -60,6 +330,11 @@ def create_schema_route(app, interface: Interface):
     app.router.add_get('/interface.json', lambda request: web.json_response(schema))
 
 
+def create_metrics_route(app, interface: Interface, metrics: ServerMetrics):
+    app.router.add_get('/metrics', lambda request: web.Response(body=metrics.render(interface),
+                                                                headers={'Content-Type': METRICS_CONTENT_TYPE}))
+
+
 def create_misc_routes(app):
     async def redirect_to_swagger(request):
         raise web.HTTPFound('/apidocs')
@@ -69,18 +344,63 @@ def create_misc_routes(app):
 
 
 class AIOHTTPServer(BaseHTTPServer):
+    """
+    aiohttp-based :class:`.BaseHTTPServer` implementation.
+
+    Interface methods are executed in a pool of threads or processes (see :class:`AIOHTTPConfig`),
+    so slow model calls do not block event loop. Pool has `EBONITE_AIOHTTP_WORKERS` workers (number of CPUs by default).
+    If number of requests in flight exceeds `EBONITE_AIOHTTP_MAX_IN_FLIGHT` (4 times number of workers by default,
+    0 disables the limit) new requests are rejected with HTTP 503 status.
+    In process pool uploaded files are passed to methods as in-memory file-like objects.
+    """
+
     def __init__(self):
         # we do not reference real aiohttp objects here and this breaks `get_object_requirements`
         import aiohttp_swagger
         self.__requires = aiohttp_swagger
         super().__init__()
 
-    def run(self, interface: Interface):
+    def _create_app(self, interface: Interface):
+        pool = ExecutionPool(interface, AIOHTTPConfig.EXECUTOR, AIOHTTPConfig.WORKERS,
+                             AIOHTTPConfig.max_in_flight())
+
+        async def shutdown_pool(app):
+            pool.shutdown()
+
         app = web.Application()
-        create_interface_routes(app, interface)
+        app.on_cleanup.append(shutdown_pool)
+        metrics = ServerMetrics()
+        create_interface_routes(app, pool, metrics)
         create_schema_route(app, interface)
+        create_metrics_route(app, interface, metrics)
         create_misc_routes(app)
         setup_swagger(app, swagger_url="/apidocs", ui_version=3)
+        return app
+
+    def run_worker(self, interface: Interface, sock, max_requests: int):
+        """
+        Serves aiohttp application from given socket in pre-fork worker process.
+        `SIGTERM` gracefully stops worker.
+
+        :param interface: runtime interface to expose via HTTP
+        :param sock: listening socket shared between workers
+        :param max_requests: number of requests to serve before returning, 0 means no limit
+        """
+        app = self._create_app(interface)
+        handled = []
+
+        async def count_request(request, response):
+            handled.append(True)
+            if len(handled) == max_requests:
+                # triggers graceful shutdown of aiohttp application
+                os.kill(os.getpid(), signal.SIGTERM)
+
+        if max_requests > 0:
+            app.on_response_prepare.append(count_request)
+        web.run_app(app, sock=sock)
+
+    def run(self, interface: Interface):
+        app = self._create_app(interface)
 
         rlogger.debug('Running aiohttp on %s:%s', HTTPServerConfig.host, HTTPServerConfig.port)
         web.run_app(app, host=HTTPServerConfig.host, port=HTTPServerConfig.port)
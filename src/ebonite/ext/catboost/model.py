@@ -61,6 +61,8 @@ class CatBoostModelWrapper(LibModelWrapperMixin):
     `.model` attribute is a `catboost.CatBoostClassifier` or `catboost.CatBoostRegressor` instance
     """
     libraries = [catboost]
+    needs_curdir = False
+    thread_safe = True
 
     def __init__(self):
         super().__init__(CatBoostModelIO())
@@ -1,7 +1,15 @@
+import time
+
 import requests
+from pyjackson import deserialize, serialize
+from requests.adapters import HTTPAdapter
 
+from ebonite.core.objects.dataset_type import binary_content_type
 from ebonite.runtime.client.base import BaseClient
 from ebonite.runtime.interface.base import ExecutionError, InterfaceDescriptor
+from ebonite.utils.log import logger
+
+RETRY_STATUSES = (502, 503, 504)
 
 
 class HTTPClient(BaseClient):
@@ -11,21 +19,86 @@ class HTTPClient(BaseClient):
     Interface definition is acquired via HTTP GET call to `/interface.json`,
     method calls are performed via HTTP POST calls to `/<name>`.
 
+    Connections are kept alive and reused by a pool shared between threads,
+    so client could be used to perform concurrent calls (see :meth:`.BaseClient.map`).
+    Calls which fail to connect or get 502, 503 or 504 response are retried with exponential backoff.
+
     :param host: host of server to connect to, if no host given connects to host `localhost`
     :param port: port of server to connect to, if no port given connects to port 9000
+    :param binary: if `True` binary wire format (e.g. `.npy`) is used for inputs and outputs which support it,
+        JSON is used for other ones
+    :param pool_size: max number of connections to keep alive
+    :param timeout: timeout in seconds for connecting to server and for waiting for its response, `None` to wait forever
+    :param retries: max number of retries of failed calls
+    :param backoff: delay in seconds before first retry, doubled for each next one
     """
 
-    def __init__(self, host=None, port=None):
+    def __init__(self, host=None, port=None, binary=False, pool_size: int = 10, timeout: float = 60,
+                 retries: int = 3, backoff: float = .1):
         self.base_url = f'http://{host or "localhost"}:{port or 9000}'
+        self.binary = binary
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         super().__init__()
 
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                resp = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except requests.ConnectionError:
+                if last:
+                    raise
+                logger.debug('Failed to connect to %s, retrying...', url)
+            else:
+                if resp.status_code not in RETRY_STATUSES or last:
+                    return resp
+                logger.debug('Got %s from %s, retrying...', resp.status_code, url)
+            time.sleep(self.backoff * 2 ** attempt)
+
     def _interface_factory(self) -> InterfaceDescriptor:
-        resp = requests.get(f'{self.base_url}/interface.json')
+        resp = self._request('GET', f'{self.base_url}/interface.json')
         resp.raise_for_status()
         return InterfaceDescriptor.from_dict(resp.json())
 
+    def _call(self, method, args: dict):
+        if not self.binary:
+            return super()._call(method, args)
+
+        headers = {}
+        out_content_type = binary_content_type(method.out_type)
+        if out_content_type is not None:
+            headers['Accept'] = out_content_type
+
+        if len(method.args) == 1 and binary_content_type(method.args[0].type) is not None:
+            arg = method.args[0]
+            headers['Content-Type'] = binary_content_type(arg.type)
+            ret = self._request('POST', f'{self.base_url}/{method.name}',
+                                data=arg.type.serialize_binary(args[arg.name]), headers=headers)
+        else:
+            data = {arg.name: serialize(args[arg.name], arg.type) for arg in method.args}
+            ret = self._request('POST', f'{self.base_url}/{method.name}', json=data, headers=headers)
+
+        if ret.status_code == 200 and out_content_type is not None and ret.headers.get('Content-Type') == out_content_type:
+            return method.out_type.deserialize_binary(ret.content)
+        return deserialize(self._process_response(ret), method.out_type)
+
     def _call_method(self, name, args):
-        ret = requests.post(f'{self.base_url}/{name}', json=args)
+        return self._process_response(self._request('POST', f'{self.base_url}/{name}', json=args))
+
+    def close(self):
+        """
+        Closes all connections kept alive
+        """
+        self.session.close()
+
+    @staticmethod
+    def _process_response(ret: requests.Response):
         if ret.status_code == 200:
             return ret.json()['data']
         elif ret.status_code == 400:
@@ -1,5 +1,8 @@
 import itertools
+import logging
+import signal
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 from ebonite.config import Config, Core, Param
@@ -7,55 +10,158 @@ from ebonite.runtime.interface import Interface
 from ebonite.runtime.interface.base import InterfaceDescriptor
 from ebonite.runtime.openapi.spec import create_spec
 from ebonite.runtime.server import BaseHTTPServer, HTTPServerConfig, MalformedHTTPRequestException
+from ebonite.runtime.server.base import NDJSON_CONTENT_TYPE, create_json_decoder
+from ebonite.runtime.server.metrics import METRICS_CONTENT_TYPE, RequestTracker, ServerMetrics
 from ebonite.utils.fs import current_module_path
 from ebonite.utils.log import rlogger
 
 current_app = None
 
 
-def create_executor_function(interface: Interface, method: str):
+def create_executor_function(interface: Interface, method: str, metrics: ServerMetrics = None):
     """
     Creates a view function for specific interface method
 
     :param interface: :class:`.Interface` instance
     :param method: method name
+    :param metrics: :class:`.ServerMetrics` to record request metrics to
     :return: callable view function
     """
-    from flask import g, jsonify, request, send_file
+    from flask import Response, g, jsonify, make_response, request, send_file
 
-    def ef():
-        try:
-            if request.content_type == 'application/json':
-                request_data = BaseHTTPServer._deserialize_json(interface, method, request.json)
-            else:
-                request_data = dict(itertools.chain(request.form.items(), request.files.items()))
-
-            result = BaseHTTPServer._execute_method(interface, method, request_data, g.ebonite_id)
+    decode = create_json_decoder(interface, method)
+    metrics = metrics or ServerMetrics()
 
+    def execute(tracker: RequestTracker):
+        try:
+            with tracker.phase('deserialize'):
+                if request.content_type == 'application/json':
+                    request_data = decode(request.json)
+                elif BaseHTTPServer._binary_request_arg(interface, method, request.mimetype) is not None:
+                    request_data = BaseHTTPServer._deserialize_binary(interface, method, request.mimetype,
+                                                                      request.get_data())
+                else:
+                    request_data = dict(itertools.chain(request.form.items(), request.files.items()))
+
+            response_type = BaseHTTPServer._binary_response_type(interface, method, request.headers.get('Accept'))
+            columnar = BaseHTTPServer._columnar_response(interface, method, request.args.get('orient'))
+            result = BaseHTTPServer._execute_method(interface, method, request_data, g.ebonite_id,
+                                                    response_type is not None, tracker, columnar)
+
+            if response_type is not None:
+                return Response(result, mimetype=response_type)
             if isinstance(result, bytes):
                 return send_file(BytesIO(result), mimetype='image/png')
-            return jsonify(result)
+            with tracker.phase('serialize'):
+                return jsonify(result)
         except MalformedHTTPRequestException as e:
+            tracker.error = True
             return jsonify(e.response_body()), e.code()
 
+    def ef():
+        with metrics.track(method) as tracker:
+            tracker.request_size = request.content_length
+            response = make_response(execute(tracker))
+            tracker.response_size = response.content_length
+            return response
+
     ef.__name__ = method
 
     return ef
 
 
-def _register_method(app, interface, method_name, signature):
+def create_batch_function(interface: Interface, method: str, metrics: ServerMetrics = None):
+    """
+    Creates a view function which executes specific interface method for a list of arguments
+
+    :param interface: :class:`.Interface` instance
+    :param method: method name
+    :param metrics: :class:`.ServerMetrics` to record request metrics to
+    :return: callable view function
+    """
+    from flask import g, jsonify, request
+
+    decode = create_json_decoder(interface, method)
+    metrics = metrics or ServerMetrics()
+
+    def bf():
+        with metrics.track(method + '/batch') as tracker:
+            tracker.request_size = request.content_length
+            try:
+                payloads = request.get_json(force=True, silent=True)
+                return jsonify({'ok': True,
+                                'data': BaseHTTPServer._execute_batch(interface, method, payloads, g.ebonite_id,
+                                                                      decode)})
+            except MalformedHTTPRequestException as e:
+                tracker.error = True
+                return jsonify(e.response_body()), e.code()
+
+    bf.__name__ = method + '_batch'
+
+    return bf
+
+
+def create_stream_function(interface: Interface, method: str, metrics: ServerMetrics = None):
+    """
+    Creates a view function which executes specific interface method for newline-delimited JSON stream
+    without reading whole request into memory
+
+    :param interface: :class:`.Interface` instance
+    :param method: method name
+    :param metrics: :class:`.ServerMetrics` to record request metrics to
+    :return: callable view function
+    """
+    from flask import Response, g, jsonify, request, stream_with_context
+
+    decode = create_json_decoder(interface, method)
+    metrics = metrics or ServerMetrics()
+
+    def stream():
+        with metrics.track(method + '/stream') as tracker:
+            tracker.request_size = request.content_length
+            tracker.response_size = 0
+            for chunk in BaseHTTPServer._execute_stream(interface, method, request.stream, g.ebonite_id, decode):
+                tracker.response_size += len(chunk)
+                yield chunk
+
+    def sf():
+        try:
+            BaseHTTPServer._check_json_output(interface, method)
+        except MalformedHTTPRequestException as e:
+            with metrics.track(method + '/stream') as tracker:
+                tracker.error = True
+            return jsonify(e.response_body()), e.code()
+        return Response(stream_with_context(stream()), mimetype=NDJSON_CONTENT_TYPE)
+
+    sf.__name__ = method + '_stream'
+
+    return sf
+
+
+def _register_method(app, interface, method_name, signature, metrics):
     from flasgger import swag_from
 
     swag = swag_from(create_spec(method_name, signature))
-    executor_function = swag(create_executor_function(interface, method_name))
+    executor_function = swag(create_executor_function(interface, method_name, metrics))
     app.add_url_rule('/' + method_name, method_name, executor_function, methods=['POST'])
+    app.add_url_rule(f'/{method_name}/batch', method_name + '_batch',
+                     create_batch_function(interface, method_name, metrics), methods=['POST'])
+    app.add_url_rule(f'/{method_name}/stream', method_name + '_stream',
+                     create_stream_function(interface, method_name, metrics), methods=['POST'])
 
 
-def create_interface_routes(app, interface: Interface):
+def create_interface_routes(app, interface: Interface, metrics: ServerMetrics = None):
+    metrics = metrics or ServerMetrics()
     for method in interface.exposed_methods():
         sig = interface.exposed_method_signature(method)
         rlogger.debug('registering %s with input type %s and output type %s', method, sig.args, sig.output)
-        _register_method(app, interface, method, sig)
+        _register_method(app, interface, method, sig, metrics)
+
+
+def create_metrics_route(app, interface: Interface, metrics: ServerMetrics):
+    from flask import Response
+
+    app.add_url_rule('/metrics', 'metrics', lambda: Response(metrics.render(interface), content_type=METRICS_CONTENT_TYPE))
 
 
 def create_schema_route(app, interface: Interface):
@@ -68,6 +174,10 @@ def create_schema_route(app, interface: Interface):
 
 class FlaskConfig(Config):
     run_flask = Param('run_flask', default='true', parser=bool)
+    threads = Param('flask_threads', default='8',
+                    doc='number of threads serving requests concurrently, 1 means requests are served one by one. '
+                        'Calls of models which are not thread-safe are serialized anyway',
+                    parser=int)
 
 
 if Core.DEBUG:
@@ -77,6 +187,55 @@ PREBUILD_PATH = current_module_path('prebuild')
 BASE_IMAGE_TEMPLATE = 'zyfraai/flask:{}'
 
 
+def create_wsgi_server(app, fd: int = None):
+    """
+    Creates werkzeug WSGI server for given app which serves requests in a pool of `EBONITE_FLASK_THREADS` threads
+
+    :param app: WSGI app to serve
+    :param fd: file descriptor of listening socket to serve from, if not given server binds to configured host and port
+    :return: `werkzeug.serving.BaseWSGIServer` instance
+    """
+    from werkzeug.serving import BaseWSGIServer
+
+    threads = FlaskConfig.threads
+    if threads <= 1:
+        return BaseWSGIServer(HTTPServerConfig.host, HTTPServerConfig.port, app, fd=fd)
+
+    class PooledWSGIServer(BaseWSGIServer):
+        multithread = True
+
+        executor = None
+
+        def __init__(self):
+            super().__init__(HTTPServerConfig.host, HTTPServerConfig.port, app, fd=fd)
+            self.executor = ThreadPoolExecutor(threads, thread_name_prefix='ebonite-flask')
+
+        def process_request(self, request, client_address):
+            self.executor.submit(self._process_request, request, client_address)
+
+        def _process_request(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+        def server_close(self):
+            # base constructor calls it as well when serving from given descriptor
+            if self.executor is not None:
+                self.executor.shutdown(wait=True)
+            super().server_close()
+
+        def get_request(self):
+            request, client_address = super().get_request()
+            # accepted socket inherits non-blocking mode of listening one in pre-fork workers
+            request.setblocking(True)
+            return request, client_address
+
+    return PooledWSGIServer()
+
+
 def prebuild_hook(python_version):
     from ebonite.ext.docker.prebuild import prebuild_image
     prebuild_image(PREBUILD_PATH, BASE_IMAGE_TEMPLATE, python_version)
@@ -121,13 +280,48 @@ class FlaskServer(BaseHTTPServer):
         def log_request_info():
             g.ebonite_id = str(uuid.uuid4())
             app.logger.debug('Headers: %s', request.headers)
-            app.logger.debug('Body: %s', request.get_data())
+            # reading body here would buffer streaming requests in memory
+            if app.logger.isEnabledFor(logging.DEBUG) and not request.path.endswith('/stream'):
+                app.logger.debug('Body: %s', request.get_data())
 
         return app
 
     def _prepare_app(self, app, interface):
-        create_interface_routes(app, interface)
+        metrics = ServerMetrics()
+        create_interface_routes(app, interface, metrics)
         create_schema_route(app, interface)
+        create_metrics_route(app, interface, metrics)
+
+    def run_worker(self, interface: Interface, sock, max_requests: int):
+        """
+        Serves flask application from given socket in pre-fork worker process.
+        `SIGTERM` stops worker after current request is handled.
+
+        :param interface: runtime interface to expose via HTTP
+        :param sock: listening socket shared between workers
+        :param max_requests: number of requests to serve before returning, 0 means no limit
+        """
+        app = self._create_app()
+        self._prepare_app(app, interface)
+        server = create_wsgi_server(app, sock.fileno())
+        server.timeout = 1
+        # several workers are woken up by a single connection, ones which lose the race should not block in `accept`
+        server.socket.setblocking(False)
+
+        stopping, handled = [], []
+        signal.signal(signal.SIGTERM, lambda signum, frame: stopping.append(signum))
+        # `handle_request` returns on timeout or lost `accept` race as well, so only accepted requests are counted
+        process_request = server.process_request
+
+        def counting_process_request(request, client_address):
+            handled.append(client_address)
+            process_request(request, client_address)
+
+        server.process_request = counting_process_request
+
+        while not stopping and (max_requests <= 0 or len(handled) < max_requests):
+            server.handle_request()
+        server.server_close()
 
     def run(self, interface: Interface):
         """
@@ -141,8 +335,9 @@ class FlaskServer(BaseHTTPServer):
 
         current_app = app
         if FlaskConfig.run_flask:
-            rlogger.debug('Running flask on %s:%s', HTTPServerConfig.host, HTTPServerConfig.port)
-            app.run(HTTPServerConfig.host, HTTPServerConfig.port)
+            rlogger.debug('Running flask on %s:%s with %s threads', HTTPServerConfig.host, HTTPServerConfig.port,
+                          FlaskConfig.threads)
+            create_wsgi_server(app).serve_forever()
         else:
             rlogger.debug('Skipping direct flask application run')
 
@@ -34,6 +34,8 @@ class LightGBMModelWrapper(LibModelWrapperMixin):
     :class:`.ModelWrapper` implementation for `lightgbm.Booster` type
     """
     libraries = [lgb]
+    needs_curdir = False
+    thread_safe = True
 
     def __init__(self):
         super().__init__(LightGBMModelIO())
@@ -1,3 +1,4 @@
 from .dataset import NumpyDTypeSerializer, NumpyNdarrayDatasetType, NumpyNdarrayHook
+from .io import NumpyArrayIO
 
-__all__ = ['NumpyNdarrayHook', 'NumpyDTypeSerializer', 'NumpyNdarrayDatasetType']
+__all__ = ['NumpyNdarrayHook', 'NumpyDTypeSerializer', 'NumpyNdarrayDatasetType', 'NumpyArrayIO']
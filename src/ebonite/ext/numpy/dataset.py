@@ -1,4 +1,5 @@
-from typing import Tuple, Type, Union
+from io import BytesIO
+from typing import Iterable, List, Optional, Tuple, Type, Union
 
 import numpy as np
 from pyjackson.core import ArgList, Field
@@ -7,7 +8,8 @@ from pyjackson.generics import Serializer
 
 from ebonite.core.analyzer.base import CanIsAMustHookMixin, TypeHookMixin
 from ebonite.core.analyzer.dataset import DatasetHook
-from ebonite.core.objects.dataset_type import DatasetType, LibDatasetTypeMixin
+from ebonite.core.objects.dataset_type import (BatchableDatasetTypeMixin, BinaryDatasetTypeMixin, DatasetType,
+                                               LibDatasetTypeMixin)
 from ebonite.core.objects.typing import ListTypeWithSpec, SizedTypedListType
 
 
@@ -32,6 +34,44 @@ def np_type_from_string(string_repr):
         raise ValueError('Unknown numpy type {}'.format(string_repr))
 
 
+NPY_CONTENT_TYPE = 'application/x-npy'
+
+
+def ndarray_to_npy(array: np.ndarray) -> bytes:
+    """
+    Dumps given array to bytes in `.npy` format
+
+    :param array: array to dump
+    :return: `.npy` payload
+    """
+    buffer = BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def ndarray_from_npy(payload: bytes) -> np.ndarray:
+    """
+    Loads array from bytes in `.npy` format without creating intermediate Python objects for its elements
+
+    :param payload: `.npy` payload
+    :return: loaded array
+    """
+    return np.load(BytesIO(payload), allow_pickle=False)
+
+
+def ndarray_buffers(array: np.ndarray) -> Optional[List]:
+    """
+    Returns dtype, shape and raw memory of given array without copying it unless it is not C-contiguous
+
+    :param array: array to get buffers of
+    :return: list of bytes-like objects or `None` for arrays of objects, which have no raw memory
+    """
+    if array.dtype.hasobject:
+        return None
+    return [str(array.dtype).encode('utf8'), str(array.shape).encode('utf8'),
+            np.ascontiguousarray(array).reshape(-1).view(np.uint8)]
+
+
 class NumpyNumberDatasetType(LibDatasetTypeMixin):
     """
     :class:`.DatasetType` implementation for `numpy.number` objects which
@@ -94,10 +134,11 @@ class NumpyDTypeSerializer(Serializer):
         return str(instance)
 
 
-class NumpyNdarrayDatasetType(ListTypeWithSpec, LibDatasetTypeMixin):
+class NumpyNdarrayDatasetType(ListTypeWithSpec, LibDatasetTypeMixin, BatchableDatasetTypeMixin, BinaryDatasetTypeMixin):
     """
     :class:`.DatasetType` implementation for `np.ndarray` objects
     which converts them to built-in Python lists and vice versa.
+    Binary wire format is `.npy`.
 
     :param shape: shape of `numpy.ndarray` objects in dataset
     :param dtype: data type of `numpy.ndarray` objects in dataset
@@ -105,6 +146,7 @@ class NumpyNdarrayDatasetType(ListTypeWithSpec, LibDatasetTypeMixin):
 
     real_type = np.ndarray
     libraries = [np]
+    content_type = NPY_CONTENT_TYPE
 
     def __init__(self, shape: Tuple[int, ...], dtype: str):
         # TODO assert shape and dtypes len
@@ -136,13 +178,49 @@ class NumpyNdarrayDatasetType(ListTypeWithSpec, LibDatasetTypeMixin):
         return ret
 
     def serialize(self, instance: np.ndarray):
+        self._check_instance(instance)
+        return instance.tolist()
+
+    def deserialize_binary(self, payload: bytes) -> np.ndarray:
+        try:
+            ret = ndarray_from_npy(payload)
+        except (ValueError, OSError):
+            raise DeserializationError('given payload could not be loaded as npy array')
+        try:
+            ret = ret.astype(np_type_from_string(self.dtype), copy=False)
+        except (ValueError, TypeError):
+            raise DeserializationError(f'given array of type: {ret.dtype} could not be converted to array '
+                                       f'of type: {np_type_from_string(self.dtype)}')
+        self._check_shape(ret, DeserializationError)
+        return ret
+
+    def serialize_binary(self, instance: np.ndarray) -> bytes:
+        self._check_instance(instance)
+        return ndarray_to_npy(instance)
+
+    def buffers(self, instance: np.ndarray) -> Iterable:
+        self._check_instance(instance)
+        return ndarray_buffers(instance) or [self.serialize_binary(instance)]
+
+    def _check_instance(self, instance):
         self._check_type(instance, np.ndarray, SerializationError)
         exp_type = np_type_from_string(self.dtype)
         if instance.dtype != exp_type:
             raise SerializationError(f'given array is of type: {instance.dtype}, expected: {exp_type}')
         self._check_shape(instance, SerializationError)
-        return instance.tolist()
 
     def _check_shape(self, array, exc_type):
         if tuple(array.shape)[1:] != self.shape[1:]:
             raise exc_type(f'given array is of shape: {(None,) + tuple(array.shape)[1:]}, expected: {self.shape}')
+
+    def get_batch_size(self, obj: np.ndarray) -> int:
+        return obj.shape[0]
+
+    def concat(self, objs: List[np.ndarray]) -> np.ndarray:
+        return np.concatenate(objs, axis=0)
+
+    def split(self, obj: np.ndarray, sizes: List[int]) -> List[np.ndarray]:
+        return np.split(obj, np.cumsum(sizes)[:-1], axis=0)
+
+    def empty(self) -> np.ndarray:
+        return np.empty((0,) + tuple(self.shape[1:]), dtype=np_type_from_string(self.dtype))
@@ -0,0 +1,60 @@
+import contextlib
+import os
+
+import numpy as np
+
+from ebonite.config import Config, Core, Param
+from ebonite.core.objects.artifacts import Blobs, SpooledBlobWriter
+from ebonite.core.objects.wrapper import FilesContextManager, ModelIO, PickleModelIO
+
+
+class NumpyIOConfig(Config):
+    OUT_OF_BAND_MIN_SIZE = Param('numpy_out_of_band_min_size', default='0',
+                                 doc='min size in bytes of numpy arrays which are dumped aside of pickled models '
+                                     'in .npy format, 0 (default) disables it',
+                                 parser=int)
+
+
+if Core.DEBUG:
+    NumpyIOConfig.log_params()
+
+
+class NumpyArrayIO(ModelIO):
+    """
+    :class:`.ModelIO` for numpy arrays referenced by pickled models.
+
+    Arrays are stored in `.npy` format. In runtime they are memory-mapped copy-on-write on load,
+    so their pages are read from disk on demand and shared between processes serving the same model.
+
+    It is disabled by default, as it changes layout of model artifacts which older Ebonite versions could not load.
+    To enable it set `EBONITE_NUMPY_OUT_OF_BAND_MIN_SIZE` to min size in bytes of arrays to store this way
+    (e.g. `1048576`) when models are pushed.
+    """
+    array_filename = 'array.npy'
+
+    @contextlib.contextmanager
+    def dump(self, model: np.ndarray) -> FilesContextManager:
+        with SpooledBlobWriter() as array_file:
+            np.save(array_file, model, allow_pickle=False)
+            yield Blobs({self.array_filename: array_file.blob()})
+
+    def load(self, path):
+        return np.load(os.path.join(path, self.array_filename), mmap_mode='c' if Core.RUNTIME else None,
+                       allow_pickle=False)
+
+    @staticmethod
+    def for_array(array: np.ndarray):
+        """
+        :param array: array referenced by pickled model
+        :return: :class:`NumpyArrayIO` instance if array is large enough to be dumped aside, `None` otherwise
+        """
+        # subclasses (e.g. `np.matrix`) would be loaded as plain arrays with different behavior
+        if type(array) is not np.ndarray:
+            return None
+        min_size = NumpyIOConfig.OUT_OF_BAND_MIN_SIZE
+        if min_size <= 0 or array.nbytes < min_size or array.dtype.hasobject:
+            return None
+        return NumpyArrayIO()
+
+
+PickleModelIO.out_of_band_ios[np.ndarray] = NumpyArrayIO.for_array
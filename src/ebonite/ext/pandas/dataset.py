@@ -1,5 +1,5 @@
 import re
-from typing import List, Union
+from typing import Dict, Iterable, List, Union
 
 import numpy as np
 import pandas as pd
@@ -12,8 +12,12 @@ from pyjackson.errors import DeserializationError, SerializationError
 
 from ebonite.core.analyzer.base import TypeHookMixin
 from ebonite.core.analyzer.dataset import DatasetHook
-from ebonite.core.objects.dataset_type import DatasetType, LibDatasetTypeMixin
-from ebonite.ext.numpy.dataset import np_type_from_string, python_type_from_np_type
+from ebonite.core.objects.dataset_type import (BatchableDatasetTypeMixin, BinaryDatasetTypeMixin,
+                                               ColumnarDatasetTypeMixin, DatasetType, LibDatasetTypeMixin)
+from ebonite.core.objects.execution import register_converter
+from ebonite.ext.numpy.dataset import (NumpyNdarrayDatasetType, ndarray_buffers, np_type_from_string,
+                                       python_type_from_np_type)
+from ebonite.utils.importing import module_importable
 
 _PD_EXT_TYPES = {
     DatetimeTZDtype: r'datetime64.*',
@@ -27,6 +31,8 @@ _PD_EXT_TYPES = {
 PD_EXT_TYPES = {dtype: re.compile(pattern) for dtype, pattern in
                 _PD_EXT_TYPES.items()}
 
+ARROW_CONTENT_TYPE = 'application/vnd.apache.arrow.stream'
+
 
 def string_repr_from_pd_type(dtype: Union[np.dtype, PandasExtensionDtype]) -> str:
     return dtype.name
@@ -110,29 +116,66 @@ class SeriesType(_PandasDatasetType):
         return [Field(c, python_type_from_pd_string_repr(d), False) for c, d in zip(self.columns, self.dtypes)]
 
 
-class DataFrameType(_PandasDatasetType):
+class DataFrameColumnsType(_PandasDatasetType):
+    """
+    :class:`.DatasetType` implementation for `pandas.DataFrame` objects which stores them as
+    built-in Python dicts of column name to values list mapping
+    """
+    real_type = pd.DataFrame
+
+    def deserialize(self, obj):
+        self._check_type(obj, dict, DeserializationError)
+        return pd.DataFrame(obj)
+
+    def serialize(self, instance: pd.DataFrame):
+        return {col: instance[col].tolist() for col in self.columns}
+
+    def get_spec(self):
+        return [Field(c, List[python_type_from_pd_string_repr(d)], False) for c, d in zip(self.columns, self.dtypes)]
+
+
+class DataFrameType(_PandasDatasetType, BatchableDatasetTypeMixin, BinaryDatasetTypeMixin, ColumnarDatasetTypeMixin):
     """
     :class:`.DatasetType` implementation for `pandas.DataFrame` objects which stores them as
     built-in Python dicts with the only key `values` and value in a form of records list.
 
+    Columnar form, i.e. dict with the only key `columns` and value in a form of column name to values list mapping,
+    is also accepted for deserialization and could be requested for serialization.
+    It is much faster for large dataframes.
+    If `pyarrow` is installed dataframes could also be (de)serialized in binary Arrow IPC stream format.
     """
     real_type = pd.DataFrame
+    content_type = ARROW_CONTENT_TYPE if module_importable('pyarrow') else None
 
     def deserialize(self, obj):
         self._check_type(obj, dict, DeserializationError)
         try:
-            ret = pd.DataFrame.from_records(obj['values'])
+            if 'columns' in obj:
+                ret = self.columns_type.deserialize(obj['columns'])
+            else:
+                ret = pd.DataFrame.from_records(obj['values'])
         except (ValueError, KeyError):
             raise DeserializationError(f'given object: {obj} could not be converted to dataframe')
-        self._validate_columns(ret, DeserializationError)
-        ret = ret[self.columns]
-        for col, expected, dtype in zip(self.columns, self.actual_dtypes, ret.dtypes):
+        return self._cast_dtypes(ret)
+
+    def deserialize_binary(self, payload: bytes) -> pd.DataFrame:
+        import pyarrow as pa
+        try:
+            ret = pa.ipc.open_stream(pa.py_buffer(payload)).read_all().to_pandas()
+        except pa.ArrowException:
+            raise DeserializationError('given payload could not be loaded as arrow table')
+        return self._cast_dtypes(ret)
+
+    def _cast_dtypes(self, df: pd.DataFrame):
+        self._validate_columns(df, DeserializationError)
+        df = df[self.columns]
+        for col, expected, dtype in zip(self.columns, self.actual_dtypes, df.dtypes):
             if expected != dtype:
-                ret[col] = ret[col].astype(expected)
-        self._validate_dtypes(ret, DeserializationError)
-        return ret
+                df[col] = df[col].astype(expected)
+        self._validate_dtypes(df, DeserializationError)
+        return df
 
-    def serialize(self, instance: pd.DataFrame):
+    def _prepare_serialize(self, instance: pd.DataFrame) -> pd.DataFrame:
         self._check_type(instance, pd.DataFrame, SerializationError)
         self._validate_columns(instance, SerializationError)
         self._validate_dtypes(instance, SerializationError)
@@ -144,11 +187,73 @@ class DataFrameType(_PandasDatasetType):
                     instance = instance.copy()
                     is_copied = True
                 instance[col] = instance[col].astype('string')
-        return {'values': (instance.to_dict('records'))}
+        return instance
+
+    def serialize(self, instance: pd.DataFrame):
+        return {'values': (self._prepare_serialize(instance).to_dict('records'))}
+
+    def serialize_columnar(self, instance: pd.DataFrame) -> Dict[str, list]:
+        return {'columns': self.columns_type.serialize(self._prepare_serialize(instance))}
+
+    def serialize_binary(self, instance: pd.DataFrame) -> bytes:
+        import pyarrow as pa
+        self._check_type(instance, pd.DataFrame, SerializationError)
+        self._validate_columns(instance, SerializationError)
+        self._validate_dtypes(instance, SerializationError)
+        table = pa.Table.from_pandas(instance[self.columns], preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def buffers(self, instance: pd.DataFrame) -> Iterable:
+        self._check_type(instance, pd.DataFrame, SerializationError)
+        self._validate_columns(instance, SerializationError)
+        result = []
+        for col in self.columns:
+            buffers = ndarray_buffers(instance[col].to_numpy())
+            if buffers is None:
+                return [self.serialize_binary(instance)]
+            result += [str(col).encode('utf8')] + buffers
+        return result
 
     def get_spec(self) -> ArgList:
-        return [Field('values', List[self.row_type], False)]
+        # either of fields is present: records in `values` (default) or columns in `columns`
+        return [Field('values', List[self.row_type], True), Field('columns', self.columns_type, True)]
+
+    def get_batch_size(self, obj: pd.DataFrame) -> int:
+        return len(obj)
+
+    def concat(self, objs: List[pd.DataFrame]) -> pd.DataFrame:
+        return pd.concat(objs, ignore_index=True)
+
+    def split(self, obj: pd.DataFrame, sizes: List[int]) -> List[pd.DataFrame]:
+        bounds = np.cumsum([0] + sizes)
+        return [obj.iloc[start:end].reset_index(drop=True) for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def empty(self) -> pd.DataFrame:
+        return pd.DataFrame({col: pd.Series([], dtype=dtype) for col, dtype in zip(self.columns, self.actual_dtypes)})
 
     @cached_property
     def row_type(self):
         return SeriesType(self.columns, self.dtypes)
+
+    @cached_property
+    def columns_type(self):
+        return DataFrameColumnsType(self.columns, self.dtypes)
+
+
+@register_converter(DataFrameType, NumpyNdarrayDatasetType)
+def _dataframe_to_ndarray(from_type: DataFrameType, to_type: NumpyNdarrayDatasetType):
+    if len(to_type.shape) != 2 or to_type.shape[1] != len(from_type.columns):
+        return None
+    columns, dtype = from_type.columns, np_type_from_string(to_type.dtype)
+    return lambda df: df[columns].to_numpy(dtype=dtype)
+
+
+@register_converter(NumpyNdarrayDatasetType, DataFrameType)
+def _ndarray_to_dataframe(from_type: NumpyNdarrayDatasetType, to_type: DataFrameType):
+    if len(from_type.shape) != 2 or from_type.shape[1] != len(to_type.columns):
+        return None
+    columns, dtypes = to_type.columns, dict(zip(to_type.columns, to_type.actual_dtypes))
+    return lambda array: pd.DataFrame(array, columns=columns).astype(dtypes, copy=False)
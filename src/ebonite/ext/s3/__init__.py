@@ -1,3 +1,3 @@
-from .artifact import S3ArtifactRepository
+from .artifact import S3ArtifactRepository, S3DedupArtifactRepository
 
-__all__ = ['S3ArtifactRepository']
+__all__ = ['S3ArtifactRepository', 'S3DedupArtifactRepository']
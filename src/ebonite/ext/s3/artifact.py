@@ -1,7 +1,10 @@
 import contextlib
 import io
 import os
+import threading
+import time
 import typing
+from collections import OrderedDict, defaultdict
 
 import boto3
 from botocore.exceptions import ClientError
@@ -9,7 +12,10 @@ from pyjackson.decorators import cached_property
 
 from ebonite.config import Config, Core, Param
 from ebonite.core.objects.artifacts import ArtifactCollection, Blob, Blobs, StreamContextManager
+from ebonite.ext.s3.transfer import S3Transfer
 from ebonite.repository.artifact import ArtifactExistsError, ArtifactRepository, NoSuchArtifactError
+from ebonite.repository.artifact.base import ArtifactError
+from ebonite.repository.artifact.dedup import DedupArtifactRepository
 from ebonite.utils.log import logger
 
 
@@ -17,6 +23,16 @@ class S3Config(Config):
     namespace = 's3'
     ACCESS_KEY = Param('access_key')
     SECRET_KEY = Param('secret_key')
+    TRANSFER_WORKERS = Param('transfer_workers', default='8', parser=int,
+                             doc='max number of requests transferring files or parts of files to or from S3 at once')
+    CHUNK_SIZE = Param('chunk_size', default=str(8 * 2 ** 20), parser=int,
+                       doc='size in bytes of parts of multipart transfers')
+    MAX_IN_FLIGHT = Param('max_in_flight', default=str(256 * 2 ** 20), parser=int,
+                          doc='max number of bytes transferred to or from S3 at once')
+    LIST_CACHE_SIZE = Param('list_cache_size', default='128', parser=int,
+                            doc='max number of artifact listings cached by S3 artifact repository')
+    LIST_CACHE_TTL = Param('list_cache_ttl', default='60', parser=float,
+                           doc='time in seconds to cache artifact listings for, 0 to disable caching')
 
 
 if Core.DEBUG:
@@ -47,6 +63,21 @@ class _WithS3Client:
                               aws_secret_access_key=S3Config.SECRET_KEY,
                               region_name=self.region)
 
+    @cached_property
+    def _transfer(self) -> S3Transfer:
+        return S3Transfer(self._s3, S3Config.TRANSFER_WORKERS, S3Config.CHUNK_SIZE, S3Config.MAX_IN_FLIGHT)
+
+    def _ensure_bucket(self):
+        if not self._bucket_exists():
+            self._s3.create_bucket(Bucket=self.bucket_name)
+
+    def _bucket_exists(self):
+        try:
+            self._s3.head_bucket(Bucket=self.bucket_name)
+            return True
+        except ClientError:
+            return False
+
 
 class S3Blob(Blob, _WithS3Client):
     """
@@ -57,23 +88,41 @@ class S3Blob(Blob, _WithS3Client):
     :param: s3path: S3 path to the artifact represented by this object
     :param: bucket_name: name of S3 bucket to use for storage
     :param: endpoint: HTTP URL of S3 server to connect to
+    :param: size: size of the artifact in bytes if known
     """
     type = 's3'
 
-    def __init__(self, s3path: str, bucket_name: str, endpoint: str = None):
+    def __init__(self, s3path: str, bucket_name: str, endpoint: str = None, size: int = None):
         _WithS3Client.__init__(self, bucket_name, endpoint)
         self.s3path = s3path
+        self.size = size
 
     def materialize(self, path):
-        logger.debug('Downloading file from %s to %s', self.s3path, path)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        self._s3.download_file(self.bucket_name, self.s3path, path)
+        self._transfer.download(self.bucket_name, {path: (self.s3path, self.size)})
+
+    @classmethod
+    def materialize_many(cls, blobs: typing.Dict[str, 'S3Blob']):
+        """
+        Downloads blobs concurrently, see :class:`.S3Transfer`
+
+        :param blobs: dict of path to write file -> blob
+        """
+        by_location = defaultdict(dict)
+        for path, blob in blobs.items():
+            by_location[(blob.endpoint, blob.bucket_name)][path] = blob
+        for (_, bucket), location_blobs in by_location.items():
+            # client of any blob could be used as they share endpoint
+            transfer = next(iter(location_blobs.values()))._transfer
+            transfer.download(bucket, {path: (blob.s3path, blob.size) for path, blob in location_blobs.items()})
 
     @contextlib.contextmanager
     def bytestream(self) -> StreamContextManager:
         logger.debug('Streaming file from %s', self.s3path)
         yield self._s3.get_object(Bucket=self.bucket_name, Key=self.s3path)['Body']
 
+    def version(self) -> typing.Optional[str]:
+        return self._s3.head_object(Bucket=self.bucket_name, Key=self.s3path)['ETag']
+
 
 class S3ArtifactRepository(ArtifactRepository, _WithS3Client):
     """
@@ -87,63 +136,176 @@ class S3ArtifactRepository(ArtifactRepository, _WithS3Client):
 
     type = 's3'
 
-    def _ensure_bucket(self):
-        if not self._bucket_exists():
-            self._s3.create_bucket(Bucket=self.bucket_name)
+    #: max number of keys in a single delete request
+    DELETE_BATCH_SIZE = 1000
 
-    def _bucket_exists(self):
-        try:
-            self._s3.head_bucket(Bucket=self.bucket_name)
-            return True
-        except ClientError:
-            return False
+    @cached_property
+    def _listings(self) -> '_ListingCache':
+        return _ListingCache(S3Config.LIST_CACHE_SIZE, S3Config.LIST_CACHE_TTL)
 
     def _list_blobs(self, prefix):
-        bs = self._s3.list_objects(Bucket=self.bucket_name, Prefix=prefix)
-        if 'Contents' not in bs:
-            return {}
-        return {o['Key']: o for o in bs['Contents']}
+        paginator = self._s3.get_paginator('list_objects_v2')
+        return {o['Key']: o
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+                for o in page.get('Contents', [])}
+
+    def _list_artifact(self, model_id: str) -> typing.Dict[str, dict]:
+        objects = self._listings.get(model_id)
+        if objects is None:
+            if not self._bucket_exists():
+                return {}
+            # prefix also matches keys of artifacts with longer ids
+            objects = {key: o for key, o in self._list_blobs(model_id).items()
+                       if key == model_id or key.startswith(model_id + '/')}
+            if objects:
+                self._listings.put(model_id, objects)
+        return objects
 
     def _get_artifact(self, model_id: str) -> ArtifactCollection:
-        if not self._bucket_exists():
-            raise NoSuchArtifactError(model_id, self)
-
-        keys = list(self._list_blobs(model_id).keys())
+        objects = self._list_artifact(model_id)
+        keys = list(objects.keys())
         if len(keys) == 0:
             raise NoSuchArtifactError(model_id, self)
-        elif len(keys) == 1 and keys[0] == '.':
+        elif keys == [model_id]:
             return Blobs({})
         else:
             return Blobs({
-                os.path.relpath(key, model_id): S3Blob(key, self.bucket_name, self.endpoint)
-                for key in keys
+                os.path.relpath(key, model_id): S3Blob(key, self.bucket_name, self.endpoint, obj['Size'])
+                for key, obj in objects.items()
             })
 
     def _push_artifact(self, model_id: str, blobs: typing.Dict[str, Blob]) -> ArtifactCollection:
         self._ensure_bucket()
 
-        if len(self._list_blobs(model_id)) > 0:
+        if len(self._list_artifact(model_id)) > 0:
             raise ArtifactExistsError(model_id, self)
 
         if len(blobs) == 0:
             self._s3.upload_fileobj(io.BytesIO(b''), self.bucket_name, model_id)
+            self._listings.put(model_id, {model_id: {'Key': model_id, 'Size': 0}})
             return Blobs({})
 
-        result = {}
-        for filepath, blob in blobs.items():
-            join = os.path.join(model_id, filepath)
-            with blob.bytestream() as b:
-                logger.debug('Uploading %s to s3 %s/%s', blob, self.endpoint, self.bucket_name)
-                self._s3.upload_fileobj(b, self.bucket_name, join)
-            result[filepath] = S3Blob(join, self.bucket_name, self.endpoint)
-        return Blobs(result)
+        keys = {filepath: os.path.join(model_id, filepath) for filepath in blobs}
+        logger.debug('Uploading %s to s3 %s/%s', model_id, self.endpoint, self.bucket_name)
+        try:
+            sizes = self._transfer.upload(self.bucket_name,
+                                          {keys[filepath]: blob for filepath, blob in blobs.items()})
+        finally:
+            # some of blobs could be uploaded before failure
+            self._listings.invalidate(model_id)
+        self._listings.put(model_id, {key: {'Key': key, 'Size': size} for key, size in sizes.items()})
+        return Blobs({filepath: S3Blob(key, self.bucket_name, self.endpoint, sizes[key])
+                      for filepath, key in keys.items()})
 
     def _delete_artifact(self, model_id: str):
-        if not self._bucket_exists():
-            raise NoSuchArtifactError(model_id, self)
-        keys = list(self._list_blobs(model_id).keys())
+        keys = list(self._list_artifact(model_id).keys())
         if len(keys) == 0:
             raise NoSuchArtifactError(model_id, self)
-        else:
-            logger.debug('Deleting %s from %s/%s', model_id, self.endpoint, self.bucket_name)
-            self._s3.delete_objects(Bucket=self.bucket_name, Delete={'Objects': [{'Key': k} for k in keys]})
+        logger.debug('Deleting %s from %s/%s', model_id, self.endpoint, self.bucket_name)
+        errors = []
+        try:
+            for i in range(0, len(keys), self.DELETE_BATCH_SIZE):
+                batch = keys[i:i + self.DELETE_BATCH_SIZE]
+                response = self._s3.delete_objects(Bucket=self.bucket_name,
+                                                   Delete={'Objects': [{'Key': k} for k in batch], 'Quiet': True})
+                # quiet response lists only keys which were not deleted
+                errors += response.get('Errors', [])
+        finally:
+            self._listings.invalidate(model_id)
+        if errors:
+            details = ', '.join(f'{e.get("Key")}: {e.get("Code")} {e.get("Message")}' for e in errors[:10])
+            raise ArtifactError(f'Failed to delete {len(errors)} of {len(keys)} files of artifact {model_id} '
+                                f'from {self.endpoint}/{self.bucket_name}: {details}')
+
+
+class S3DedupArtifactRepository(DedupArtifactRepository, _WithS3Client):
+    """
+    :class:`.DedupArtifactRepository` implementation which stores artifacts in Amazon S3-compatible file system
+
+    S3 credentials are to be specified through `S3_ACCESS_KEY` and `S3_SECRET_KEY` environment variables.
+
+    :param: bucket_name: name of S3 bucket to use for storage
+    :param: endpoint: HTTP URL of S3 server to connect to
+    """
+
+    type = 's3_dedup'
+
+    def _push_artifact(self, model_id: str, blobs: typing.Dict[str, Blob]) -> ArtifactCollection:
+        self._ensure_bucket()
+        return super(S3DedupArtifactRepository, self)._push_artifact(model_id, blobs)
+
+    def _write(self, key: str, blob: Blob):
+        self._write_many({key: blob})
+
+    def _write_many(self, blobs: typing.Dict[str, Blob]):
+        self._transfer.upload(self.bucket_name, blobs)
+
+    def _read(self, key: str) -> typing.Optional[bytes]:
+        try:
+            return self._s3.get_object(Bucket=self.bucket_name, Key=key)['Body'].read()
+        except ClientError as e:
+            if _is_missing(e):
+                return None
+            raise
+
+    def _exists(self, key: str) -> bool:
+        try:
+            self._s3.head_object(Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError as e:
+            if _is_missing(e):
+                return False
+            raise
+
+    def _has_keys(self, prefix: str) -> bool:
+        return self._s3.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix, MaxKeys=1).get('KeyCount', 0) > 0
+
+    def _remove(self, key: str):
+        self._s3.delete_object(Bucket=self.bucket_name, Key=key)
+
+    def _blob(self, key: str, size: int) -> Blob:
+        return S3Blob(key, self.bucket_name, self.endpoint, size)
+
+
+def _is_missing(error: ClientError) -> bool:
+    return error.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NoSuchBucket')
+
+
+class _ListingCache:
+    """
+    LRU cache of non-empty listings of artifacts. Artifacts could not be changed once pushed,
+    so listings could become stale only if artifacts are deleted by other processes. Thus listings expire after `ttl`
+
+    :param size: max number of cached listings
+    :param ttl: time in seconds after which listing expires, listings are not cached if it is not positive
+    """
+
+    def __init__(self, size: int, ttl: float):
+        self.size = size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._listings: typing.Dict[str, typing.Tuple[float, dict]] = OrderedDict()
+
+    def get(self, model_id: str) -> typing.Optional[dict]:
+        with self._lock:
+            cached = self._listings.get(model_id)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] >= self.ttl:
+                del self._listings[model_id]
+                return None
+            self._listings.move_to_end(model_id)
+            return cached[1]
+
+    def put(self, model_id: str, objects: dict):
+        if self.ttl <= 0 or self.size <= 0:
+            return
+        with self._lock:
+            self._listings[model_id] = (time.monotonic(), objects)
+            self._listings.move_to_end(model_id)
+            while len(self._listings) > self.size:
+                self._listings.popitem(last=False)
+
+    def invalidate(self, model_id: str):
+        with self._lock:
+            self._listings.pop(model_id, None)
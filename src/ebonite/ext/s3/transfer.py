@@ -0,0 +1,106 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from boto3.s3.transfer import TransferConfig
+
+from ebonite.core.objects.artifacts import Blob, InMemoryBlob, LocalFileBlob
+from ebonite.utils.log import logger
+
+
+class S3Transfer:
+    """
+    Transfers files to and from S3 concurrently.
+
+    Up to `workers` files are transferred at once, files larger than `chunk_size` are transferred in parts
+    by multipart transfers. Workers are split between files, so that each of `n` files transferred at once
+    transfers up to `workers // n` parts at once and total number of requests does not exceed `workers`.
+    Number of bytes being transferred at once is limited by `max_in_flight`: each file reserves its size
+    (or size of parts being transferred at once for large files) before transfer and waits if budget is exhausted.
+
+    :param client: boto3 S3 client, which is thread-safe
+    :param workers: max number of requests (files or parts of files) made at once
+    :param chunk_size: size in bytes of parts of multipart transfers
+    :param max_in_flight: max number of bytes transferred at once
+    """
+
+    def __init__(self, client, workers: int = 8, chunk_size: int = 8 * 2 ** 20, max_in_flight: int = 256 * 2 ** 20):
+        self.client = client
+        self.workers = max(workers, 1)
+        self.chunk_size = chunk_size
+        self.max_in_flight = max(max_in_flight, chunk_size)
+        self._in_flight = 0
+        self._budget = threading.Condition()
+
+    def upload(self, bucket: str, blobs: Dict[str, Blob]) -> Dict[str, int]:
+        """
+        Uploads payloads of blobs
+
+        :param bucket: bucket to upload to
+        :param blobs: dict of key -> blob to upload
+        :return: dict of key -> size of uploaded object
+        """
+        sizes = {}
+
+        def upload(key, blob, config):
+            # callback is called from threads of multipart upload, appending to list is thread-safe
+            transferred = []
+            with blob.bytestream() as stream:
+                logger.debug('Uploading %s to s3 %s/%s', blob, bucket, key)
+                self.client.upload_fileobj(stream, bucket, key, Config=config, Callback=transferred.append)
+            sizes[key] = sum(transferred)
+
+        self._run([(_blob_size(blob), lambda c, k=key, b=blob: upload(k, b, c)) for key, blob in blobs.items()])
+        return sizes
+
+    def download(self, bucket: str, files: Dict[str, Tuple[str, Optional[int]]]):
+        """
+        Downloads objects to local files
+
+        :param bucket: bucket to download from
+        :param files: dict of local path -> (key, size of object or `None` if it is unknown)
+        """
+
+        def download(path, key, config):
+            logger.debug('Downloading file from %s/%s to %s', bucket, key, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.client.download_file(bucket, key, path, Config=config)
+
+        self._run([(size, lambda c, p=path, k=key: download(p, k, c)) for path, (key, size) in files.items()])
+
+    def _run(self, tasks: List[Tuple[Optional[int], Callable[[TransferConfig], None]]]):
+        files = max(min(self.workers, len(tasks)), 1)
+        parts = self.workers // files
+        config = TransferConfig(multipart_threshold=self.chunk_size, multipart_chunksize=self.chunk_size,
+                                max_concurrency=parts, use_threads=parts > 1)
+        if files == 1:
+            for _, task in tasks:
+                task(config)
+            return
+        with ThreadPoolExecutor(files, thread_name_prefix='ebonite-s3') as pool:
+            futures = [pool.submit(self._reserved, size, config, task) for size, task in tasks]
+        for future in futures:
+            future.result()
+
+    def _reserved(self, size: Optional[int], config: TransferConfig, task: Callable[[TransferConfig], None]):
+        # files of unknown size could be large, so they reserve as much as the largest files do
+        max_file_bytes = self.chunk_size * config.max_concurrency
+        amount = min(max_file_bytes if size is None else size, max_file_bytes, self.max_in_flight)
+        with self._budget:
+            self._budget.wait_for(lambda: self._in_flight + amount <= self.max_in_flight)
+            self._in_flight += amount
+        try:
+            task(config)
+        finally:
+            with self._budget:
+                self._in_flight -= amount
+                self._budget.notify_all()
+
+
+def _blob_size(blob: Blob) -> Optional[int]:
+    if isinstance(blob, InMemoryBlob):
+        return len(blob.payload)
+    if isinstance(blob, LocalFileBlob):
+        return os.path.getsize(blob.path)
+    return None
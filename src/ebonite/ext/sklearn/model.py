@@ -15,6 +15,8 @@ class SklearnModelWrapper(ModelWrapper):
     """
     `pickle`-based :class:`.ModelWrapper` implementation for `scikit-learn` models
     """
+    needs_curdir = False
+
     def __init__(self):
         super().__init__(PickleModelIO())
 
@@ -4,7 +4,7 @@ from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
 from pyjackson import dumps, loads
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import defer, relationship, selectinload
 
 from ebonite.core.objects import DatasetType
 from ebonite.core.objects.artifacts import ArtifactCollection
@@ -59,9 +59,22 @@ class Attaching:
         pass  # pragma: no cover
 
     @abstractmethod
-    def to_obj(self) -> T:
+    def to_obj(self, shallow: bool = False) -> T:
+        """
+        :param shallow: if `True`, nested objects and heavy fields (e.g. model wrapper and artifacts) are not loaded.
+            Shallow objects are intended for listings and should not be saved back
+        :return: ebonite object for this SQL object
+        """
         pass  # pragma: no cover
 
+    @classmethod
+    def load_options(cls, shallow: bool = False) -> list:
+        """
+        :param shallow: if `True`, options to load shallow objects are returned
+        :return: query options to load everything :meth:`to_obj` needs in a fixed number of queries
+        """
+        return []
+
 
 Base = declarative_base()
 
@@ -75,12 +88,19 @@ class SProject(Base, Attaching):
 
     tasks: Iterable['STask'] = relationship("STask", back_populates="project")
 
-    def to_obj(self) -> Project:
+    def to_obj(self, shallow: bool = False) -> Project:
         p = Project(self.name, id=self.id, author=self.author, creation_date=self.creation_date)
-        for task in self.tasks:
-            p._tasks.add(task.to_obj())
+        if not shallow:
+            for task in self.tasks:
+                p._tasks.add(task.to_obj())
         return self.attach(p)
 
+    @classmethod
+    def load_options(cls, shallow: bool = False) -> list:
+        if shallow:
+            return []
+        return [selectinload(cls.tasks).options(*STask.load_options())]
+
     @classmethod
     def get_kwargs(cls, project: Project) -> dict:
         return dict(id=project.id,
@@ -106,12 +126,15 @@ class STask(Base, Attaching):
 
     __table_args__ = (UniqueConstraint('name', 'project_id', name='tasks_name_and_ref'),)
 
-    def to_obj(self) -> Task:
+    def to_obj(self, shallow: bool = False) -> Task:
         task = Task(id=self.id,
                     name=self.name,
                     author=self.author,
                     creation_date=self.creation_date,
                     project_id=self.project_id)
+        if shallow:
+            return self.attach(task)
+
         for model in self.models:
             task._models.add(model.to_obj())
 
@@ -122,6 +145,12 @@ class STask(Base, Attaching):
             task._images.add(image.to_obj())
         return self.attach(task)
 
+    @classmethod
+    def load_options(cls, shallow: bool = False) -> list:
+        if shallow:
+            return []
+        return [selectinload(cls.models), selectinload(cls.pipelines), selectinload(cls.images)]
+
     @classmethod
     def get_kwargs(cls, task: Task) -> dict:
         return dict(id=task.id,
@@ -153,19 +182,28 @@ class SModel(Base, Attaching):
 
     __table_args__ = (UniqueConstraint('name', 'task_id', name='models_name_and_ref'),)
 
-    def to_obj(self) -> Model:
+    def to_obj(self, shallow: bool = False) -> Model:
         model = Model(name=self.name,
-                      wrapper_meta=safe_loads(self.wrapper, dict),
+                      wrapper_meta=safe_loads(self.wrapper, dict) if not shallow else None,
                       author=self.author,
                       creation_date=self.creation_date,
-                      artifact=safe_loads(self.artifact, ArtifactCollection),
+                      artifact=safe_loads(self.artifact, ArtifactCollection) if not shallow else None,
                       requirements=safe_loads(self.requirements, Requirements),
                       description=self.description,
                       params=safe_loads(self.params, Dict[str, Any]),
                       id=self.id,
                       task_id=self.task_id)
+        if shallow:
+            # wrapper meta and artifact are missing, so repository refuses to save such model
+            model._shallow = True
         return self.attach(model)
 
+    @classmethod
+    def load_options(cls, shallow: bool = False) -> list:
+        if shallow:
+            return [defer(cls.wrapper), defer(cls.artifact)]
+        return []
+
     @classmethod
     def get_kwargs(cls, model: Model) -> dict:
         return dict(id=model.id,
@@ -198,7 +236,7 @@ class SPipeline(Base, Attaching):
 
     __table_args__ = (UniqueConstraint('name', 'task_id', name='pipelines_name_and_ref'),)
 
-    def to_obj(self) -> Pipeline:
+    def to_obj(self, shallow: bool = False) -> Pipeline:
         pipeline = Pipeline(name=self.name,
                             steps=safe_loads(self.steps, List[PipelineStep]),
                             input_data=safe_loads(self.input_data, DatasetType),
@@ -240,7 +278,7 @@ class SImage(Base, Attaching):
 
     __table_args__ = (UniqueConstraint('name', 'task_id', name='image_name_and_ref'),)
 
-    def to_obj(self) -> Image:
+    def to_obj(self, shallow: bool = False) -> Image:
         image = Image(name=self.name,
                       author=self.author,
                       creation_date=self.creation_date,
@@ -274,7 +312,7 @@ class SRuntimeEnvironment(Base, Attaching):
 
     params = Column(Text)
 
-    def to_obj(self) -> RuntimeEnvironment:
+    def to_obj(self, shallow: bool = False) -> RuntimeEnvironment:
         environment = RuntimeEnvironment(
             name=self.name,
             author=self.author,
@@ -308,7 +346,7 @@ class SRuntimeInstance(Base, Attaching):
 
     __table_args__ = (UniqueConstraint('name', 'image_id', 'environment_id', name='instance_name_and_ref'),)
 
-    def to_obj(self) -> RuntimeInstance:
+    def to_obj(self, shallow: bool = False) -> RuntimeInstance:
         instance = RuntimeInstance(
             name=self.name,
             author=self.author,
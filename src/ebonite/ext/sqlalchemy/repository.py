@@ -10,7 +10,7 @@ from ebonite.core.errors import (EnvironmentWithInstancesError, ExistingEnvironm
                                  ExistingTaskError, ImageWithInstancesError, NonExistingEnvironmentError,
                                  NonExistingImageError, NonExistingInstanceError, NonExistingModelError,
                                  NonExistingPipelineError, NonExistingProjectError, NonExistingTaskError,
-                                 ProjectWithTasksError, TaskWithFKError)
+                                 ProjectWithTasksError, ShallowModelError, TaskWithFKError)
 from ebonite.core.objects.core import (EboniteObject, Image, Model, Pipeline, Project, RuntimeEnvironment,
                                        RuntimeInstance, Task)
 from ebonite.repository.metadata import MetadataRepository
@@ -70,43 +70,44 @@ class SQLAlchemyMetaRepository(MetadataRepository):
                 self._active_session.close()
                 self._active_session = None
 
-    def _get_objects(self, object_type: Type[Attaching], add_filter=None) -> List:
+    def _get_objects(self, object_type: Type[Attaching], add_filter=None, shallow=False) -> List:
         with self._session() as s:
             if add_filter is None:
                 logger.debug('Getting %ss', object_type.__name__)
             else:
                 logger.debug('Getting %ss with filter %s', object_type.__name__, add_filter)
-            q = s.query(object_type)
-            if add_filter:
+            q = s.query(object_type).options(*object_type.load_options(shallow))
+            if add_filter is not None:
                 q = q.filter(add_filter)
-            return [o.to_obj() for o in q.all()]
+            return [o.to_obj(shallow) for o in q.all()]
 
-    def _get_object_by_name(self, object_type: Type[Attaching], name, add_filter=None):
+    def _get_object_by_name(self, object_type: Type[Attaching], name, add_filter=None, shallow=False):
         with self._session() as s:
             if add_filter is None:
                 logger.debug('Getting %s with name %s', object_type.__name__, name)
             else:
                 logger.debug('Getting %s with name %s with filter %s', object_type.__name__, name, add_filter)
-            q = s.query(object_type).filter(object_type.name == name)
+            q = s.query(object_type).options(*object_type.load_options(shallow)).filter(object_type.name == name)
             if add_filter is not None:
                 q = q.filter(add_filter)
             obj = q.first()
             if obj is None:
                 return
-            return obj.to_obj()
+            return obj.to_obj(shallow)
 
-    def _get_sql_object_by_id(self, object_type: Type[Attaching], id: int):
+    def _get_sql_object_by_id(self, object_type: Type[Attaching], id: int, shallow=False):
         with self._session() as s:
             logger.debug('Getting %s[%s]', object_type.__name__, id)
-            obj = s.query(object_type).filter(object_type.id == id).first()
+            obj = s.query(object_type).options(*object_type.load_options(shallow)) \
+                .filter(object_type.id == id).first()
             if obj is None:
                 return
             return obj
 
-    def _get_object_by_id(self, object_type: Type[Attaching], id: int):
+    def _get_object_by_id(self, object_type: Type[Attaching], id: int, shallow=False):
         with self._session():
-            sql_obj = self._get_sql_object_by_id(object_type, id)
-            return sql_obj.to_obj() if sql_obj is not None else None
+            sql_obj = self._get_sql_object_by_id(object_type, id, shallow)
+            return sql_obj.to_obj(shallow) if sql_obj is not None else None
 
     def _create_object(self, object_type: Type[Attaching], obj: T, error_type) -> T:
         with self._session() as s:
@@ -133,8 +134,12 @@ class SQLAlchemyMetaRepository(MetadataRepository):
                 raise ie_error_type(obj)
 
     @bind_to_self
-    def get_projects(self) -> List[Project]:
-        return self._get_objects(self.projects)
+    def get_projects(self, shallow: bool = False) -> List[Project]:
+        """
+        :param shallow: if `True`, projects are returned without their tasks
+        :return: all projects in the repository
+        """
+        return self._get_objects(self.projects, shallow=shallow)
 
     @bind_to_self
     def get_project_by_name(self, name: str) -> Optional[Project]:
@@ -170,9 +175,14 @@ class SQLAlchemyMetaRepository(MetadataRepository):
         project.unbind_meta_repo()
 
     @bind_to_self
-    def get_tasks(self, project: ProjectVar) -> List[Task]:
+    def get_tasks(self, project: ProjectVar, shallow: bool = False) -> List[Task]:
+        """
+        :param project: project to get tasks from
+        :param shallow: if `True`, tasks are returned without their models, pipelines and images
+        :return: all tasks in the project
+        """
         project = self._resolve_project(project)
-        return self._get_objects(self.tasks, self.tasks.project_id == project.id)
+        return self._get_objects(self.tasks, self.tasks.project_id == project.id, shallow)
 
     @bind_to_self
     def get_task_by_name(self, project: ProjectVar, task_name: str) -> Optional[Task]:
@@ -224,9 +234,17 @@ class SQLAlchemyMetaRepository(MetadataRepository):
         task.unbind_meta_repo()
 
     @bind_to_self
-    def get_models(self, task: TaskVar, project: ProjectVar = None) -> List[Model]:
+    def get_models(self, task: TaskVar, project: ProjectVar = None, shallow: bool = False) -> List[Model]:
+        """
+        :param task: task to get models from
+        :param project: project to search for task in
+        :param shallow: if `True`, models are returned without wrapper meta and artifacts,
+            which are neither fetched from database nor deserialized. Saving such models back raises
+            :exc:`.errors.ShallowModelError`
+        :return: all models in the task
+        """
         task = self._resolve_task(task, project)
-        return self._get_objects(self.models, self.models.task_id == task.id)
+        return self._get_objects(self.models, self.models.task_id == task.id, shallow)
 
     @bind_to_self
     def get_model_by_name(self, model_name, task: TaskVar, project: ProjectVar = None) -> Optional[Model]:
@@ -245,6 +263,8 @@ class SQLAlchemyMetaRepository(MetadataRepository):
         return self._create_object(self.models, model, ExistingModelError)
 
     def update_model(self, model: Model) -> Model:
+        if getattr(model, '_shallow', False):
+            raise ShallowModelError(model)
         with self._session():
             m: SModel = self._get_sql_object_by_id(self.models, model.id)
             if m is None:
@@ -400,3 +420,24 @@ class SQLAlchemyMetaRepository(MetadataRepository):
     def delete_instance(self, instance: RuntimeInstance):
         self._delete_object(self.instances, instance, NonExistingInstanceError, AssertionError)
         instance.unbind_meta_repo()
+
+    # only ids of resolved objects are used, so their nested objects are not loaded
+
+    def _resolve_project(self, project: ProjectVar) -> Optional[Project]:
+        if isinstance(project, Project):
+            project = project.id if project.id is not None else project.name
+        if isinstance(project, int):
+            return self._get_object_by_id(self.projects, project, shallow=True)
+        return self._get_object_by_name(self.projects, project, shallow=True)
+
+    def _resolve_task(self, task: TaskVar, project: ProjectVar = None) -> Optional[Task]:
+        if isinstance(task, Task):
+            task = task.id if task.id is not None else task.name
+        if isinstance(task, int):
+            return self._get_object_by_id(self.tasks, task, shallow=True)
+        if project is None:
+            raise ValueError('Cannot resolve task without project')
+        p = self._resolve_project(project)
+        if p is None:
+            return None
+        return self._get_object_by_name(self.tasks, task, self.tasks.project_id == p.id, shallow=True)
@@ -168,6 +168,7 @@ class TFTensorModelWrapper(LibModelWrapperMixin):
     :class:`ebonite.core.objects.ModelWrapper` for tensorflow models. `.model` attribute is a list of output tensors
     """
     libraries = [tf]
+    needs_curdir = False
 
     def __init__(self):
         super().__init__(TFTensorModelIO())
@@ -44,6 +44,8 @@ class TFKerasModelWrapper(ModelWrapper):
     """
     :class:`.ModelWrapper` implementation for Tensorflow Keras models (:class:`tensorflow.keras.Model` objects)
     """
+    needs_curdir = False
+
     def __init__(self):
         super().__init__(TFKerasModelIO())
 
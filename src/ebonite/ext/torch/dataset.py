@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Iterable, Tuple
 
 import torch
 from pyjackson.core import ArgList, Field
@@ -6,8 +6,9 @@ from pyjackson.errors import DeserializationError, SerializationError
 
 from ebonite.core.analyzer.base import TypeHookMixin
 from ebonite.core.analyzer.dataset import DatasetHook
-from ebonite.core.objects.dataset_type import DatasetType, LibDatasetTypeMixin
+from ebonite.core.objects.dataset_type import BinaryDatasetTypeMixin, DatasetType, LibDatasetTypeMixin
 from ebonite.core.objects.typing import ListTypeWithSpec, SizedTypedListType
+from ebonite.ext.numpy.dataset import NPY_CONTENT_TYPE, ndarray_buffers, ndarray_from_npy, ndarray_to_npy
 
 
 class TorchTensorHook(TypeHookMixin, DatasetHook):
@@ -20,10 +21,11 @@ class TorchTensorHook(TypeHookMixin, DatasetHook):
         return TorchTensorDatasetType(tuple(obj.shape), str(obj.dtype)[len('torch.'):])
 
 
-class TorchTensorDatasetType(ListTypeWithSpec, LibDatasetTypeMixin):
+class TorchTensorDatasetType(ListTypeWithSpec, LibDatasetTypeMixin, BinaryDatasetTypeMixin):
     """
     :class:`.DatasetType` implementation for `torch.Tensor` objects
     which converts them to built-in Python lists and vice versa.
+    Binary wire format is `.npy`.
 
     :param shape: shape of `torch.Tensor` objects in dataset
     :param dtype: data type of `torch.Tensor` objects in dataset
@@ -31,6 +33,7 @@ class TorchTensorDatasetType(ListTypeWithSpec, LibDatasetTypeMixin):
 
     real_type = torch.Tensor
     libraries = [torch]
+    content_type = NPY_CONTENT_TYPE
 
     def __init__(self, shape: Tuple[int, ...], dtype: str):
         self.shape = (None, ) + shape[1:]
@@ -70,12 +73,32 @@ class TorchTensorDatasetType(ListTypeWithSpec, LibDatasetTypeMixin):
         return ret
 
     def serialize(self, instance: torch.Tensor):
+        self._check_instance(instance)
+        return instance.tolist()
+
+    def deserialize_binary(self, payload: bytes) -> torch.Tensor:
+        try:
+            ret = torch.from_numpy(ndarray_from_npy(payload)).to(getattr(torch, self.dtype))
+        except (ValueError, TypeError, OSError):
+            raise DeserializationError(f'given payload could not be loaded as tensor '
+                                       f'of type: {getattr(torch, self.dtype)}')
+        self._check_shape(ret, DeserializationError)
+        return ret
+
+    def serialize_binary(self, instance: torch.Tensor) -> bytes:
+        self._check_instance(instance)
+        return ndarray_to_npy(instance.detach().cpu().numpy())
+
+    def buffers(self, instance: torch.Tensor) -> Iterable:
+        self._check_instance(instance)
+        return ndarray_buffers(instance.detach().cpu().numpy())
+
+    def _check_instance(self, instance):
         self._check_type(instance, torch.Tensor, SerializationError)
         if instance.dtype is not getattr(torch, self.dtype):
             raise SerializationError(f'given tensor is of dtype: {instance.dtype}, '
                                      f'expected: {getattr(torch, self.dtype)}')
         self._check_shape(instance, SerializationError)
-        return instance.tolist()
 
     def _check_shape(self, tensor, exc_type):
         if tuple(tensor.shape)[1:] != self.shape[1:]:
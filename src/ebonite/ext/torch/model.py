@@ -1,14 +1,13 @@
 import contextlib
 import os
 import typing
-from io import BytesIO
 
 import torch
 from pyjackson.decorators import make_string
 
 from ebonite.core.analyzer import TypeHookMixin
 from ebonite.core.analyzer.model import BindingModelHook
-from ebonite.core.objects.artifacts import ArtifactCollection, Blobs, InMemoryBlob
+from ebonite.core.objects.artifacts import ArtifactCollection, Blobs, SpooledBlobWriter
 from ebonite.core.objects.wrapper import ModelIO, ModelWrapper
 
 
@@ -22,7 +21,7 @@ class TorchModelIO(ModelIO):
     @contextlib.contextmanager
     def dump(self, model) -> ArtifactCollection:
         """
-        Dumps `torch.nn.Module` instance to :class:`.InMemoryBlob` and creates :class:`.ArtifactCollection` from it
+        Dumps `torch.nn.Module` instance with :class:`.SpooledBlobWriter` and creates :class:`.ArtifactCollection` from it
 
         :return: context manager with :class:`~ebonite.core.objects.ArtifactCollection`
         """
@@ -30,9 +29,9 @@ class TorchModelIO(ModelIO):
         save = torch.jit.save if is_jit else torch.save
         model_name = self.model_jit_file_name if is_jit else self.model_file_name
 
-        buffer = BytesIO()
-        save(model, buffer)
-        yield Blobs({model_name: InMemoryBlob(buffer.getvalue())})
+        with SpooledBlobWriter() as model_file:
+            save(model, model_file)
+            yield Blobs({model_name: model_file.blob()})
 
     def load(self, path):
         """
@@ -54,6 +53,8 @@ class TorchModelWrapper(ModelWrapper):
     """
     :class:`ebonite.core.objects.ModelWrapper` for PyTorch models. `.model` attribute is a `torch.nn.Module` instance
     """
+    needs_curdir = False
+
     def __init__(self):
         super().__init__(TorchModelIO())
 
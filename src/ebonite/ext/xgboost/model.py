@@ -35,6 +35,8 @@ class XGBoostModelWrapper(LibModelWrapperMixin):
     :class:`~.ModelWrapper` implementation for XGBoost models
     """
     libraries = [xgboost]
+    needs_curdir = False
+    thread_safe = True
 
     def __init__(self):
         super().__init__(XGBoostModelIO())
@@ -84,6 +84,16 @@ class ArtifactRepository:
         """
         return self._get_artifact(self.get_model_id(model))
 
+    def read_artifact(self, artifact: ArtifactCollection) -> ArtifactCollection:
+        """
+        Prepares persisted artifacts of this repository for reading, e.g. to read them through a cache.
+        Result should not be persisted. By default artifacts are returned as is
+
+        :param artifact: artifacts returned by :meth:`push_artifact` earlier
+        :return: :class:`.ArtifactCollection` to read artifacts from
+        """
+        return artifact
+
     def delete_artifact(self, model: 'core.Model'):
         """
         Deletes artifacts for given model
@@ -0,0 +1,290 @@
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import typing
+from collections import defaultdict
+
+import pyjackson
+
+from ebonite.config import Config, Core, Param
+from ebonite.core.objects.artifacts import (ArtifactCollection, Blob, Blobs, InMemoryBlob, LocalFileBlob,
+                                            StreamContextManager)
+from ebonite.repository.artifact import ArtifactRepository
+from ebonite.utils.fs import get_lib_path
+from ebonite.utils.log import logger
+
+_CHUNK_SIZE = 2 ** 20
+
+
+class ArtifactCacheConfig(Config):
+    PATH = Param('artifact_cache_path', default=get_lib_path('artifact_cache'),
+                 doc='directory where remote artifact blobs are cached')
+    MAX_SIZE = Param('artifact_cache_max_size', default=str(10 * 2 ** 30), parser=int,
+                     doc='max total size in bytes of cached artifact blobs')
+    VERIFY = Param('artifact_cache_verify', default='false', parser=bool,
+                   doc='set to true to verify checksums of cached artifact blobs on each read')
+
+
+if Core.DEBUG:
+    ArtifactCacheConfig.log_params()
+
+
+class BlobCache:
+    """
+    Size-bounded LRU cache of blob payloads in a local directory, which could be shared by several processes.
+
+    Each entry is a payload file and a `.json` file with its sha256 checksum, size and version of the blob
+    (see :meth:`.Blob.version`). Entry is valid only if size and version match, checksum is verified on reads
+    if `verify` is set. Files are written to temporary files first and moved in place atomically,
+    least recently used entries are removed once total size of payloads exceeds `max_size`.
+
+    :param path: directory to store entries in
+    :param max_size: max total size of payloads in bytes
+    :param verify: whether to verify checksums of payloads on reads
+    """
+
+    def __init__(self, path: str, max_size: int, verify: bool = False):
+        self.path = os.path.abspath(path)
+        self.max_size = max_size
+        self.verify = verify
+
+    @staticmethod
+    def key(blob: Blob) -> str:
+        """
+        :return: cache key of blob, which is a hash of its serialized form
+        """
+        return hashlib.sha256(json.dumps(pyjackson.serialize(blob, Blob), sort_keys=True).encode('utf8')).hexdigest()
+
+    def get(self, blob: Blob) -> typing.Optional[str]:
+        """
+        :return: path to cached payload of blob or `None` if it is not cached or entry is not valid
+        """
+        key = self.key(blob)
+        path = os.path.join(self.path, key)
+        try:
+            with open(path + '.json', 'r') as f:
+                meta = json.load(f)
+            if os.path.getsize(path) != meta['size'] or blob.version() != meta['version']:
+                return None
+            if self.verify and _file_digest(path) != meta['sha256']:
+                logger.warning('Cached payload of %s is corrupted', blob)
+                return None
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return path
+
+    def put_many(self, blobs: typing.Dict[str, Blob]) -> typing.Dict[str, str]:
+        """
+        Downloads payloads of blobs to the cache. Blobs of the same type are materialized with
+        :meth:`.Blob.materialize_many`
+
+        :param blobs: dict of key -> blob
+        :return: dict of key -> path to cached payload
+        """
+        os.makedirs(self.path, exist_ok=True)
+        versions = {key: blob.version() for key, blob in blobs.items()}
+        tmp_paths = {key: self._tmp_path() for key in blobs}
+        try:
+            by_type = defaultdict(dict)
+            for key, blob in blobs.items():
+                by_type[type(blob)][tmp_paths[key]] = blob
+            for blob_type, type_blobs in by_type.items():
+                logger.debug('Caching %s payloads of %s blobs', len(type_blobs), blob_type.__name__)
+                blob_type.materialize_many(type_blobs)
+            for key, tmp_path in tmp_paths.items():
+                meta = {'sha256': _file_digest(tmp_path), 'size': os.path.getsize(tmp_path), 'version': versions[key]}
+                meta_path = self._tmp_path()
+                with open(meta_path, 'w') as f:
+                    json.dump(meta, f)
+                path = os.path.join(self.path, key)
+                os.replace(tmp_path, path)
+                os.replace(meta_path, path + '.json')
+        finally:
+            for tmp_path in tmp_paths.values():
+                _remove(tmp_path)
+        self.evict(keep=set(blobs))
+        return {key: os.path.join(self.path, key) for key in blobs}
+
+    def remove(self, key: str):
+        path = os.path.join(self.path, key)
+        _remove(path)
+        _remove(path + '.json')
+
+    def evict(self, keep: typing.Set[str] = frozenset()):
+        """
+        Removes least recently used entries until total size of payloads is not greater than `max_size`
+
+        :param keep: keys of entries which should not be removed
+        """
+        entries = []
+        try:
+            for entry in os.scandir(self.path):
+                if entry.name.endswith('.json') or entry.name.startswith('.'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # removed by other process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.name))
+        except FileNotFoundError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_size:
+                break
+            if key in keep:
+                continue
+            logger.debug('Evicting cached payload %s', key)
+            self.remove(key)
+            total -= size
+
+    def _tmp_path(self) -> str:
+        fd, path = tempfile.mkstemp(prefix='.tmp-', dir=self.path)
+        os.close(fd)
+        return path
+
+
+_caches: typing.Dict[tuple, BlobCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_blob_cache() -> BlobCache:
+    """
+    :return: :class:`BlobCache` configured with :class:`ArtifactCacheConfig`
+    """
+    params = (ArtifactCacheConfig.PATH, ArtifactCacheConfig.MAX_SIZE, ArtifactCacheConfig.VERIFY)
+    with _caches_lock:
+        if params not in _caches:
+            _caches[params] = BlobCache(*params)
+        return _caches[params]
+
+
+class CachedBlob(Blob):
+    """
+    :class:`.Blob` implementation which reads payload of other blob through local cache, see :class:`BlobCache`.
+    Cache is configured with `EBONITE_ARTIFACT_CACHE_PATH`, `EBONITE_ARTIFACT_CACHE_MAX_SIZE` and
+    `EBONITE_ARTIFACT_CACHE_VERIFY` environment variables
+
+    :param blob: blob to cache payload of
+    """
+    type = 'cached'
+
+    def __init__(self, blob: Blob):
+        self.blob = blob
+
+    def materialize(self, path):
+        self.materialize_many({path: self})
+
+    @classmethod
+    def materialize_many(cls, blobs: typing.Dict[str, 'CachedBlob']):
+        cache = get_blob_cache()
+        sources = {}
+        missing = {}
+        for path, blob in blobs.items():
+            sources[path] = cache.get(blob.blob)
+            if sources[path] is None:
+                missing[cache.key(blob.blob)] = blob.blob
+        if missing:
+            cached = cache.put_many(missing)
+            for path, blob in blobs.items():
+                if sources[path] is None:
+                    sources[path] = cached[cache.key(blob.blob)]
+        for path, blob in blobs.items():
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                shutil.copyfile(sources[path], path)
+            except FileNotFoundError:  # evicted by other process
+                logger.debug('Materializing %s without cache', blob.blob)
+                blob.blob.materialize(path)
+
+    @contextlib.contextmanager
+    def bytestream(self) -> StreamContextManager:
+        cache = get_blob_cache()
+        path = cache.get(self.blob)
+        if path is None:
+            key = cache.key(self.blob)
+            path = cache.put_many({key: self.blob})[key]
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:  # evicted by other process
+            with self.blob.bytestream() as stream:
+                yield stream
+            return
+        # open file stays readable even if entry is evicted by other process
+        with f:
+            yield f
+
+    def version(self) -> typing.Optional[str]:
+        return self.blob.version()
+
+
+class CachedArtifactRepository(ArtifactRepository):
+    """
+    :class:`.ArtifactRepository` implementation which wraps other repository and reads its artifacts
+    through local cache, see :func:`cached_artifact`.
+
+    Pushed artifacts are returned as is, so that models store blobs of wrapped repository in their metadata.
+    Artifacts are read through cache by :meth:`read_artifact` (e.g. on :meth:`.Model.load`) and :meth:`get_artifact`,
+    their results should not be persisted.
+
+    :param repository: repository to wrap
+    """
+    type = 'cached'
+
+    def __init__(self, repository: ArtifactRepository):
+        self.repository = repository
+
+    def read_artifact(self, artifact: ArtifactCollection) -> ArtifactCollection:
+        return cached_artifact(artifact)
+
+    def _push_artifact(self, model_id: str, blobs: typing.Dict[str, Blob]) -> ArtifactCollection:
+        return self.repository._push_artifact(model_id, blobs)
+
+    def _get_artifact(self, model_id: str) -> ArtifactCollection:
+        return cached_artifact(self.repository._get_artifact(model_id))
+
+    def _delete_artifact(self, model_id: str):
+        artifact = self.repository._get_artifact(model_id)
+        self.repository._delete_artifact(model_id)
+        if isinstance(artifact, Blobs):
+            cache = get_blob_cache()
+            for blob in artifact.blobs.values():
+                if _is_remote(blob):
+                    cache.remove(cache.key(blob))
+
+
+def _is_remote(blob: Blob) -> bool:
+    return not isinstance(blob, (InMemoryBlob, LocalFileBlob, CachedBlob))
+
+
+def cached_artifact(artifact: ArtifactCollection) -> ArtifactCollection:
+    """
+    Wraps remote blobs of given artifact with :class:`CachedBlob`, so that they are read through local cache.
+    Result is meant for reading only and should not be persisted, as its blobs are not stored anywhere
+
+    :param artifact: artifact to read through cache
+    :return: artifact with wrapped blobs, or given artifact if it is not :class:`.Blobs`
+    """
+    if not isinstance(artifact, Blobs):
+        return artifact
+    return Blobs({name: CachedBlob(blob) if _is_remote(blob) else blob for name, blob in artifact.blobs.items()})
+
+
+def _file_digest(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
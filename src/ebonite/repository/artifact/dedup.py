@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+import typing
+from abc import abstractmethod
+
+from ebonite.core.objects.artifacts import ArtifactCollection, Blob, Blobs, InMemoryBlob, LocalFileBlob
+from ebonite.repository.artifact import ArtifactExistsError, ArtifactRepository, NoSuchArtifactError
+from ebonite.utils.fs import get_lib_path
+from ebonite.utils.log import logger
+
+_CHUNK_SIZE = 2 ** 20
+
+
+class DedupArtifactRepository(ArtifactRepository):
+    """
+    Base class for content-addressed artifact repositories which store each distinct payload only once.
+
+    Payloads are stored under `blobs/<sha256[:2]>/<sha256>` keys and artifact of a model is a manifest `manifests/<model_id>.json`
+    which maps file names to hashes and sizes of payloads. Push uploads only payloads which are not stored yet.
+    Each model referencing a payload is recorded by empty `refs/<sha256>/<model_id>` key,
+    so that payload is removed with deletion of the last model referencing it.
+
+    Warning: payload shared by models could be lost if one of them is deleted concurrently with push of another
+    from a different process.
+
+    Implementations provide key-value storage for payloads by implementing `_write`, `_read`, `_exists`,
+    `_has_keys`, `_remove` and `_blob` methods
+    """
+
+    def _push_artifact(self, model_id: str, blobs: typing.Dict[str, Blob]) -> ArtifactCollection:
+        manifest_key = self._manifest_key(model_id)
+        if self._exists(manifest_key):
+            raise ArtifactExistsError(model_id, self)
+
+        files = {}
+        payloads = {}
+        for name, blob in blobs.items():
+            digest, size = _digest(blob)
+            files[name] = {'sha256': digest, 'size': size}
+            payloads.setdefault(digest, blob)
+
+        missing = {}
+        for digest, blob in payloads.items():
+            # reference is recorded before payload is checked, so that it is not removed by deletion of other model
+            self._write(self._ref_key(digest, model_id), InMemoryBlob(b''))
+            if not self._exists(self._payload_key(digest)):
+                missing[self._payload_key(digest)] = blob
+        logger.debug('Storing %s of %s payloads of artifact %s', len(missing), len(payloads), model_id)
+        self._write_many(missing)
+
+        # manifest is written last, so that artifact exists only if all its payloads are stored
+        self._write(manifest_key, InMemoryBlob(json.dumps({'files': files}).encode('utf8')))
+        return self._to_blobs(files)
+
+    def _get_artifact(self, model_id: str) -> ArtifactCollection:
+        return self._to_blobs(self._read_manifest(model_id))
+
+    def _delete_artifact(self, model_id: str):
+        files = self._read_manifest(model_id)
+        self._remove(self._manifest_key(model_id))
+        for digest in {f['sha256'] for f in files.values()}:
+            self._remove(self._ref_key(digest, model_id))
+            if not self._has_keys(self._ref_key(digest, '')):
+                logger.debug('Removing payload %s which is not referenced anymore', digest)
+                self._remove(self._payload_key(digest))
+
+    def _read_manifest(self, model_id: str) -> typing.Dict[str, dict]:
+        manifest = self._read(self._manifest_key(model_id))
+        if manifest is None:
+            raise NoSuchArtifactError(model_id, self)
+        return json.loads(manifest.decode('utf8'))['files']
+
+    def _to_blobs(self, files: typing.Dict[str, dict]) -> Blobs:
+        return Blobs({name: self._blob(self._payload_key(f['sha256']), f['size']) for name, f in files.items()})
+
+    @staticmethod
+    def _manifest_key(model_id: str) -> str:
+        return f'manifests/{model_id}.json'
+
+    @staticmethod
+    def _payload_key(digest: str) -> str:
+        return f'blobs/{digest[:2]}/{digest}'
+
+    @staticmethod
+    def _ref_key(digest: str, model_id: str) -> str:
+        return f'refs/{digest}/{model_id}'
+
+    def _write_many(self, blobs: typing.Dict[str, Blob]):
+        """
+        Writes payloads of blobs to keys. Implementations could override it to write them concurrently
+
+        :param blobs: dict of key -> blob
+        """
+        for key, blob in blobs.items():
+            self._write(key, blob)
+
+    @abstractmethod
+    def _write(self, key: str, blob: Blob):
+        """
+        Writes payload of blob to key
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def _read(self, key: str) -> typing.Optional[bytes]:
+        """
+        :return: payload stored under key or `None` if there is no such key
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def _exists(self, key: str) -> bool:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def _has_keys(self, prefix: str) -> bool:
+        """
+        :return: `True` if there are keys starting with prefix
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def _remove(self, key: str):
+        """
+        Removes key if it exists
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def _blob(self, key: str, size: int) -> Blob:
+        """
+        :return: :class:`.Blob` for payload stored under key
+        """
+        raise NotImplementedError  # pragma: no cover
+
+
+class LocalDedupArtifactRepository(DedupArtifactRepository):
+    """
+    :class:`.DedupArtifactRepository` implementation which stores artifacts in a local file system as directory
+
+    :param: path: path to directory where artifacts are to be stored,
+      if `None` "local_storage" directory in Ebonite distribution is used
+    """
+    type = 'local_dedup'
+
+    def __init__(self, path: str = None):
+        self.path = os.path.abspath(path or get_lib_path('local_storage'))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.path, *key.split('/'))
+
+    def _write(self, key: str, blob: Blob):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        blob.materialize(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _read(self, key: str) -> typing.Optional[bytes]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def _has_keys(self, prefix: str) -> bool:
+        path = self._path(prefix)
+        return os.path.isdir(path) and len(os.listdir(path)) > 0
+
+    def _remove(self, key: str):
+        path = self._path(key)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        # empty directories of references are removed too, as there is a directory per payload
+        directory = os.path.dirname(path)
+        if os.path.basename(os.path.dirname(directory)) == 'refs' and not os.listdir(directory):
+            os.rmdir(directory)
+
+    def _blob(self, key: str, size: int) -> Blob:
+        return LocalFileBlob(self._path(key))
+
+
+def _digest(blob: Blob) -> typing.Tuple[str, int]:
+    sha = hashlib.sha256()
+    size = 0
+    with blob.bytestream() as stream:
+        for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b''):
+            sha.update(chunk)
+            size += len(chunk)
+    return sha.hexdigest(), size
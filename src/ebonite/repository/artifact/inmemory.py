@@ -24,8 +24,9 @@ class InMemoryArtifactRepository(ArtifactRepository):
     def _push_artifact(self, model_id: str, blobs: typing.Dict[str, Blob]) -> ArtifactCollection:
         if model_id in self._cache:
             raise ArtifactExistsError(model_id, self)
+        # in-memory blobs are immutable, so they are stored as is instead of copying their payloads
         self._cache[model_id] = Blobs({
-            k: InMemoryBlob(v.bytes()) for k, v in blobs.items()
+            k: v if isinstance(v, InMemoryBlob) else InMemoryBlob(v.bytes()) for k, v in blobs.items()
         })
         return self._cache[model_id]
 
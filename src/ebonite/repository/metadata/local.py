@@ -1,4 +1,5 @@
 import copy
+import json
 import os
 from typing import Dict, List, Optional, Set, Tuple, Union
 
@@ -23,6 +24,51 @@ _Environments = Dict[int, RuntimeEnvironment]
 _Instances = Dict[int, RuntimeInstance]
 
 
+def _copy(obj):
+    """
+    Copies ebonite object (or list of them) with all nested objects.
+    Unlike plain deepcopy it doesn't copy repositories objects are bound to, in-memory artifacts
+    and models of wrappers, so that its cost is proportional to amount of metadata being copied
+    """
+    memo = {}
+    for o in (obj if isinstance(obj, list) else [obj]):
+        if o is not None:
+            _share(o, memo)
+    return copy.deepcopy(obj, memo)
+
+
+def _share(obj, memo: dict):
+    shared = [getattr(obj, '_meta', None), getattr(obj, '_art', None)]
+    children = [child for field in obj._nested_fields_meta for child in getattr(obj, field).values()]
+    if isinstance(obj, Model):
+        shared.append(obj._unpersisted_artifacts)
+    elif isinstance(obj, Pipeline):
+        children += obj.models.values()
+    for value in shared:
+        if value is not None:
+            memo[id(value)] = value
+    for child in children:
+        _share(child, memo)
+
+
+_KINDS = {
+    'project': Project,
+    'task': Task,
+    'model': Model,
+    'pipeline': Pipeline,
+    'image': Image,
+    'environment': RuntimeEnvironment,
+    'instance': RuntimeInstance
+}
+
+_PARENTS = {
+    'task': 'project',
+    'model': 'task',
+    'pipeline': 'task',
+    'image': 'task'
+}
+
+
 class _LocalContainer:
     def __init__(self, next_project_id: int = 0, projects: _Projects = None,
                  next_task_id: int = 0, tasks: _Tasks = None,
@@ -31,6 +77,9 @@ class _LocalContainer:
                  next_image_id: int = 0, images: _Images = None,
                  next_environment_id: int = 0, environments: _Environments = None,
                  next_instance_id: int = 0, instances: _Instances = None):
+        # changes are recorded only when journal is set, i.e. not while container is being loaded
+        self.journal: Optional[List[dict]] = None
+
         self.next_project_id = next_project_id
         self.projects: _Projects = {}
         self.project_name_index: Dict[str, int] = {}
@@ -83,6 +132,42 @@ class _LocalContainer:
         for i in (instances or {}).values():
             self.add_instance(i)
 
+    def _record(self, op: str, kind: str, value):
+        if self.journal is not None:
+            if op == 'add':
+                value = pyjackson.serialize(value, _KINDS[kind])
+            self.journal.append({'op': op, 'kind': kind, 'value': value})
+
+    def replay(self, entry: dict):
+        """
+        Applies change recorded to journal to this container.
+        Changes which are already applied (e.g. if process crashed during compaction) are applied again safely
+
+        :param entry: journal entry
+        """
+        kind, value = entry['kind'], entry['value']
+        objects = getattr(self, kind + 's')
+        if entry['op'] == 'add':
+            obj = pyjackson.deserialize(value, _KINDS[kind])
+            next_id = f'next_{kind}_id'
+            setattr(self, next_id, max(getattr(self, next_id), obj.id + 1))
+            parent = _PARENTS.get(kind)
+            if parent is not None and getattr(obj, parent + '_id') not in getattr(self, parent + 's'):
+                # parent was removed later in the journal and snapshot already reflects it
+                return
+            if obj.id in objects:
+                self._replay_remove(kind, obj.id)
+            getattr(self, 'add_' + kind)(obj)
+        elif value in objects:
+            self._replay_remove(kind, value)
+
+    def _replay_remove(self, kind: str, obj_id: int):
+        try:
+            getattr(self, 'remove_' + kind)(obj_id)
+        except KeyError:
+            # parent object was replaced without its children, everything but the link to parent is removed already
+            pass
+
     def get_and_increment(self, name):
         next_id = getattr(self, name)
         setattr(self, name, next_id + 1)
@@ -92,6 +177,7 @@ class _LocalContainer:
         assert project.id is not None
         self.projects[project.id] = project
         self.project_name_index[project.name] = project.id
+        self._record('add', 'project', project)
 
     def get_project_by_id(self, project_id):
         return self.projects.get(project_id)
@@ -102,6 +188,7 @@ class _LocalContainer:
     def remove_project(self, project_id):
         project = self.projects.pop(project_id, None)
         del self.project_name_index[project.name]
+        self._record('remove', 'project', project_id)
         return project
 
     def add_task(self, task: Task):
@@ -109,6 +196,7 @@ class _LocalContainer:
         self.tasks[task.id] = task
         self.task_name_index[(task.project_id, task.name)] = task.id
         self.projects[task.project_id]._tasks.add(task)
+        self._record('add', 'task', task)
 
     def get_task_by_id(self, task_id):
         return self.tasks.get(task_id)
@@ -121,6 +209,7 @@ class _LocalContainer:
 
         self.task_name_index.pop((task.project_id, task.name), None)
         del self.projects[task.project_id]._tasks[task.id]
+        self._record('remove', 'task', task_id)
         return task
 
     def add_model(self, model: Model):
@@ -128,6 +217,7 @@ class _LocalContainer:
         self.models[model.id] = model
         self.model_name_index[(model.task_id, model.name)] = model.id
         self.tasks[model.task_id]._models.add(model)
+        self._record('add', 'model', model)
 
     def get_model_by_id(self, model_id):
         return self.models.get(model_id, None)
@@ -139,6 +229,7 @@ class _LocalContainer:
         model = self.models.pop(model_id, None)
         self.model_name_index.pop((model.task_id, model.name), None)
         del self.tasks[model.task_id]._models[model.id]
+        self._record('remove', 'model', model_id)
         return model
 
     def add_pipeline(self, pipeline: Pipeline):
@@ -146,6 +237,7 @@ class _LocalContainer:
         self.pipelines[pipeline.id] = pipeline
         self.pipeline_name_index[(pipeline.task_id, pipeline.name)] = pipeline.id
         self.tasks[pipeline.task_id]._pipelines.add(pipeline)
+        self._record('add', 'pipeline', pipeline)
 
     def get_pipeline_by_id(self, pipeline_id):
         return self.pipelines.get(pipeline_id, None)
@@ -157,6 +249,7 @@ class _LocalContainer:
         pipeline = self.pipelines.pop(pipeline_id, None)
         self.pipeline_name_index.pop((pipeline.task_id, pipeline.name), None)
         del self.tasks[pipeline.task_id]._pipelines[pipeline.id]
+        self._record('remove', 'pipeline', pipeline_id)
         return pipeline
 
     def add_image(self, image: Image):
@@ -164,6 +257,7 @@ class _LocalContainer:
         self.images[image.id] = image
         self.image_name_index[(image.task_id, image.name)] = image.id
         self.tasks[image.task_id]._images.add(image)
+        self._record('add', 'image', image)
 
     def get_image_by_id(self, image_id):
         return self.images.get(image_id, None)
@@ -175,12 +269,14 @@ class _LocalContainer:
         image = self.images.pop(image_id, None)
         self.image_name_index.pop((image.task_id, image.name), None)
         del self.tasks[image.task_id]._images[image.id]
+        self._record('remove', 'image', image_id)
         return image
 
     def add_environment(self, environment: RuntimeEnvironment):
         assert environment.id is not None
         self.environments[environment.id] = environment
         self.environment_name_index[environment.name] = environment.id
+        self._record('add', 'environment', environment)
 
     def get_environment_by_id(self, environment_id):
         return self.environments.get(environment_id)
@@ -191,6 +287,7 @@ class _LocalContainer:
     def remove_environment(self, environment_id):
         environment = self.environments.pop(environment_id, None)
         del self.environment_name_index[environment.name]
+        self._record('remove', 'environment', environment_id)
         return environment
 
     def add_instance(self, instance: RuntimeInstance):
@@ -200,6 +297,7 @@ class _LocalContainer:
         self.instance_index.setdefault((instance.environment_id, instance.image_id), set()).add(instance.id)
         self.environment_instance.setdefault(instance.environment_id, set()).add(instance.id)
         self.image_instance.setdefault(instance.image_id, set()).add(instance.id)
+        self._record('add', 'instance', instance)
 
     def get_instance_by_id(self, instance_id: int):
         return self.instances.get(instance_id, None)
@@ -222,6 +320,7 @@ class _LocalContainer:
         self.instance_index[(instance.environment_id, instance.image_id)].discard(instance_id)
         self.environment_instance[instance.environment_id].discard(instance_id)
         self.image_instance[instance.image_id].discard(instance_id)
+        self._record('remove', 'instance', instance_id)
         return instance
 
 
@@ -229,24 +328,36 @@ class LocalMetadataRepository(MetadataRepository):
     """
     :class:`.MetadataRepository` implementation which stores metadata in a local filesystem as JSON file.
 
-    Warning: file storage is completely overwritten on each update,
-    thus this repository is not suitable for high-performance scenarios.
+    Each update is appended as a single line to JSON-lines journal file next to JSON snapshot (`<path>.journal`),
+    so that update cost doesn't depend on the amount of stored metadata.
+    Journal is compacted into the snapshot when repository is opened and after `compact_every` updates.
+    Metadata is loaded by replaying journal on top of snapshot.
+
+    Warning: repository is not safe to be updated from several processes simultaneously.
 
     :param path: path to json with the metadata, if `None` metadata is stored in-memory.
+    :param compact_every: number of journal entries to compact journal into snapshot after
     """
 
     type = 'local'
 
-    def __init__(self, path=None):
+    def __init__(self, path=None, compact_every: int = 1000):
         self.path = path
+        self.compact_every = compact_every
         if self.path is not None:
             os.makedirs(os.path.dirname(self.path), exist_ok=True)
 
         self.data: _LocalContainer = _LocalContainer()
+        self._journal_size = 0
         self.load()
-        self.save()
+        self.compact()
+
+    @property
+    def journal_path(self) -> Optional[str]:
+        return self.path + '.journal' if self.path is not None else None
 
     def load(self):
+        self._journal_size = 0
         if self.path is not None and os.path.exists(self.path):
             with open(self.path, 'r', encoding='utf8') as f:
                 logger.debug('Loading metadata from %s', self.path)
@@ -254,41 +365,100 @@ class LocalMetadataRepository(MetadataRepository):
         else:
             self.data = _LocalContainer()
 
+        if self.path is not None and os.path.exists(self.journal_path):
+            logger.debug('Replaying metadata journal %s', self.journal_path)
+            with open(self.journal_path, 'r', encoding='utf8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # last line could be incomplete if process was killed while writing it
+                        logger.warning('Skipping malformed line of metadata journal %s', self.journal_path)
+                        continue
+                    self.data.replay(entry)
+                    self._journal_size += 1
+        # nothing is recorded for in-memory repository, as its objects may hold unserializable in-memory artifacts
+        self.data.journal = [] if self.path is not None else None
+
     def save(self):
+        """
+        Appends changes made since previous save to journal
+        """
+        if self.path is None or not self.data.journal:
+            return
+        entries, self.data.journal = self.data.journal, []
+        with open(self.journal_path, 'a', encoding='utf8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+        self._journal_size += len(entries)
+        if self._journal_size >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """
+        Writes all metadata to snapshot and truncates journal
+        """
         if self.path is None:
             return
-        with open(self.path, 'w', encoding='utf8') as f:
-            logger.debug('Saving metadata to %s', self.path)
+        self.data.journal = []
+        logger.debug('Saving metadata to %s', self.path)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf8') as f:
             pyjackson.dump(f, self.data)
+        os.replace(tmp_path, self.path)
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_size = 0
+
+    # resolved objects are stored ones (not copies) and are not supposed to leave the repository
+
+    def _resolve_project(self, project: ProjectVar) -> Optional[Project]:
+        if isinstance(project, Project):
+            project = project.id if project.id is not None else project.name
+        if isinstance(project, int):
+            return self.data.get_project_by_id(project)
+        return self.data.get_project_by_name(project)
+
+    def _resolve_task(self, task: TaskVar, project: ProjectVar = None) -> Optional[Task]:
+        if isinstance(task, Task):
+            task = task.id if task.id is not None else task.name
+        if isinstance(task, int):
+            return self.data.get_task_by_id(task)
+        if project is None:
+            raise ValueError('Cannot resolve task without project')
+        project = self._resolve_project(project)
+        if project is None:
+            return None
+        return self.data.get_task_by_name(project.id, task)
 
     @bind_to_self
     def get_projects(self) -> List[Project]:
-        return copy.deepcopy([self.data.get_project_by_id(p) for p in self.data.projects.keys()])
+        return _copy([self.data.get_project_by_id(p) for p in self.data.projects.keys()])
 
     @bind_to_self
     def get_project_by_name(self, name: str) -> Project:
-        return copy.deepcopy(self.data.get_project_by_name(name))
+        return _copy(self.data.get_project_by_name(name))
 
     @bind_to_self
     def get_project_by_id(self, id) -> Project:
-        return copy.deepcopy(self.data.get_project_by_id(id))
+        return _copy(self.data.get_project_by_id(id))
 
     @bind_to_self
     def create_project(self, project: Project) -> Project:
-        if self.get_project_by_name(project.name) is not None:
+        if self.data.get_project_by_name(project.name) is not None:
             raise ExistingProjectError(project)
         project._id = self.data.get_and_increment('next_project_id')
-        self.data.add_project(copy.deepcopy(project))
+        self.data.add_project(_copy(project))
         self.save()
         return project
 
     def update_project(self, project: Project) -> Project:
-        existing_project = self.get_project_by_id(project.id)
+        existing_project = self.data.get_project_by_id(project.id)
         if existing_project is None:
             raise NonExistingProjectError(project)
 
         self.data.remove_project(project.id)
-        proj_copy = copy.deepcopy(project)
+        proj_copy = _copy(project)
         self.data.add_project(proj_copy)
         for task in proj_copy.tasks.values():
             self.save_task(task)
@@ -297,7 +467,7 @@ class LocalMetadataRepository(MetadataRepository):
 
     def delete_project(self, project: Project):
         try:
-            if self.get_tasks(project):
+            if self._resolve_project(project).tasks:
                 raise ProjectWithTasksError(project)
             self.data.remove_project(project.id)
             self.save()
@@ -308,47 +478,47 @@ class LocalMetadataRepository(MetadataRepository):
     @bind_to_self
     def get_tasks(self, project: ProjectVar) -> List[Task]:
         project = self._resolve_project(project)
-        return copy.deepcopy(list(project.tasks.values()))
+        return _copy(list(project.tasks.values()))
 
     @bind_to_self
     def get_task_by_name(self, project: ProjectVar, task_name: str) -> Optional[Task]:
         project = self._resolve_project(project)
         if project is None:
             return None
-        return copy.deepcopy(self.data.get_task_by_name(project.id, task_name))
+        return _copy(self.data.get_task_by_name(project.id, task_name))
 
     @bind_to_self
     def get_task_by_id(self, id) -> Task:
-        return copy.deepcopy(self.data.get_task_by_id(id))
+        return _copy(self.data.get_task_by_id(id))
 
     @bind_to_self
     def create_task(self, task: Task) -> Task:
         self._validate_task(task)
 
-        existing_project = self.get_project_by_id(task.project_id)
+        existing_project = self.data.get_project_by_id(task.project_id)
         if existing_project is None:
             raise NonExistingProjectError(task.project_id)
 
-        existing_task = self.get_task_by_name(existing_project, task.name)
+        existing_task = self.data.get_task_by_name(existing_project.id, task.name)
         if existing_task is not None:
             raise ExistingTaskError(task)
 
         task._id = self.data.get_and_increment('next_task_id')
-        self.data.add_task(copy.deepcopy(task))
+        self.data.add_task(_copy(task))
         self.save()
         return task
 
     def update_task(self, task: Task) -> Task:
-        if task.id is None or self.get_task_by_id(task.id) is None:
+        if task.id is None or self.data.get_task_by_id(task.id) is None:
             raise NonExistingTaskError(task)
         self._validate_task(task)
 
-        existing_project = self.get_project_by_id(task.project_id)
+        existing_project = self.data.get_project_by_id(task.project_id)
         if existing_project is None:
             raise NonExistingProjectError(task.project_id)
 
         self.data.remove_task(task.id)
-        task_copy = copy.deepcopy(task)
+        task_copy = _copy(task)
         self.data.add_task(task_copy)
         for model in task_copy.models.values():
             self.save_model(model)
@@ -358,7 +528,8 @@ class LocalMetadataRepository(MetadataRepository):
     def delete_task(self, task: Task):
         if task.id is None:
             raise NonExistingTaskError(task)
-        if self.get_models(task) or self.get_pipelines(task) or self.get_images(task):
+        existing_task = self._resolve_task(task)
+        if existing_task.models or existing_task.pipelines or existing_task.images:
             raise TaskWithFKError(task)
         self.data.remove_task(task.id)
         self.save()
@@ -367,48 +538,48 @@ class LocalMetadataRepository(MetadataRepository):
     @bind_to_self
     def get_models(self, task: TaskVar, project: ProjectVar = None) -> List[Model]:
         task = self._resolve_task(task, project)
-        return copy.deepcopy(list(task.models.values()))
+        return _copy(list(task.models.values()))
 
     @bind_to_self
     def get_model_by_name(self, model_name: str, task: TaskVar, project: ProjectVar = None) -> Optional[Model]:
         task = self._resolve_task(task, project)
         if task is None:
             return None
-        return copy.deepcopy(self.data.get_model_by_name(task.id, model_name))
+        return _copy(self.data.get_model_by_name(task.id, model_name))
 
     @bind_to_self
     def get_model_by_id(self, id) -> Model:
-        return copy.deepcopy(self.data.get_model_by_id(id))
+        return _copy(self.data.get_model_by_id(id))
 
     @bind_to_self
     def create_model(self, model: Model) -> Model:
         self._validate_model(model)
 
-        existing_task = self.get_task_by_id(model.task_id)
+        existing_task = self.data.get_task_by_id(model.task_id)
         if existing_task is None:
             raise NonExistingTaskError(model.task_id)
 
-        if self.get_model_by_name(model.name, existing_task) is not None:
+        if self.data.get_model_by_name(existing_task.id, model.name) is not None:
             raise ExistingModelError(model)
 
         model._id = self.data.get_and_increment('next_model_id')
-        self.data.add_model(copy.deepcopy(model))
+        self.data.add_model(_copy(model))
         self.save()
         return model
 
     def update_model(self, model: Model) -> Model:
         self._validate_model(model)
 
-        task = self.get_task_by_id(model.task_id)
+        task = self.data.get_task_by_id(model.task_id)
         if task is None:
             raise NonExistingTaskError(model.task_id)
 
-        existing_model = self.get_model_by_id(model.id)
+        existing_model = self.data.get_model_by_id(model.id)
         if existing_model is None:
             raise NonExistingModelError(model)
 
         self.data.remove_model(model.id)
-        model_copy = copy.deepcopy(model)
+        model_copy = _copy(model)
         self.data.add_model(model_copy)
         self.save()
         return model
@@ -425,48 +596,48 @@ class LocalMetadataRepository(MetadataRepository):
     @bind_to_self
     def get_pipelines(self, task: TaskVar, project: ProjectVar = None) -> List[Pipeline]:
         task = self._resolve_task(task, project)
-        return copy.deepcopy(list(task.pipelines.values()))
+        return _copy(list(task.pipelines.values()))
 
     @bind_to_self
     def get_pipeline_by_name(self, pipeline_name: str, task: TaskVar, project: ProjectVar = None) -> Optional[Pipeline]:
         task = self._resolve_task(task, project)
         if task is None:
             return None
-        return copy.deepcopy(self.data.get_pipeline_by_name(task.id, pipeline_name))
+        return _copy(self.data.get_pipeline_by_name(task.id, pipeline_name))
 
     @bind_to_self
     def get_pipeline_by_id(self, id) -> Pipeline:
-        return copy.deepcopy(self.data.get_pipeline_by_id(id))
+        return _copy(self.data.get_pipeline_by_id(id))
 
     @bind_to_self
     def create_pipeline(self, pipeline: Pipeline) -> Pipeline:
         self._validate_pipeline(pipeline)
 
-        existing_task = self.get_task_by_id(pipeline.task_id)
+        existing_task = self.data.get_task_by_id(pipeline.task_id)
         if existing_task is None:
             raise NonExistingTaskError(pipeline.task_id)
 
-        if self.get_pipeline_by_name(pipeline.name, existing_task) is not None:
+        if self.data.get_pipeline_by_name(existing_task.id, pipeline.name) is not None:
             raise ExistingPipelineError(pipeline)
 
         pipeline._id = self.data.get_and_increment('next_pipeline_id')
-        self.data.add_pipeline(copy.deepcopy(pipeline))
+        self.data.add_pipeline(_copy(pipeline))
         self.save()
         return pipeline
 
     def update_pipeline(self, pipeline: Pipeline) -> Pipeline:
         self._validate_pipeline(pipeline)
 
-        task = self.get_task_by_id(pipeline.task_id)
+        task = self.data.get_task_by_id(pipeline.task_id)
         if task is None:
             raise NonExistingTaskError(pipeline.task_id)
 
-        existing_pipeline = self.get_pipeline_by_id(pipeline.id)
+        existing_pipeline = self.data.get_pipeline_by_id(pipeline.id)
         if existing_pipeline is None:
             raise NonExistingPipelineError(pipeline)
 
         self.data.remove_pipeline(pipeline.id)
-        pipeline_copy = copy.deepcopy(pipeline)
+        pipeline_copy = _copy(pipeline)
         self.data.add_pipeline(pipeline_copy)
         self.save()
         return pipeline
@@ -483,46 +654,46 @@ class LocalMetadataRepository(MetadataRepository):
     @bind_to_self
     def get_images(self, task: TaskVar, project: ProjectVar = None) -> List[Image]:
         task = self._resolve_task(task, project)
-        return copy.deepcopy(list(task.images.values()))
+        return _copy(list(task.images.values()))
 
     @bind_to_self
     def get_image_by_name(self, image_name, task: TaskVar, project: ProjectVar = None) -> Optional[Image]:
         task = self._resolve_task(task, project)
-        return copy.deepcopy(self.data.get_image_by_name(task.id, image_name))
+        return _copy(self.data.get_image_by_name(task.id, image_name))
 
     @bind_to_self
     def get_image_by_id(self, id: int) -> Optional[Image]:
-        return copy.deepcopy(self.data.get_image_by_id(id))
+        return _copy(self.data.get_image_by_id(id))
 
     @bind_to_self
     def create_image(self, image: Image) -> Image:
         self._validate_image(image)
 
-        task = self.get_task_by_id(image.task_id)
+        task = self.data.get_task_by_id(image.task_id)
         if task is None:
             raise NonExistingTaskError(image.task_id)
 
-        if self.get_image_by_name(image.name, task) is not None:
+        if self.data.get_image_by_name(task.id, image.name) is not None:
             raise ExistingImageError(image)
 
         image._id = self.data.get_and_increment('next_image_id')
-        self.data.add_image(copy.deepcopy(image))
+        self.data.add_image(_copy(image))
         self.save()
         return image
 
     def update_image(self, image: Image) -> Image:
         self._validate_image(image)
 
-        existing_task = self.get_task_by_id(image.task_id)
+        existing_task = self.data.get_task_by_id(image.task_id)
         if existing_task is None:
             raise NonExistingTaskError(image.task_id)
 
-        existing_image = self.get_image_by_id(image.id)
+        existing_image = self.data.get_image_by_id(image.id)
         if existing_image is None:
             raise NonExistingImageError(image)
 
         self.data.remove_image(image.id)
-        self.data.add_image(copy.deepcopy(image))
+        self.data.add_image(_copy(image))
         self.save()
         return image
 
@@ -537,36 +708,36 @@ class LocalMetadataRepository(MetadataRepository):
 
     @bind_to_self
     def get_environments(self) -> List[RuntimeEnvironment]:
-        return copy.deepcopy([self.data.get_environment_by_id(e) for e in self.data.environments.keys()])
+        return _copy([self.data.get_environment_by_id(e) for e in self.data.environments.keys()])
 
     @bind_to_self
     def get_environment_by_name(self, name) -> Optional[RuntimeEnvironment]:
-        return copy.deepcopy(self.data.get_environment_by_name(name))
+        return _copy(self.data.get_environment_by_name(name))
 
     @bind_to_self
     def get_environment_by_id(self, id: int) -> Optional[RuntimeEnvironment]:
-        return copy.deepcopy(self.data.get_environment_by_id(id))
+        return _copy(self.data.get_environment_by_id(id))
 
     @bind_to_self
     def create_environment(self, environment: RuntimeEnvironment) -> RuntimeEnvironment:
         self._validate_environment(environment)
 
-        if self.get_environment_by_name(environment.name) is not None:
+        if self.data.get_environment_by_name(environment.name) is not None:
             raise ExistingEnvironmentError(environment)
         environment._id = self.data.get_and_increment('next_environment_id')
-        self.data.add_environment(copy.deepcopy(environment))
+        self.data.add_environment(_copy(environment))
         self.save()
         return environment
 
     def update_environment(self, environment: RuntimeEnvironment) -> RuntimeEnvironment:
         self._validate_environment(environment)
 
-        existing_environment = self.get_environment_by_id(environment.id)
+        existing_environment = self.data.get_environment_by_id(environment.id)
         if existing_environment is None:
             raise NonExistingEnvironmentError(environment)
 
         self.data.remove_environment(environment.id)
-        self.data.add_environment(copy.deepcopy(environment))
+        self.data.add_environment(_copy(environment))
         self.save()
         return environment
 
@@ -612,31 +783,31 @@ class LocalMetadataRepository(MetadataRepository):
     def create_instance(self, instance: RuntimeInstance) -> RuntimeInstance:
         self._validate_instance(instance)
 
-        image = self.get_image_by_id(instance.image_id)
+        image = self.data.get_image_by_id(instance.image_id)
         if image is None:
             raise NonExistingImageError(instance.image_id)
 
-        environment = self.get_environment_by_id(instance.environment_id)
+        environment = self.data.get_environment_by_id(instance.environment_id)
         if environment is None:
             raise NonExistingEnvironmentError(instance.environment_id)
 
-        if self.get_instance_by_name(instance.name, image, environment) is not None:
+        if self.data.get_instance_by_name(environment.id, image.id, instance.name) is not None:
             raise ExistingInstanceError(instance)
 
         instance._id = self.data.get_and_increment('next_instance_id')
-        self.data.add_instance(copy.deepcopy(instance))
+        self.data.add_instance(_copy(instance))
         self.save()
         return instance
 
     def update_instance(self, instance: RuntimeInstance) -> RuntimeInstance:
         self._validate_instance(instance)
 
-        existing_instance = self.get_instance_by_id(instance.id)
+        existing_instance = self.data.get_instance_by_id(instance.id)
         if existing_instance is None:
             raise NonExistingInstanceError(instance)
 
         self.data.remove_instance(instance.id)
-        self.data.add_instance(copy.deepcopy(instance))
+        self.data.add_instance(_copy(instance))
         self.save()
         return instance
 
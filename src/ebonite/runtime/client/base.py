@@ -1,11 +1,14 @@
 from abc import abstractmethod
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
 from warnings import warn
 
 from pyjackson import deserialize, serialize
 
 import ebonite
 from ebonite.runtime.interface.base import InterfaceDescriptor, InterfaceMethodDescriptor
+from ebonite.runtime.interface.batching import is_batchable
 from ebonite.utils.log import logger
 
 
@@ -20,9 +23,9 @@ class BaseClient:
 
     def __init__(self):
         self.methods = {}
+        self._set_interface(self._interface_factory())
 
-        interface: InterfaceDescriptor = self._interface_factory()
-
+    def _set_interface(self, interface: InterfaceDescriptor):
         if ebonite.__version__ != interface.version:
             warn(f"Server Ebonite version {interface.version}, client Ebonite version {ebonite.__version__}")
 
@@ -52,10 +55,53 @@ class BaseClient:
 
         pass  # pragma: no cover
 
+    def _call(self, method: '_Method', args: dict):
+        """
+        Serializes given arguments, performs method call at server side and deserializes its result
+
+        :param method: method to call
+        :param args: `dict` of (name, value) mappings for arguments
+        :return: method return value
+        """
+        data = {arg.name: serialize(args[arg.name], arg.type) for arg in method.args}
+        logger.debug('Calling server method "%s", args: %s ...', method.name, data)
+        out = self._call_method(method.name, data)
+        logger.debug('Server call returned %s', out)
+        return deserialize(out, method.out_type)
+
+    def map(self, method: str, data, chunk_size: int = 1000, workers: int = 4):
+        """
+        Calls method with single argument on large input by concurrent calls on its chunks.
+
+        If method argument type is :class:`.BatchableDatasetTypeMixin` (e.g. numpy array or pandas dataframe)
+        given data is split into chunks of `chunk_size` rows and results of calls are concatenated.
+        Otherwise given data is treated as an iterable of method arguments and list of results is returned.
+        Server is not called for empty data.
+
+        :param method: name of method to call
+        :param data: method argument to split or iterable of method arguments
+        :param chunk_size: number of rows in a chunk
+        :param workers: max number of concurrent calls
+        :return: method result for whole data or list of results
+        """
+        meth = self._single_arg_method(method)
+        chunks, batchable = _split_input(meth, data, chunk_size)
+        with ThreadPoolExecutor(workers) as pool:
+            results = list(pool.map(lambda chunk: self._call(meth, {meth.args[0].name: chunk}), chunks))
+        return _join_outputs(meth, results, batchable)
+
+    def _single_arg_method(self, name: str) -> '_Method':
+        if name not in self.methods:
+            raise KeyError(f'{name} method is not exposed by server')
+        method = self.methods[name]
+        if len(method.args) != 1:
+            raise ValueError(f'{name} method should have single argument to be mapped')
+        return method
+
     def __getattr__(self, name):
         if name not in self.methods:
             raise KeyError(f'{name} method is not exposed by server')
-        return _MethodCall(self.base_url, self.methods[name], self._call_method)
+        return _MethodCall(self.base_url, self.methods[name], self._call)
 
 
 _Argument = namedtuple('Argument', ('name', 'type'))
@@ -84,12 +130,31 @@ class _MethodCall:
             if obj is None:
                 raise ValueError(f'Parameter with name "{arg.name}" (position {i}) should be passed')
 
-            data[arg.name] = serialize(obj, arg.type)
+            data[arg.name] = obj
 
-        logger.debug('Calling server method "%s", args: %s ...', self.method.name, data)
-        out = self.call_method(self.method.name, data)
-        logger.debug('Server call returned %s', out)
-        return deserialize(out, self.method.out_type)
+        return self.call_method(self.method, data)
+
+
+def _split_input(method: _Method, data, chunk_size: int) -> Tuple[list, bool]:
+    arg_type = method.args[0].type
+    batchable = is_batchable(arg_type, method.out_type)
+    if not batchable:
+        return list(data), False
+
+    size = arg_type.get_batch_size(data)
+    if size == 0:
+        # there is nothing to call server for
+        return [], True
+    sizes = [min(chunk_size, size - start) for start in range(0, size, chunk_size)]
+    return arg_type.split(data, sizes), True
+
+
+def _join_outputs(method: _Method, results: list, batchable: bool):
+    if not batchable:
+        return results
+    if not results:
+        return method.out_type.empty()
+    return method.out_type.concat(results)
 
 
 def _bootstrap_method(method: InterfaceMethodDescriptor):
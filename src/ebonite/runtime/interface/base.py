@@ -50,26 +50,46 @@ class Interface(metaclass=InterfaceMetaclass):
 
     exposed: Dict[str, Signature] = {}
     executors: Dict[str, Callable] = {}
+    raw_executors: Dict[str, Callable] = {}
 
-    def execute(self, method: str, args: Dict[str, object]):
+    def execute(self, method: str, args: Dict[str, object], raw: bool = False):
         """
         Executes given method with given arguments
 
         :param method: method name to execute
         :param args: arguments to pass into method
+        :param raw: if `True` result is returned as an object of method output type instead of its serialized form
         :return: method result
         """
 
         self._validate_args(method, args)
+        if raw:
+            if method in self.raw_executors:
+                return self.raw_executors[method](**args)
+            return deserialize(self.execute(method, args), self.exposed_method_returns(method).type)
         f = self.executors[method] if method in self.executors else getattr(self, method)
         return f(**args)
 
     def _validate_args(self, method: str, args: Dict[str, object]):
-        needed_args = self.exposed_method_args(method)
-        missing_args = [arg.name for arg in needed_args if arg.name not in args]
-        if len(missing_args) > 0:
+        # validators are created on first call of method as subclasses do not necessarily call `__init__`
+        validators = self.__dict__.setdefault('_validators', {})
+        validator = validators.get(method)
+        if validator is None:
+            validator = validators[method] = self._create_validator(method)
+        validator(args)
+
+    def _create_validator(self, method: str) -> Callable[[Dict[str, object]], None]:
+        needed_args = [arg.name for arg in self.exposed_method_args(method)]
+        needed_set = frozenset(needed_args)
+
+        def validate(args: Dict[str, object]):
+            if needed_set.issubset(args.keys()):
+                return
+            missing_args = [arg for arg in needed_args if arg not in args]
             raise ExecutionError('{} method {} missing args {}'.format(self, method, ', '.join(missing_args)))
 
+        return validate
+
     def exposed_methods(self):
         """
         Lists signatures of methods exposed by interface
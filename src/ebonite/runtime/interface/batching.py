@@ -0,0 +1,149 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List
+
+from ebonite.config import Config, Core, Param
+from ebonite.core.objects.dataset_type import BatchableDatasetTypeMixin, DatasetType
+from ebonite.utils.log import rlogger
+
+
+class BatchingConfig(Config):
+    BATCH_MAX_SIZE = Param('batch_max_size', default='0',
+                           doc='max number of rows to group into single model call, 0 or 1 disables batching',
+                           parser=int)
+    BATCH_MAX_WAIT_MS = Param('batch_max_wait_ms', default='5',
+                              doc='max time in milliseconds to wait for other requests to fill a batch',
+                              parser=int)
+
+
+if Core.DEBUG:
+    BatchingConfig.log_params()
+
+
+def is_batchable(in_type: DatasetType, out_type: DatasetType) -> bool:
+    """
+    Checks whether calls with given input and output types could be grouped into batches
+
+    :param in_type: method input type
+    :param out_type: method output type
+    :return: `True` if both types support concatenation and splitting
+    """
+    return issubclass(in_type, BatchableDatasetTypeMixin) and issubclass(out_type, BatchableDatasetTypeMixin)
+
+
+class _BatchItem:
+    def __init__(self, data, size: int):
+        self.data = data
+        self.size = size
+        self.future = Future()
+
+
+class MethodBatcher:
+    """
+    Groups concurrent calls of a single model method into one vectorized call.
+
+    Each caller blocks until a background worker collects up to `max_size` rows (or waits for `max_wait_ms`),
+    concatenates them along first axis, calls the method once and scatters results back.
+    If batched call fails, requests of the batch are retried one by one so errors are reported to their callers only.
+
+    :param func: function to call on (batched) input data
+    :param in_type: :class:`.BatchableDatasetTypeMixin` of input data
+    :param out_type: :class:`.BatchableDatasetTypeMixin` of output data
+    :param max_size: max number of rows in a batch
+    :param max_wait_ms: max time in milliseconds to wait for a batch to fill
+    """
+
+    def __init__(self, func: Callable, in_type: BatchableDatasetTypeMixin, out_type: BatchableDatasetTypeMixin,
+                 max_size: int, max_wait_ms: int):
+        self.func = func
+        self.in_type = in_type
+        self.out_type = out_type
+        self.max_size = max_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def __call__(self, input_data):
+        size = self.in_type.get_batch_size(input_data)
+        if size >= self.max_size:
+            return self.func(input_data)
+
+        item = _BatchItem(input_data, size)
+        self._ensure_worker()
+        self._queue.put(item)
+        return item.future.result()
+
+    def _ensure_worker(self):
+        # worker is started lazily so that batcher survives forking of a process it was created in
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._loop, daemon=True)
+                self._worker.start()
+
+    def _loop(self):
+        while True:
+            self._process(self._collect())
+
+    def _collect(self) -> List[_BatchItem]:
+        first = self._queue.get()
+        batch, total = [first], first.size
+        deadline = time.monotonic() + self.max_wait
+        while total < self.max_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            batch.append(item)
+            total += item.size
+        return batch
+
+    def _process(self, batch: List[_BatchItem]):
+        if len(batch) == 1:
+            self._call_single(batch[0])
+            return
+
+        rlogger.debug('calling batch of %s requests', len(batch))
+        sizes = [i.size for i in batch]
+        try:
+            output = self.func(self.in_type.concat([i.data for i in batch]))
+            if self.out_type.get_batch_size(output) != sum(sizes):
+                raise ValueError('batched call returned output of unexpected size')
+            parts = self.out_type.split(output, sizes)
+        except Exception as e:
+            rlogger.debug('batched call failed, falling back to separate calls: %s', e)
+            for item in batch:
+                self._call_single(item)
+            return
+
+        for item, part in zip(batch, parts):
+            item.future.set_result(part)
+
+    def _call_single(self, item: _BatchItem):
+        try:
+            item.future.set_result(self.func(item.data))
+        except Exception as e:
+            item.future.set_exception(e)
+
+
+def create_batcher(func: Callable, in_type: DatasetType, out_type: DatasetType) -> Callable:
+    """
+    Wraps given function into :class:`MethodBatcher` if batching is enabled via
+    `EBONITE_BATCH_MAX_SIZE` environment variable and given types support it.
+
+    :param func: function to wrap
+    :param in_type: function input type
+    :param out_type: function output type
+    :return: given function or batcher wrapping it
+    """
+    max_size = BatchingConfig.BATCH_MAX_SIZE
+    if max_size <= 1 or not is_batchable(in_type, out_type):
+        return func
+    return MethodBatcher(func, in_type, out_type, max_size, BatchingConfig.BATCH_MAX_WAIT_MS)
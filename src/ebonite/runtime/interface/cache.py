@@ -0,0 +1,229 @@
+import hashlib
+import inspect
+import json
+import threading
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional
+
+from pyjackson import deserialize, serialize
+from pyjackson.core import Signature
+
+from ebonite.config import Config, Core, Param
+from ebonite.core.objects.dataset_type import BinaryDatasetTypeMixin
+from ebonite.runtime.interface.base import Interface
+from ebonite.utils.importing import import_string
+from ebonite.utils.log import rlogger
+
+
+class CacheConfig(Config):
+    CACHE_METHODS = Param('cache_methods', default='',
+                          doc='comma-separated names of exposed methods which results are cached, '
+                              'these methods should be deterministic')
+    CACHE_MAX_SIZE = Param('cache_max_size', default='1024',
+                           doc='max number of results kept by in-process cache', parser=int)
+    CACHE_TTL = Param('cache_ttl', default='0',
+                      doc='time in seconds results are kept by in-process cache for, 0 means forever', parser=float)
+    CACHE_BACKEND = Param('cache_backend', default='ebonite.runtime.interface.cache.LRUCacheBackend',
+                          doc='full name of cache backend class')
+
+
+if Core.DEBUG:
+    CacheConfig.log_params()
+
+
+class CacheBackend:
+    """
+    Base class for storages of cached method results. Implementations should be thread-safe
+    """
+
+    @abstractmethod
+    def get(self, key: str, default=None):
+        """
+        :param key: key of cached result
+        :param default: value to return if there is no cached result
+        :return: cached result or `default` if there is no one
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def set(self, key: str, value):
+        """
+        :param key: key of result
+        :param value: result to cache
+        """
+        pass  # pragma: no cover
+
+
+class LRUCacheBackend(CacheBackend):
+    """
+    In-process :class:`CacheBackend` which keeps limited number of least recently used results
+    for limited amount of time
+
+    :param max_size: max number of results to keep, if not given `EBONITE_CACHE_MAX_SIZE` is used
+    :param ttl: time in seconds to keep results for, 0 means forever, if not given `EBONITE_CACHE_TTL` is used
+    """
+
+    def __init__(self, max_size: int = None, ttl: float = None):
+        self.max_size = max_size if max_size is not None else CacheConfig.CACHE_MAX_SIZE
+        self.ttl = ttl if ttl is not None else CacheConfig.CACHE_TTL
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires, value = item
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value):
+        expires = time.monotonic() + self.ttl if self.ttl > 0 else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+def _arg_buffers(obj, arg_type) -> Iterable:
+    if inspect.isclass(arg_type) and issubclass(arg_type, BinaryDatasetTypeMixin) and \
+            arg_type.content_type is not None:
+        # fast path: raw memory of arrays and dataframes
+        return arg_type.buffers(obj)
+    return [json.dumps(serialize(obj, arg_type), sort_keys=True).encode('utf-8')]
+
+
+def input_hash(signature: Signature, args: Dict[str, object]) -> str:
+    """
+    Computes hash of method arguments
+
+    :param signature: signature of method
+    :param args: deserialized arguments of method
+    :return: hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for arg in signature.args:
+        digest.update(arg.name.encode('utf-8'))
+        for buffer in _arg_buffers(args[arg.name], arg.type):
+            digest.update(buffer)
+    return digest.hexdigest()
+
+
+# marks missing results, as `None` is a valid result
+_MISS = object()
+
+
+class MethodCache:
+    """
+    Cache of results of single interface method keyed by hash of its arguments.
+    Results are stored in serialized form, so cached results of both serializing and raw executors are shared
+
+    :param method: method name
+    :param signature: method signature
+    :param backend: storage for results
+    """
+
+    def __init__(self, method: str, signature: Signature, backend: CacheBackend):
+        self.method = method
+        self.signature = signature
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _key(self, args):
+        return f'{self.method}:{input_hash(self.signature, args)}'
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def wrap(self, executor: Callable) -> Callable:
+        """
+        :param executor: function which returns serialized method result
+        :return: function which returns cached result if there is one
+        """
+
+        def _exec(**kwargs):
+            key = self._key(kwargs)
+            result = self.backend.get(key, _MISS)
+            self._count(result is not _MISS)
+            if result is _MISS:
+                result = executor(**kwargs)
+                self.backend.set(key, result)
+            return result
+
+        return _exec
+
+    def wrap_raw(self, raw_executor: Callable) -> Callable:
+        """
+        :param raw_executor: function which returns method result as an object of method output type
+        :return: function which returns cached result if there is one
+        """
+        out_type = self.signature.output.type
+
+        def _exec(**kwargs):
+            key = self._key(kwargs)
+            result = self.backend.get(key, _MISS)
+            self._count(result is not _MISS)
+            if result is not _MISS:
+                return deserialize(result, out_type)
+            result = raw_executor(**kwargs)
+            self.backend.set(key, serialize(result, out_type))
+            return result
+
+        return _exec
+
+
+def cache_methods(interface: Interface, methods: Iterable[str], backend: CacheBackend = None) -> Dict[str, MethodCache]:
+    """
+    Makes given interface cache results of given methods. Caches are available as `caches` interface attribute
+
+    :param interface: interface to modify
+    :param methods: names of methods to cache, these methods should be deterministic
+    :param backend: storage for results, new :class:`LRUCacheBackend` by default
+    :return: dict method name -> :class:`MethodCache`
+    """
+    backend = backend or LRUCacheBackend()
+    executors = {**interface.executors}
+    raw_executors = {**interface.raw_executors}
+    caches = {**getattr(interface, 'caches', {})}
+    for method in methods:
+        cache = MethodCache(method, interface.exposed_method_signature(method), backend)
+        executor = executors[method] if method in executors else getattr(interface, method)
+        executors[method] = cache.wrap(executor)
+        if method in raw_executors:
+            raw_executors[method] = cache.wrap_raw(raw_executors[method])
+        caches[method] = cache
+    interface.executors = executors
+    interface.raw_executors = raw_executors
+    interface.caches = caches
+    return caches
+
+
+def cache_configured_methods(interface: Interface) -> Optional[Dict[str, MethodCache]]:
+    """
+    Makes given interface cache results of methods listed in `EBONITE_CACHE_METHODS` environment variable
+    using backend from `EBONITE_CACHE_BACKEND`
+
+    :param interface: interface to modify
+    :return: dict method name -> :class:`MethodCache` or `None` if no methods are configured
+    """
+    methods = [m.strip() for m in CacheConfig.CACHE_METHODS.split(',') if m.strip()]
+    if not methods:
+        return None
+    rlogger.info('Caching results of methods %s', ', '.join(methods))
+    return cache_methods(interface, methods, import_string(CacheConfig.CACHE_BACKEND)())
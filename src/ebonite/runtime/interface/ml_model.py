@@ -1,12 +1,18 @@
+import contextlib
 import os
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import Dict, List
 
 from pyjackson import read
 from pyjackson.core import Field, Signature
 
+from ebonite.config import Config, Core, Param
 from ebonite.core.objects import Model
+from ebonite.core.objects.wrapper import ModelWrapper
 from ebonite.runtime.interface import Interface
 from ebonite.runtime.interface.base import InterfaceLoader
+from ebonite.runtime.interface.batching import create_batcher
 from ebonite.runtime.interface.utils import merge
 from ebonite.utils.log import rlogger
 
@@ -15,12 +21,123 @@ MODEL_META_PATH = 'model.json'
 MODELS_META_PATH = 'models.json'
 
 
-def model_interface(model_meta: Model):
+class ModelLoaderConfig(Config):
+    LAZY = Param('lazy_models', default='false',
+                 doc='load model objects on first call instead of runtime start', parser=bool)
+    MEMORY_BUDGET = Param('models_memory_budget', default='0',
+                          doc='max total size in bytes of lazily loaded models kept in memory, '
+                              'least recently used ones are unloaded to fit it, 0 means unlimited',
+                          parser=int)
+
+
+if Core.DEBUG:
+    ModelLoaderConfig.log_params()
+
+
+def _dir_size(path: str) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        size += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return size
+
+
+class _PoolEntry:
+    def __init__(self, wrapper: ModelWrapper, path: str):
+        self.wrapper = wrapper
+        self.path = path
+        self.size = _dir_size(path)
+        self.users = 0
+        # serializes loading of this model, so that callers of other models are not blocked by it
+        self.load_lock = threading.Lock()
+
+
+class LazyModelPool:
+    """
+    Loads model objects of registered wrappers on first call and keeps them in LRU cache bounded by memory budget.
+    Memory consumed by a model is estimated as size of its artifacts on disk.
+    Models being called at the moment are never unloaded, so budget could be exceeded temporarily.
+
+    :param memory_budget: max total size of loaded models in bytes, 0 means unlimited
+    """
+
+    def __init__(self, memory_budget: int = 0):
+        self.memory_budget = memory_budget
+        # wrappers are not hashable so they are keyed by id
+        self._entries: Dict[int, _PoolEntry] = {}
+        self._loaded: Dict[int, _PoolEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, wrapper: ModelWrapper, path: str):
+        """
+        Loads metadata of model stored in given path into given wrapper, model object itself is loaded on first use
+
+        :param wrapper: wrapper to load model into
+        :param path: path to model artifacts
+        """
+        wrapper.load_meta(path)
+        self._entries[id(wrapper)] = _PoolEntry(wrapper, path)
+
+    @property
+    def loaded_size(self) -> int:
+        return sum(e.size for e in self._loaded.values())
+
+    @contextlib.contextmanager
+    def use(self, wrapper: ModelWrapper):
+        """
+        Context manager which ensures that model of given wrapper is loaded and is not unloaded until exit
+
+        :param wrapper: registered wrapper
+        """
+        key = id(wrapper)
+        entry = self._entries[key]
+        with self._lock:
+            # model which has users is never unloaded, including one being loaded
+            entry.users += 1
+            loaded = key in self._loaded
+            if loaded:
+                self._loaded.move_to_end(key)
+        try:
+            if not loaded:
+                self._load(key, entry)
+            yield wrapper
+        finally:
+            with self._lock:
+                entry.users -= 1
+
+    def _load(self, key: int, entry: _PoolEntry):
+        with entry.load_lock:
+            with self._lock:
+                if key in self._loaded:  # loaded by other caller while this one waited
+                    self._loaded.move_to_end(key)
+                    return
+                self._evict(entry.size)
+            rlogger.debug('Loading model from %s', entry.path)
+            entry.wrapper.load(entry.path)
+            with self._lock:
+                self._loaded[key] = entry
+
+    def _evict(self, required: int):
+        if self.memory_budget <= 0:
+            return
+        size = self.loaded_size
+        for key, entry in list(self._loaded.items()):
+            if size + required <= self.memory_budget:
+                break
+            if entry.users > 0:
+                continue
+            rlogger.debug('Unloading model from %s', entry.path)
+            entry.wrapper.model = None
+            del self._loaded[key]
+            size -= entry.size
+
+
+def model_interface(model_meta: Model, pool: LazyModelPool = None):
     """
     Creates an interface from given model with methods exposed by wrapper
     Methods signature is determined via metadata associated with given model.
 
     :param model_meta: model to create interface for
+    :param pool: :class:`LazyModelPool` model wrapper is registered in, if model should be loaded on demand
     :return: instance of :class:`.Interface` implementation
     """
 
@@ -29,33 +146,71 @@ def model_interface(model_meta: Model):
     class MLModelInterface(Interface):
         def __init__(self, model):
             self.model = model
+            # methods of model which is not thread-safe are called one at a time
+            self.lock = None if model.thread_safe else threading.Lock()
 
             exposed = {**self.exposed}
             executors = {**self.executors}
+            raw_executors = {**self.raw_executors}
 
             for name in self.model.exposed_methods:
                 in_type, out_type = self.model.method_signature(name)
                 exposed[name] = Signature([Field("vector", in_type, False)], Field(None, out_type, False))
-                executors[name] = self._exec_factory(name, out_type)
+                raw_executors[name] = self._raw_exec_factory(name, in_type, out_type)
+                executors[name] = self._exec_factory(raw_executors[name], out_type)
 
             self.exposed = exposed
             self.executors = executors
+            self.raw_executors = raw_executors
 
-        def _exec_factory(self, name, out_type):
+        def _raw_exec_factory(self, name, in_type, out_type):
             model = self.model
 
-            def _exec(**kwargs):
+            def call_method(data):
+                return model.call_method(name, data)
+
+            if pool is not None:
+                call_method = _using_pool(call_method, pool, model)
+            if self.lock is not None:
+                call_method = _locked(call_method, self.lock)
+
+            call = create_batcher(call_method, in_type, out_type)
+
+            def _raw_exec(**kwargs):
                 input_data = kwargs['vector']
                 rlogger.debug('calling %s given %s', name, input_data)
-                output_data = model.call_method(name, input_data)
+                output_data = call(input_data)
                 rlogger.debug('%s returned: %s', name, output_data)
-                return out_type.serialize(output_data)
+                return output_data
+
+            return _raw_exec
+
+        @staticmethod
+        def _exec_factory(raw_exec, out_type):
+            def _exec(**kwargs):
+                return out_type.serialize(raw_exec(**kwargs))
 
             return _exec
 
     return MLModelInterface(model_meta.wrapper)
 
 
+def _using_pool(func, pool: LazyModelPool, wrapper: ModelWrapper):
+    def call(data):
+        with pool.use(wrapper):
+            return func(data)
+
+    return call
+
+
+def _locked(func, lock: threading.Lock):
+    def call(data):
+        with lock:
+            return func(data)
+
+    return call
+
+
 class ModelLoader(InterfaceLoader):
     """
     Implementation of :class:`.InterfaceLoader` which loads a model via PyJackson and wraps it into an interface
@@ -63,21 +218,34 @@ class ModelLoader(InterfaceLoader):
 
     def load(self) -> Interface:
         meta = read(MODEL_META_PATH, Model)
-        meta.wrapper.load(MODEL_BIN_PATH)
-        return model_interface(meta)
+        if not ModelLoaderConfig.LAZY:
+            meta.wrapper.load(MODEL_BIN_PATH)
+            return model_interface(meta)
+
+        pool = LazyModelPool()
+        pool.register(meta.wrapper, MODEL_BIN_PATH)
+        return model_interface(meta, pool)
 
 
 class MultiModelLoader(InterfaceLoader):
     """
     Implementation of :class:`.InterfaceLoader` which loads a collection of models via PyJackson
-    and wraps them into a single interface
+    and wraps them into a single interface.
+
+    If `EBONITE_LAZY_MODELS` is set, models are loaded on their first call and least recently used ones are unloaded
+    to fit `EBONITE_MODELS_MEMORY_BUDGET`
     """
 
     def load(self) -> Interface:
         metas = read(MODELS_META_PATH, List[Model])
+        pool = LazyModelPool(ModelLoaderConfig.MEMORY_BUDGET) if ModelLoaderConfig.LAZY else None
         for i, meta in enumerate(metas):
-            meta.wrapper.load(os.path.join(MODEL_BIN_PATH, str(i)))
+            path = os.path.join(MODEL_BIN_PATH, str(i))
+            if pool is None:
+                meta.wrapper.load(path)
+            else:
+                pool.register(meta.wrapper, path)
         ifaces = {
-            meta.name: model_interface(meta) for meta in metas
+            meta.name: model_interface(meta, pool) for meta in metas
         }
         return merge(ifaces)
@@ -1,4 +1,5 @@
 import os
+import threading
 from typing import Dict
 
 from pyjackson import read
@@ -6,6 +7,7 @@ from pyjackson import read
 from ebonite.core.objects import Model, Pipeline
 from ebonite.runtime.interface import Interface, expose
 from ebonite.runtime.interface.base import InterfaceLoader
+from ebonite.runtime.interface.batching import create_batcher
 from ebonite.utils.log import rlogger
 
 MODEL_BIN_PATH = 'model_dump'
@@ -33,13 +35,28 @@ def pipeline_interface(pipeline_meta: Pipeline):
     class PipelineInterface(Interface):
         def __init__(self, pipeline):
             self.pipeline = pipeline
+            self.raw_executors = {**self.raw_executors, 'run': self._run}
+            # pipeline runs are serialized if any of its models is not thread-safe
+            thread_safe = all(m.wrapper.thread_safe for m in pipeline.models.values())
+            self.lock = None if thread_safe else threading.Lock()
+            self.plan = pipeline.plan()
+            self.call = create_batcher(self._run_plan, pipeline.input_data, pipeline.output_data)
 
-        @expose
-        def run(self, data: pipeline_meta.input_data) -> pipeline_meta.output_data:
+        def _run_plan(self, data):
+            if self.lock is None:
+                return self.plan.run(data)
+            with self.lock:
+                return self.plan.run(data)
+
+        def _run(self, data):
             rlogger.debug('running pipeline given %s', data)
-            output_data = self.pipeline.run(data)
+            output_data = self.call(data)
             rlogger.debug('run returned: %s', output_data)
-            return pipeline_meta.output_data.serialize(output_data)
+            return output_data
+
+        @expose
+        def run(self, data: pipeline_meta.input_data) -> pipeline_meta.output_data:
+            return pipeline_meta.output_data.serialize(self._run(data))
 
     return PipelineInterface(pipeline_meta)
 
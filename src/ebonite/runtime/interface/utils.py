@@ -18,16 +18,19 @@ class _MergedInterface(Interface):
     def __init__(self, ifaces):
         exposed = {**self.exposed}
         executors = {**self.executors}
+        raw_executors = {**self.raw_executors}
         for pre, iface in ifaces.items():
             for meth in iface.exposed_methods():
                 pre_meth = '{}_{}'.format(pre, meth)
                 exposed[pre_meth] = iface.exposed_method_signature(meth)
-                executors[pre_meth] = self._exec_factory(iface, meth)
+                executors[pre_meth] = self._exec_factory(iface, meth, False)
+                raw_executors[pre_meth] = self._exec_factory(iface, meth, True)
         self.exposed = exposed
         self.executors = executors
+        self.raw_executors = raw_executors
 
     @staticmethod
-    def _exec_factory(iface, method):
+    def _exec_factory(iface, method, raw):
         def _exec(**kwargs):
-            return iface.execute(method, kwargs)
+            return iface.execute(method, kwargs, raw)
         return _exec
@@ -0,0 +1,153 @@
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from ebonite.config import Config, Core, Param
+from ebonite.core.objects.hooks import CallHook, CallInfo, add_hook
+from ebonite.utils.log import rlogger
+
+
+class ProfilingConfig(Config):
+    PROFILE_DIR = Param('profile_dir', default='',
+                        doc='directory to dump sampled stack profiles of model calls to, profiling is off if empty')
+    PROFILE_INTERVAL = Param('profile_interval', default='0.01',
+                             doc='interval in seconds between stack samples', parser=float)
+    PROFILE_DUMP_INTERVAL = Param('profile_dump_interval', default='60',
+                                  doc='interval in seconds between dumps of collected profile', parser=float)
+
+
+if Core.DEBUG:
+    ProfilingConfig.log_params()
+
+
+class SamplingProfiler(CallHook):
+    """
+    :class:`.CallHook` which periodically samples stacks of threads executing wrapper method calls
+    or pipeline runs and dumps them to files in collapsed stack format (`frame;frame;frame count` lines),
+    which is understood by flame graph tools.
+
+    Only frames of outermost call in each thread are sampled, so pipeline profiles show which step consumed the time.
+    Sampling thread is started on first call in each process, thus it works for forked server workers too.
+    Profile is dumped to `profile-<pid>-<timestamp>.collapsed` file every `dump_interval` seconds
+    if anything was sampled.
+
+    :param directory: directory to dump profiles to
+    :param interval: interval in seconds between samples
+    :param dump_interval: interval in seconds between dumps
+    """
+
+    def __init__(self, directory: str, interval: float = .01, dump_interval: float = 60):
+        self.directory = directory
+        self.interval = interval
+        self.dump_interval = dump_interval
+        self._lock = threading.Lock()
+        self._roots = {}
+        self._counts = Counter()
+        self._pid = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def pre(self, info: CallInfo):
+        if self._pid != os.getpid():
+            self._start()
+        with self._lock:
+            # only outermost call in each thread is sampled
+            self._roots.setdefault(threading.get_ident(), info)
+
+    def post(self, info: CallInfo):
+        thread_id = threading.get_ident()
+        with self._lock:
+            if self._roots.get(thread_id) is info:
+                del self._roots[thread_id]
+
+    def _start(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # sampling thread and calls of parent process are not inherited by forked process
+            self._pid = os.getpid()
+            self._roots.clear()
+            self._counts.clear()
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(target=self._run, name='ebonite-profiler', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        last_dump = time.monotonic()
+        while not self._stopped.wait(self.interval):
+            self.sample()
+            if time.monotonic() - last_dump >= self.dump_interval:
+                self.dump()
+                last_dump = time.monotonic()
+
+    def sample(self):
+        """
+        Takes a sample of stacks of threads which execute calls
+        """
+        frames = sys._current_frames()
+        with self._lock:
+            roots = list(self._roots.items())
+        for thread_id, info in roots:
+            frame, root = frames.get(thread_id), info.frame
+            stack = []
+            while frame is not None:
+                stack.append(_frame_name(frame))
+                if frame is root:
+                    break
+                frame = frame.f_back
+            else:
+                continue  # thread has already left the call
+            with self._lock:
+                self._counts[';'.join(reversed(stack))] += 1
+
+    def dump(self) -> Optional[str]:
+        """
+        Writes samples collected since previous dump to a new file in profiles directory
+
+        :return: path to written file or `None` if nothing was sampled
+        """
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        if not counts:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f'profile-{os.getpid()}-{int(time.time() * 1000)}.collapsed')
+        with open(path, 'w') as f:
+            for stack, count in counts.most_common():
+                f.write(f'{stack} {count}\n')
+        rlogger.debug('Dumped profile to %s', path)
+        return path
+
+    def stop(self):
+        """
+        Stops sampling thread and dumps samples which are not dumped yet
+        """
+        self._stopped.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join()
+        self.dump()
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+def profile_configured() -> Optional[SamplingProfiler]:
+    """
+    Starts profiling of model calls if `EBONITE_PROFILE_DIR` environment variable is set
+
+    :return: registered :class:`SamplingProfiler` or `None` if profiling is off
+    """
+    if not ProfilingConfig.PROFILE_DIR:
+        return None
+    rlogger.info('Profiling model calls to %s', ProfilingConfig.PROFILE_DIR)
+    profiler = SamplingProfiler(ProfilingConfig.PROFILE_DIR, ProfilingConfig.PROFILE_INTERVAL,
+                                ProfilingConfig.PROFILE_DUMP_INTERVAL)
+    add_hook(profiler)
+    atexit.register(profiler.stop)
+    return profiler
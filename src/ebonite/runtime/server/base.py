@@ -1,11 +1,23 @@
+import inspect
+import json
+import socket
 from abc import abstractmethod
-from typing import Dict, List
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Union
 
-from pyjackson import deserialize
+from pyjackson import deserialize, serialize
+from pyjackson.core import BUILTIN_TYPES
 from pyjackson.errors import DeserializationError, SerializationError
+from pyjackson.generics import Serializer, StaticSerializer
 
 from ebonite.config import Config, Core, Param
+from ebonite.core.objects.dataset_type import BytesDatasetType, ColumnarDatasetTypeMixin, binary_content_type
 from ebonite.runtime.interface import ExecutionError, Interface, InterfaceLoader
+from ebonite.runtime.interface.batching import is_batchable
+from ebonite.runtime.interface.cache import cache_configured_methods
+from ebonite.runtime.profiling import profile_configured
+from ebonite.runtime.server.metrics import RequestTracker
+from ebonite.runtime.server.prefork import PreforkMaster, create_listening_socket
 from ebonite.runtime.utils import registering_type
 from ebonite.utils.classproperty import classproperty
 from ebonite.utils.log import rlogger
@@ -53,10 +65,24 @@ class Server(_ServerBase):
         :return: nothing
         """
 
-        interface = loader.load()
+        interface = self.load_interface(loader)
         rlogger.info('Running server %s', self)
         return self.run(interface)
 
+    @staticmethod
+    def load_interface(loader: InterfaceLoader) -> Interface:
+        """
+        Loads an interface from given loader, enables caching of methods configured
+        via `EBONITE_CACHE_METHODS` environment variable and profiling configured via `EBONITE_PROFILE_DIR`
+
+        :param loader: loader to take interface from
+        :return: interface
+        """
+        interface = loader.load()
+        cache_configured_methods(interface)
+        profile_configured()
+        return interface
+
     @classproperty
     def type(cls):
         return f'{cls.__module__}.{cls.__name__}'
@@ -65,14 +91,23 @@ class Server(_ServerBase):
 class HTTPServerConfig(Config):
     host = Param('host', default='0.0.0.0', parser=str)
     port = Param('port', default='9000', parser=int)
+    workers = Param('workers', default='1', doc='number of pre-forked worker processes', parser=int)
+    worker_max_requests = Param('worker_max_requests', default='0',
+                                doc='number of requests after which pre-forked worker is recycled, 0 means never',
+                                parser=int)
+    stream_chunk_size = Param('stream_chunk_size', default='100',
+                              doc='number of lines of streaming request which are executed at once', parser=int)
 
 
 if Core.DEBUG:
     HTTPServerConfig.log_params()
 
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
 
 class MalformedHTTPRequestException(Exception):
     def __init__(self, message: str):
+        super().__init__(message)
         self._message = message
 
     def code(self):
@@ -82,37 +117,183 @@ class MalformedHTTPRequestException(Exception):
         return {'ok': False, 'error': self._message}
 
 
+def create_deserializer(as_class) -> Callable[[object], object]:
+    """
+    Creates function which deserializes objects of given type. Unlike :func:`pyjackson.deserialize`
+    it resolves how to deserialize given type once, so that this is not repeated for each object
+
+    :param as_class: type or serializer
+    :return: deserialization function
+    """
+    if as_class is Any or (isinstance(as_class, Hashable) and as_class in BUILTIN_TYPES):
+        return lambda obj: obj
+    if inspect.isclass(as_class) and issubclass(as_class, Serializer) and \
+            (issubclass(as_class, StaticSerializer) or as_class._is_dynamic):
+        # e.g. DatasetType instances
+        return as_class.deserialize
+    return partial(deserialize, as_class=as_class)
+
+
+def create_json_decoder(interface: Interface, method: str) -> Callable[[dict], dict]:
+    """
+    Creates function which checks and deserializes JSON arguments of given interface method
+
+    :param interface: interface to create decoder for
+    :param method: method name
+    :return: function which takes JSON request and returns dict of deserialized arguments
+    :raise MalformedHTTPRequestException: if request does not match method signature
+    """
+    deserializers = {a.name: create_deserializer(a.type) for a in interface.exposed_method_args(method)}
+    arg_names = set(deserializers.keys())
+
+    def decode(request_json: dict) -> dict:
+        if not isinstance(request_json, dict):
+            raise MalformedHTTPRequestException(f'Invalid request: arguments should be an object with keys {arg_names}')
+        if not arg_names.issuperset(request_json.keys()):
+            raise MalformedHTTPRequestException(
+                f'Invalid request: arguments are {arg_names}, got {set(request_json.keys())}')
+        try:
+            return {k: deserializers[k](v) for k, v in request_json.items()}
+        except DeserializationError as e:
+            raise MalformedHTTPRequestException(e.args[0])
+
+    return decode
+
+
 class BaseHTTPServer(Server):
     """
     HTTP-based Ebonite runtime server.
 
     Interface definition is exposed for clients via HTTP GET call to `/interface.json`,
     method calls - via HTTP POST calls to `/<name>`,
-    server health check - via HTTP GET call to `/health`.
+    server health check - via HTTP GET call to `/health`,
+    server metrics in Prometheus text format (see :class:`.ServerMetrics`) - via HTTP GET call to `/metrics`.
 
     Host to which server binds is configured via `EBONITE_HOST` environment variable:
     default is `0.0.0.0` which means any local or remote, for rejecting remote connections use `localhost` instead.
 
     Port to which server binds to is configured via `EBONITE_PORT` environment variable: default is 9000.
+
+    If `EBONITE_WORKERS` environment variable is greater than 1, server runs in pre-fork mode:
+    interface is loaded once and then given number of worker processes share it (copy-on-write) and server socket.
+    Workers are recycled after `EBONITE_WORKER_MAX_REQUESTS` requests (if set) and could be restarted with `SIGHUP`.
+
+    Each method is also exposed via HTTP POST calls to `/<name>/batch` which accepts JSON list of method arguments
+    and `/<name>/stream` which accepts newline-delimited JSON (one line per method arguments) and streams
+    newline-delimited JSON results back as soon as each chunk of `EBONITE_STREAM_CHUNK_SIZE` lines is executed.
+    Each result is either `{"ok": true, "data": ...}` or `{"ok": false, "error": ...}`.
+    Methods which return binary data (:class:`.BytesDatasetType`) are not exposed this way.
+    Calls of methods which input and output types are :class:`.BatchableDatasetTypeMixin` are grouped
+    into single call of concatenated input.
+
+    Methods with single argument of :class:`.BinaryDatasetTypeMixin` type also accept requests with its binary
+    content type (e.g. `application/x-npy`) instead of JSON. Binary responses are returned for requests which
+    have `Accept` header with content type of method output type.
+    Methods which output type is :class:`.ColumnarDatasetTypeMixin` (e.g. dataframes) return JSON output
+    in columnar form for requests with `orient=columns` query parameter.
     """
 
+    def start(self, loader: InterfaceLoader):
+        """
+        Starts server "execution" for given loader: loads an interface and "executes" it,
+        possibly in a number of pre-forked worker processes
+
+        :param loader: loader to take interface from
+        :return: nothing
+        """
+
+        if HTTPServerConfig.workers <= 1:
+            return super().start(loader)
+
+        interface = self.load_interface(loader)
+        sock = create_listening_socket(HTTPServerConfig.host, HTTPServerConfig.port)
+        rlogger.info('Running server %s with %s workers on %s:%s', self, HTTPServerConfig.workers,
+                     HTTPServerConfig.host, HTTPServerConfig.port)
+        max_requests = HTTPServerConfig.worker_max_requests
+        PreforkMaster(lambda s: self.run_worker(interface, s, max_requests), HTTPServerConfig.workers).run(sock)
+
+    def run_worker(self, interface: Interface, sock: socket.socket, max_requests: int):
+        """
+        Serves given interface from given listening socket in pre-fork worker process.
+        Should be implemented by subclasses which support pre-fork mode.
+
+        :param interface: interface to "execute"
+        :param sock: listening socket shared between workers
+        :param max_requests: number of requests to serve before returning, 0 means no limit
+        :return: nothing
+        """
+
+        raise NotImplementedError(f'{type(self).__name__} does not support pre-fork mode')
+
     @staticmethod
-    def _deserialize_json(interface: Interface, method: str, request_json: dict):
-        args = {a.name: a for a in interface.exposed_method_args(method)}
+    def _binary_request_arg(interface: Interface, method: str, content_type: Optional[str]):
+        args = interface.exposed_method_args(method)
+        if len(args) != 1 or content_type is None or binary_content_type(args[0].type) != content_type:
+            return None
+        return args[0]
+
+    @staticmethod
+    def _deserialize_binary(interface: Interface, method: str, content_type: str, payload: bytes):
+        arg = BaseHTTPServer._binary_request_arg(interface, method, content_type)
+        if arg is None:
+            raise MalformedHTTPRequestException(f'Invalid request: method {method} does not accept {content_type}')
         try:
-            return {k: deserialize(v, args[k].type) for k, v in request_json.items()}
-        except KeyError:
-            raise MalformedHTTPRequestException(
-                f'Invalid request: arguments are {set(args.keys())}, got {set(request_json.keys())}')
+            return {arg.name: arg.type.deserialize_binary(payload)}
         except DeserializationError as e:
             raise MalformedHTTPRequestException(e.args[0])
 
     @staticmethod
-    def _execute_method(interface: Interface, method: str, request_data, ebonite_id: str):
+    def _binary_response_type(interface: Interface, method: str, accept: Optional[str]) -> Optional[str]:
+        content_type = binary_content_type(interface.exposed_method_returns(method).type)
+        if accept is None or content_type is None or content_type not in accept:
+            return None
+        return content_type
+
+    @staticmethod
+    def _columnar_response(interface: Interface, method: str, orient: Optional[str]) -> bool:
+        if orient is None or orient == 'records':
+            return False
+        if orient != 'columns':
+            raise MalformedHTTPRequestException(f'Invalid request: unknown orient {orient}, '
+                                                f'expected "records" or "columns"')
+        if not issubclass(interface.exposed_method_returns(method).type, ColumnarDatasetTypeMixin):
+            raise MalformedHTTPRequestException(f'Invalid request: output of method {method} '
+                                                f'could not be serialized in columnar form')
+        return True
+
+    @staticmethod
+    def _check_json_output(interface: Interface, method: str):
+        if issubclass(interface.exposed_method_returns(method).type, BytesDatasetType):
+            raise MalformedHTTPRequestException(f'Invalid request: method {method} returns binary data which '
+                                                f'could not be written to JSON, call /{method} instead')
+
+    @staticmethod
+    def _execute_method(interface: Interface, method: str, request_data, ebonite_id: str, binary: bool = False,
+                        tracker: RequestTracker = None, columnar: bool = False):
         rlogger.debug('Got request for [%s]: %s', ebonite_id, request_data)
+        tracker = tracker or RequestTracker()
+        out_type = interface.exposed_method_returns(method).type
 
         try:
-            result = interface.execute(method, request_data)
+            if binary:
+                with tracker.phase('model'):
+                    result = interface.execute(method, request_data, raw=True)
+                with tracker.phase('serialize'):
+                    result = out_type.serialize_binary(result)
+            elif columnar:
+                with tracker.phase('model'):
+                    result = interface.execute(method, request_data, raw=True)
+                with tracker.phase('serialize'):
+                    result = out_type.serialize_columnar(result)
+            elif method in interface.raw_executors and method not in getattr(interface, 'caches', {}):
+                # cached results are stored serialized, so for cached methods serialization is not measured
+                with tracker.phase('model'):
+                    result = interface.execute(method, request_data, raw=True)
+                with tracker.phase('serialize'):
+                    result = serialize(result, out_type)
+            else:
+                with tracker.phase('model'):
+                    result = interface.execute(method, request_data)
         except (ExecutionError, SerializationError) as e:
             raise MalformedHTTPRequestException(e.args[0])
 
@@ -120,5 +301,109 @@ class BaseHTTPServer(Server):
             rlogger.debug('Got response for [%s]: <binary content>', ebonite_id)
             return result
 
-        rlogger.debug('Got response for [%s]: %s', result)
+        rlogger.debug('Got response for [%s]: %s', ebonite_id, result)
         return {'ok': True, 'data': result}
+
+    @staticmethod
+    def _execute_batch(interface: Interface, method: str, payloads: List[Union[dict, MalformedHTTPRequestException]],
+                       ebonite_id: str, decode: Callable[[dict], dict]) -> List[dict]:
+        """
+        Executes given method for each of given JSON payloads
+
+        :param interface: interface to execute method of
+        :param method: method name
+        :param payloads: list of JSON method arguments (or errors of their parsing)
+        :param ebonite_id: request id
+        :param decode: decoder of method arguments, see :func:`create_json_decoder`
+        :return: list of responses for each payload
+        """
+        BaseHTTPServer._check_json_output(interface, method)
+        if not isinstance(payloads, list):
+            raise MalformedHTTPRequestException('Invalid request: batch should be a list of method arguments')
+
+        responses: List[Optional[dict]] = [None] * len(payloads)
+        requests_data = {}
+        for i, payload in enumerate(payloads):
+            try:
+                if isinstance(payload, MalformedHTTPRequestException):
+                    raise payload
+                requests_data[i] = decode(payload)
+            except MalformedHTTPRequestException as e:
+                responses[i] = e.response_body()
+
+        if len(requests_data) > 1:
+            results = BaseHTTPServer._execute_concatenated(interface, method, list(requests_data.values()), ebonite_id)
+            if results is not None:
+                for i, result in zip(requests_data.keys(), results):
+                    responses[i] = {'ok': True, 'data': result}
+                return responses
+
+        for i, request_data in requests_data.items():
+            try:
+                responses[i] = BaseHTTPServer._execute_method(interface, method, request_data, ebonite_id)
+            except MalformedHTTPRequestException as e:
+                responses[i] = e.response_body()
+            except Exception as e:
+                rlogger.exception('Error for [%s] while executing %s', ebonite_id, method)
+                responses[i] = {'ok': False, 'error': str(e)}
+        return responses
+
+    @staticmethod
+    def _execute_concatenated(interface: Interface, method: str, requests_data: List[dict],
+                              ebonite_id: str) -> Optional[list]:
+        args = interface.exposed_method_args(method)
+        out_type = interface.exposed_method_returns(method).type
+        if len(args) != 1 or not is_batchable(args[0].type, out_type):
+            return None
+
+        arg = args[0]
+        try:
+            sizes = [arg.type.get_batch_size(d[arg.name]) for d in requests_data]
+            result = interface.execute(method, {arg.name: arg.type.concat([d[arg.name] for d in requests_data])},
+                                       raw=True)
+            if out_type.get_batch_size(result) != sum(sizes):
+                raise ValueError('concatenated call returned output of unexpected size')
+            return [out_type.serialize(part) for part in out_type.split(result, sizes)]
+        except Exception as e:
+            rlogger.debug('Concatenated call for [%s] failed, falling back to separate calls: %s', ebonite_id, e)
+            return None
+
+    @staticmethod
+    def _parse_ndjson_line(line: Union[bytes, str]) -> Optional[Union[dict, MalformedHTTPRequestException]]:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            return json.loads(line)
+        except ValueError as e:
+            return MalformedHTTPRequestException(f'Invalid request: line is not a valid JSON: {e}')
+
+    @staticmethod
+    def _dump_ndjson(responses: List[dict]) -> bytes:
+        return ''.join(json.dumps(r) + '\n' for r in responses).encode('utf-8')
+
+    @staticmethod
+    def _execute_stream(interface: Interface, method: str, lines: Iterable[Union[bytes, str]],
+                        ebonite_id: str, decode: Callable[[dict], dict]) -> Iterator[bytes]:
+        """
+        Executes given method for each line of newline-delimited JSON by chunks
+
+        :param interface: interface to execute method of
+        :param method: method name
+        :param lines: lines of request
+        :param ebonite_id: request id
+        :param decode: decoder of method arguments, see :func:`create_json_decoder`
+        :return: iterator over chunks of newline-delimited JSON responses
+        """
+        chunk = []
+        for line in lines:
+            payload = BaseHTTPServer._parse_ndjson_line(line)
+            if payload is None:
+                continue
+            chunk.append(payload)
+            if len(chunk) >= HTTPServerConfig.stream_chunk_size:
+                yield BaseHTTPServer._dump_ndjson(
+                    BaseHTTPServer._execute_batch(interface, method, chunk, ebonite_id, decode))
+                chunk = []
+        if chunk:
+            yield BaseHTTPServer._dump_ndjson(BaseHTTPServer._execute_batch(interface, method, chunk, ebonite_id, decode))
@@ -0,0 +1,163 @@
+import contextlib
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from ebonite.runtime.interface import Interface
+
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (100, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8)
+
+#: phases of method call: request deserialization, interface method execution and result serialization
+PHASES = ('deserialize', 'model', 'serialize')
+
+
+class Histogram:
+    """
+    Histogram of observed values with fixed upper bounds of buckets
+
+    :param buckets: sorted upper bounds of buckets
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(list(self.buckets) + ['+Inf'], self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum{{{labels}}} {self.sum}')
+        lines.append(f'{name}_count{{{labels}}} {self.count}')
+        return lines
+
+
+class RequestTracker:
+    """
+    Collects measurements of a single request. Created by :meth:`ServerMetrics.track`
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.request_size: Optional[int] = None
+        self.response_size: Optional[int] = None
+        self.error = False
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Context manager which measures duration of given phase of request processing
+
+        :param name: one of :data:`PHASES`
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0) + time.perf_counter() - start
+
+
+class ServerMetrics:
+    """
+    Thread-safe storage of server metrics which is rendered in Prometheus text format.
+
+    For each method it keeps number of requests and errors, number of requests in flight,
+    histograms of request and response sizes and histograms of duration of each of :data:`PHASES`.
+    Each process keeps its own metrics, so in pre-fork mode `/metrics` reports metrics of worker which serves it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.in_flight = defaultdict(int)
+        self.latency = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self.request_size = defaultdict(lambda: Histogram(SIZE_BUCKETS))
+        self.response_size = defaultdict(lambda: Histogram(SIZE_BUCKETS))
+
+    @contextlib.contextmanager
+    def track(self, method: str) -> Iterator[RequestTracker]:
+        """
+        Context manager which tracks request to given method, exception raised inside counts it as an error
+
+        :param method: method name
+        :return: :class:`RequestTracker` to put measurements of request to
+        """
+        tracker = RequestTracker()
+        with self._lock:
+            self.in_flight[method] += 1
+        try:
+            yield tracker
+        except BaseException:
+            tracker.error = True
+            raise
+        finally:
+            self._record(method, tracker)
+
+    def _record(self, method: str, tracker: RequestTracker):
+        with self._lock:
+            self.in_flight[method] -= 1
+            self.requests[method] += 1
+            if tracker.error:
+                self.errors[method] += 1
+            for phase, duration in tracker.phases.items():
+                self.latency[(method, phase)].observe(duration)
+            if tracker.request_size is not None:
+                self.request_size[method].observe(tracker.request_size)
+            if tracker.response_size is not None:
+                self.response_size[method].observe(tracker.response_size)
+
+    def render(self, interface: Interface = None) -> str:
+        """
+        :param interface: interface to report cache hits and misses of
+        :return: metrics in Prometheus text format
+        """
+        lines = []
+
+        def add(name, kind, doc, values):
+            lines.append(f'# HELP {name} {doc}')
+            lines.append(f'# TYPE {name} {kind}')
+            for labels, value in sorted(values.items()):
+                if isinstance(value, Histogram):
+                    lines.extend(value.render(name, labels))
+                else:
+                    lines.append(f'{name}{{{labels}}} {value}')
+
+        with self._lock:
+            add('ebonite_requests_total', 'counter', 'Number of method requests',
+                {_labels(method=m): v for m, v in self.requests.items()})
+            add('ebonite_request_errors_total', 'counter', 'Number of failed method requests',
+                {_labels(method=m): v for m, v in self.errors.items()})
+            add('ebonite_requests_in_flight', 'gauge', 'Number of method requests being processed',
+                {_labels(method=m): v for m, v in self.in_flight.items()})
+            add('ebonite_request_phase_seconds', 'histogram', 'Duration of phases of method requests processing',
+                {_labels(method=m, phase=p): h for (m, p), h in self.latency.items()})
+            add('ebonite_request_size_bytes', 'histogram', 'Size of method requests',
+                {_labels(method=m): h for m, h in self.request_size.items()})
+            add('ebonite_response_size_bytes', 'histogram', 'Size of method responses',
+                {_labels(method=m): h for m, h in self.response_size.items()})
+
+        caches = getattr(interface, 'caches', {})
+        if caches:
+            add('ebonite_cache_hits_total', 'counter', 'Number of method results taken from cache',
+                {_labels(method=m): c.hits for m, c in caches.items()})
+            add('ebonite_cache_misses_total', 'counter', 'Number of method results missing in cache',
+                {_labels(method=m): c.misses for m, c in caches.items()})
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(**labels) -> str:
+    return ','.join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in labels.items())
@@ -0,0 +1,154 @@
+import gc
+import os
+import signal
+import socket
+import time
+from typing import Callable, List, Optional, Set
+
+from ebonite.utils.log import rlogger
+
+_WORKER_SIGNALS = (signal.SIGTERM, signal.SIGINT, signal.SIGHUP)
+
+
+def create_listening_socket(host: str, port: int, backlog: int = 128) -> socket.socket:
+    """
+    Creates socket bound to given host and port which could be shared by forked worker processes
+
+    :param host: host to bind to
+    :param port: port to bind to
+    :param backlog: max number of pending connections
+    :return: listening socket
+    """
+    family, kind, proto, _, address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM,
+                                                         flags=socket.AI_PASSIVE)[0]
+    sock = socket.socket(family, kind, proto)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(address)
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class PreforkMaster:
+    """
+    Master process of pre-fork serving mode.
+
+    Forks given number of workers which serve requests from the same listening socket.
+    Everything loaded before :meth:`run` is called (e.g. models) is shared between workers copy-on-write.
+    Workers which exit (e.g. recycled after serving max number of requests) are replaced with new ones.
+    `SIGHUP` gracefully restarts all workers one at a time: replacement of a worker is spawned before it is stopped
+    and next worker is stopped only after previous one exits, so that service keeps accepting requests.
+    `SIGTERM` and `SIGINT` gracefully stop workers and master itself.
+
+    :param worker: function which serves requests from given socket in worker process,
+        it should return when worker needs to be recycled and handle `SIGTERM` as a graceful shutdown request
+    :param workers: number of worker processes
+    """
+
+    respawn_delay = 1
+
+    def __init__(self, worker: Callable[[socket.socket], None], workers: int):
+        self.worker = worker
+        self.workers = workers
+        self.pids: Set[int] = set()
+        self.stopping = False
+        self.sock: Optional[socket.socket] = None
+        #: old workers to be restarted
+        self.restarting: List[int] = []
+        #: old workers which were stopped after their replacements were spawned
+        self.replaced: Set[int] = set()
+
+    def run(self, sock: socket.socket):
+        """
+        Forks workers and supervises them until master is stopped
+
+        :param sock: listening socket to serve requests from
+        """
+        # objects created so far will not be touched by cyclic GC, thus their memory pages stay shared
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
+
+        self.sock = sock
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGHUP, self._restart)
+
+        for _ in range(self.workers):
+            self._spawn(sock)
+
+        while self.pids:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            self.pids.discard(pid)
+            if self.stopping:
+                continue
+            if pid in self.replaced:
+                self.replaced.discard(pid)
+                self._restart_next()
+                continue
+            if status != 0:
+                rlogger.warning('Worker %s exited with status %s', pid, status)
+                time.sleep(self.respawn_delay)
+            self._spawn(sock)
+
+        sock.close()
+        rlogger.info('All workers stopped')
+
+    def _spawn(self, sock: socket.socket):
+        # signals are blocked until worker resets master handlers, otherwise they could be delivered to these handlers
+        signal.pthread_sigmask(signal.SIG_BLOCK, _WORKER_SIGNALS)
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                for sig in _WORKER_SIGNALS:
+                    signal.signal(sig, signal.SIG_DFL)
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, _WORKER_SIGNALS)
+                self.worker(sock)
+            except KeyboardInterrupt:
+                pass
+            except BaseException:
+                rlogger.exception('Worker %s failed', os.getpid())
+                code = 1
+            finally:
+                os._exit(code)
+
+        self.pids.add(pid)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, _WORKER_SIGNALS)
+        rlogger.info('Started worker %s', pid)
+        if self.stopping:
+            # master was stopped while this worker was being spawned
+            os.kill(pid, signal.SIGTERM)
+
+    def _signal_workers(self, sig):
+        for pid in list(self.pids):
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def _stop(self, signum, frame):
+        rlogger.info('Stopping workers...')
+        self.stopping = True
+        self._signal_workers(signal.SIGTERM)
+
+    def _restart(self, signum, frame):
+        rlogger.info('Restarting workers...')
+        self.restarting = [pid for pid in self.pids if pid not in self.replaced]
+        if not self.replaced:
+            self._restart_next()
+
+    def _restart_next(self):
+        while self.restarting and not self.stopping:
+            pid = self.restarting.pop(0)
+            if pid not in self.pids:  # exited and was respawned already
+                continue
+            self._spawn(self.sock)
+            self.replaced.add(pid)
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            return
@@ -5,6 +5,7 @@ import typing
 from itertools import chain
 from unittest.mock import MagicMock, _CallList
 
+import numpy as np
 import pandas as pd
 import pytest
 from _pytest.doctest import DoctestModule
@@ -163,6 +164,35 @@ def artifact():
     return Blobs({'kek': InMemoryBlob(b'kek')})
 
 
+PIPELINE_CALLS = []
+
+
+def double_array(data: np.ndarray):
+    PIPELINE_CALLS.append(len(data))
+    return data * 2
+
+
+def sum_frame(df: pd.DataFrame):
+    assert isinstance(df, pd.DataFrame)
+    return (df['a'] + df['b']).to_numpy()
+
+
+@pytest.fixture
+def pipeline_calls() -> list:
+    """sizes of inputs of first step of `converting_pipeline`"""
+    PIPELINE_CALLS.clear()
+    return PIPELINE_CALLS
+
+
+@pytest.fixture
+def converting_pipeline(pipeline_calls):
+    """pipeline of array and dataframe models, which output has to be converted between steps"""
+    array_model = Model.create(double_array, np.array([[1., 2.]]), 'double')
+    frame_model = Model.create(sum_frame, pd.DataFrame({'a': [1.], 'b': [2.]}), 'sum')
+    pipeline_calls.clear()
+    return array_model.as_pipeline().append(frame_model)
+
+
 class DatasetTypeDummy(DatasetType):
     type = 'mock_dataset_type'
 
@@ -85,3 +85,35 @@ def test_func_model_dump_load(tmpdir, wrapper: ModelWrapper, numpy_data):
 
     # we could not compare models directly as they are functions
     np.testing.assert_almost_equal(before_model(numpy_data), after_model(numpy_data))
+
+
+def _cwd(data):
+    return os.getcwd()
+
+
+@pytest.mark.parametrize('switch', [True, False])
+def test_func_model_curdir(tmpdir, numpy_data, monkeypatch, switch):
+    monkeypatch.setenv('EBONITE_SWITCH_CURDIR', str(switch).lower())
+    wrapper = ModelAnalyzer.analyze(_cwd, input_data=numpy_data)
+    with wrapper.dump() as artifact:
+        artifact.materialize(tmpdir)
+    wrapper.load(tmpdir)
+
+    assert wrapper.needs_curdir is switch
+    cwd = os.getcwd()
+    assert wrapper.call_method('predict', numpy_data) == (str(tmpdir) if switch else cwd)
+    assert os.getcwd() == cwd
+
+
+def test_summer_model_curdir(tmpdir, summer_model, numpy_data, monkeypatch):
+    def fail(path):
+        raise AssertionError('current directory should not be switched')
+
+    monkeypatch.setattr(_SummerModelWrapper, 'needs_curdir', False)
+    monkeypatch.setattr('ebonite.core.objects.wrapper.switch_curdir', fail)
+    wrapper = ModelAnalyzer.analyze(summer_model, input_data=numpy_data)
+    with wrapper.dump() as artifact:
+        artifact.materialize(tmpdir)
+    wrapper.load(tmpdir)
+
+    assert wrapper.call_method('predict', numpy_data) == 6
@@ -2,7 +2,7 @@ import os
 
 import pytest
 
-from ebonite.core.objects.artifacts import Blobs, InMemoryBlob, _RelativePathWrapper
+from ebonite.core.objects.artifacts import Blobs, InMemoryBlob, LocalFileBlob, SpooledBlobWriter, _RelativePathWrapper
 
 
 @pytest.fixture
@@ -53,3 +53,21 @@ def test_artifact_collection__blob_dict(artifact_collection):
             assert blob_dict[path] == InMemoryBlob(value)
 
         _check(condition, [])
+
+
+def test_spooled_blob_writer__in_memory():
+    with SpooledBlobWriter(10) as f:
+        f.write(b'12345')
+        f.write(memoryview(b'67890'))
+        assert f.blob() == InMemoryBlob(b'1234567890')
+
+
+def test_spooled_blob_writer__spooled():
+    with SpooledBlobWriter(10) as f:
+        f.write(b'12345')
+        f.write(b'67890!')
+        assert f.tell() == 11
+        blob = f.blob()
+        assert isinstance(blob, LocalFileBlob)
+        assert blob.bytes() == b'1234567890!'
+    assert not os.path.exists(blob.path)
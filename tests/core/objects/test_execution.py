@@ -0,0 +1,107 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ebonite.core.analyzer.dataset import DatasetAnalyzer
+from ebonite.core.objects.core import Model, Pipeline
+from ebonite.core.objects.execution import find_converter
+from tests.conftest import double_array
+
+
+def test_find_converter():
+    array_type = DatasetAnalyzer.analyze(np.array([[1., 2.]]))
+    frame_type = DatasetAnalyzer.analyze(pd.DataFrame({'a': [1.], 'b': [2.]}))
+
+    assert find_converter(array_type, DatasetAnalyzer.analyze(np.array([[3., 4.]]))) is None
+    assert find_converter(array_type, DatasetAnalyzer.analyze(np.array([1.]))) is None
+
+    to_frame = find_converter(array_type, frame_type)
+    pd.testing.assert_frame_equal(to_frame(np.array([[1., 2.]])), pd.DataFrame({'a': [1.], 'b': [2.]}))
+    to_array = find_converter(frame_type, array_type)
+    np.testing.assert_array_equal(to_array(pd.DataFrame({'b': [2.], 'a': [1.]})), np.array([[1., 2.]]))
+
+
+def test_pipeline_plan(converting_pipeline):
+    plan = converting_pipeline.plan()
+    assert [s.converter is not None for s in plan.steps] == [False, True]
+    assert plan.batchable
+
+    np.testing.assert_array_equal(converting_pipeline.run(np.array([[1., 2.], [3., 4.]])), np.array([6., 14.]))
+
+
+def test_pipeline_plan__cached(converting_pipeline):
+    plan = converting_pipeline.plan()
+    converting_pipeline.run(np.array([[1., 2.]]))
+    assert converting_pipeline.plan() is plan
+
+    converting_pipeline.append(Model.create(double_array, np.array([1.]), 'double_sum'))
+    assert converting_pipeline.plan() is not plan
+    assert len(converting_pipeline.plan().steps) == 3
+
+    plan = converting_pipeline.plan()
+    converting_pipeline.steps.pop()
+    assert converting_pipeline.plan() is not plan
+
+
+def test_pipeline_plan__unknown_method(converting_pipeline):
+    converting_pipeline.steps[1].method_name = 'unknown'
+    with pytest.raises(ValueError, match='unknown method unknown'):
+        converting_pipeline.plan()
+
+
+def test_pipeline_run_batch(converting_pipeline, pipeline_calls):
+    inputs = [np.array([[1., 2.]]), np.array([[3., 4.], [5., 6.]])]
+    outputs = converting_pipeline.run_batch(inputs)
+
+    assert pipeline_calls == [3]
+    assert len(outputs) == 2
+    np.testing.assert_array_equal(outputs[0], np.array([6.]))
+    np.testing.assert_array_equal(outputs[1], np.array([14., 22.]))
+
+
+BARRIER = []
+
+
+def feature(data: np.ndarray):
+    if BARRIER:
+        # would time out if features were computed one by one
+        BARRIER[0].wait()
+    return data.sum(axis=1)
+
+
+def combine(features):
+    return features[0] + features[1] + features[2]
+
+
+@pytest.fixture
+def dag_pipeline() -> Pipeline:
+    data = np.array([[1., 2.]])
+    features = [Model.create(feature, data, f'feature{i}') for i in range(3)]
+    combiner = Model.create(combine, [feature(data)] * 3, 'combiner')
+
+    pipeline = features[0].as_pipeline()
+    for model in features[1:]:
+        pipeline.append(model, inputs=[Pipeline.INPUT])
+    return pipeline.append(combiner, inputs=[0, 1, 2])
+
+
+def test_dag_pipeline(dag_pipeline):
+    plan = dag_pipeline.plan()
+    assert plan.levels == [[0, 1, 2], [3]]
+    assert plan.parallel and not plan.linear
+
+    BARRIER.append(threading.Barrier(3, timeout=5))
+    try:
+        np.testing.assert_array_equal(dag_pipeline.run(np.array([[1., 2.], [3., 4.]])), np.array([9., 21.]))
+    finally:
+        BARRIER.clear()
+
+
+def test_dag_pipeline__wrong_inputs(converting_pipeline):
+    model = converting_pipeline.models['sum']
+    with pytest.raises(ValueError):
+        converting_pipeline.append(model, inputs=[2])
+    with pytest.raises(ValueError):
+        converting_pipeline.append(model, inputs=[])
@@ -0,0 +1,83 @@
+import pytest
+
+from ebonite.core.objects.core import Model, Pipeline
+from ebonite.core.objects.hooks import CallHook, add_hook, data_size, remove_hook
+
+
+class RecordingHook(CallHook):
+    def __init__(self):
+        self.calls = []
+
+    def pre(self, info):
+        self.calls.append(('pre', info.name, info.input_size))
+
+    def post(self, info):
+        assert info.duration >= 0
+        parent = info.parent.name if info.parent is not None else None
+        self.calls.append(('post', info.name, info.output_size, parent, type(info.error)))
+
+
+@pytest.fixture
+def hook():
+    hook = RecordingHook()
+    add_hook(hook)
+    yield hook
+    remove_hook(hook)
+
+
+def double(a):
+    return a + a
+
+
+def size(a):
+    return len(a)
+
+
+def fail(a):
+    raise ValueError()
+
+
+@pytest.fixture
+def pipeline() -> Pipeline:
+    return Model.create(double, [1], 'double').as_pipeline().append(Model.create(size, [1], 'size'))
+
+
+def test_hooks__wrapper_call(hook):
+    wrapper = Model.create(double, [1], 'double').wrapper
+    assert wrapper.call_method('predict', [1, 2]) == [1, 2, 1, 2]
+    assert hook.calls == [('pre', 'predict', 2), ('post', 'predict', 4, None, type(None))]
+
+
+def test_hooks__pipeline_run(hook, pipeline):
+    pipeline.name = 'pipeline'
+    assert pipeline.run([1, 2]) == 4
+    assert hook.calls == [
+        ('pre', 'pipeline', 2),
+        ('pre', 'predict', 2),
+        ('post', 'predict', 4, 'pipeline', type(None)),
+        ('pre', 'predict', 4),
+        ('post', 'predict', None, 'pipeline', type(None)),
+        ('post', 'pipeline', None, None, type(None))
+    ]
+
+
+def test_hooks__failed_call(hook):
+    wrapper = Model.create(double, [1], 'fail').wrapper
+    wrapper.model = fail
+    with pytest.raises(ValueError):
+        wrapper.call_method('predict', [1])
+    assert hook.calls[-1] == ('post', 'predict', None, None, ValueError)
+
+
+def test_hooks__removed(pipeline):
+    hook = RecordingHook()
+    add_hook(hook)
+    remove_hook(hook)
+    pipeline.run([1])
+    assert hook.calls == []
+
+
+def test_data_size():
+    assert data_size([1, 2]) == 2
+    assert data_size('ab') is None
+    assert data_size(1) is None
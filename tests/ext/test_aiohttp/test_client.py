@@ -0,0 +1,60 @@
+import asyncio
+
+import numpy as np
+import pytest
+from aiohttp.test_utils import TestServer
+
+from ebonite.core.analyzer.dataset import DatasetAnalyzer
+from ebonite.ext.aiohttp.client import AsyncHTTPClient
+from ebonite.ext.aiohttp.server import AIOHTTPServer
+from ebonite.runtime import Interface
+from ebonite.runtime.interface import ExecutionError, expose
+
+array_type = DatasetAnalyzer.analyze(np.array([[1., 2.]]))
+
+
+class MyInterface(Interface):
+    def __init__(self):
+        self.calls = []
+
+    @expose
+    def double(self, vector: array_type) -> array_type:
+        self.calls.append(len(vector))
+        if (vector < 0).any():
+            raise ExecutionError('negative input')
+        return array_type.serialize(vector * 2)
+
+
+def _run(interface, scenario):
+    async def run():
+        async with TestServer(AIOHTTPServer()._create_app(interface)) as server:
+            async with AsyncHTTPClient(server.host, server.port) as client:
+                return await scenario(client)
+
+    return asyncio.get_event_loop().run_until_complete(run())
+
+
+def test_async_http_client__call():
+    async def scenario(client):
+        return await client.double(np.array([[1., 2.]]))
+
+    assert _run(MyInterface(), scenario).tolist() == [[2., 4.]]
+
+
+def test_async_http_client__error():
+    async def scenario(client):
+        with pytest.raises(ExecutionError):
+            await client.double(np.array([[-1., 2.]]))
+
+    _run(MyInterface(), scenario)
+
+
+def test_async_http_client__map():
+    interface = MyInterface()
+    data = np.arange(10, dtype=float).reshape(5, 2)
+
+    async def scenario(client):
+        return await client.map('double', data, chunk_size=2, workers=2)
+
+    assert _run(interface, scenario).tolist() == (data * 2).tolist()
+    assert sorted(interface.calls) == [1, 2, 2]
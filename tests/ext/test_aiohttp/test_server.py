@@ -0,0 +1,209 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from aiohttp import FormData
+from aiohttp.test_utils import TestClient, TestServer
+from pyjackson.core import ArgList, Field
+
+from ebonite.core.objects import DatasetType
+from ebonite.core.objects.dataset_type import BytesDatasetType
+from ebonite.ext.aiohttp.server import IN_FLIGHT_PER_WORKER, AIOHTTPServer, ExecutionPool
+from ebonite.runtime import Interface
+from ebonite.runtime.interface import expose
+
+
+class StrDataset(DatasetType):
+    type = 'aiohttp_str_type'
+
+    def get_spec(self) -> ArgList:
+        return [Field('', str, False)]
+
+    def deserialize(self, obj: dict) -> object:
+        return obj
+
+    def serialize(self, instance: object) -> dict:
+        return instance
+
+
+class BlockingInterface(Interface):
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    @expose
+    def method(self, argument: StrDataset()) -> StrDataset():
+        self.started.set()
+        self.release.wait(5)
+        return argument + 'a'
+
+
+def _run(interface, scenario):
+    async def run():
+        app = AIOHTTPServer()._create_app(interface)
+        async with TestClient(TestServer(app)) as client:
+            return await scenario(client)
+
+    return asyncio.get_event_loop().run_until_complete(run())
+
+
+async def _wait(event: threading.Event):
+    while not event.is_set():
+        await asyncio.sleep(.01)
+
+
+def test_execution_pool__unknown_executor():
+    with pytest.raises(ValueError):
+        ExecutionPool(BlockingInterface(), 'fiber', 1, 0)
+
+
+def test_health_is_not_blocked_by_method_call():
+    interface = BlockingInterface()
+
+    async def scenario(client):
+        call = asyncio.ensure_future(client.post('/method', json={'argument': 'a'}))
+        await _wait(interface.started)
+        health = await client.get('/health')
+        assert await health.text() == 'OK'
+        interface.release.set()
+        return await (await call).json()
+
+    assert _run(interface, scenario) == {'ok': True, 'data': 'aa'}
+
+
+def test_saturated_server_rejects_requests(monkeypatch):
+    monkeypatch.setenv('EBONITE_AIOHTTP_MAX_IN_FLIGHT', '1')
+    interface = BlockingInterface()
+
+    async def scenario(client):
+        call = asyncio.ensure_future(client.post('/method', json={'argument': 'a'}))
+        await _wait(interface.started)
+        rejected = await client.post('/method', json={'argument': 'b'})
+        interface.release.set()
+        await call
+        return rejected.status
+
+    assert _run(interface, scenario) == 503
+
+
+def test_saturated_server_rejects_requests__default_limit(monkeypatch):
+    monkeypatch.setenv('EBONITE_AIOHTTP_WORKERS', '1')
+    interface = BlockingInterface()
+
+    async def scenario(client):
+        # one request is executed, others wait for the only worker
+        calls = [asyncio.ensure_future(client.post('/method', json={'argument': 'a'}))
+                 for _ in range(IN_FLIGHT_PER_WORKER)]
+        await _wait(interface.started)
+        await asyncio.sleep(.2)
+        rejected = await client.post('/method', json={'argument': 'b'})
+        interface.release.set()
+        statuses = [(await call).status for call in calls]
+        return statuses, rejected.status
+
+    assert _run(interface, scenario) == ([200] * IN_FLIGHT_PER_WORKER, 503)
+
+
+def test_process_executor(monkeypatch):
+    monkeypatch.setenv('EBONITE_AIOHTTP_EXECUTOR', 'process')
+
+    class MyInterface(Interface):
+        @expose
+        def method(self, argument: StrDataset()) -> StrDataset():
+            return argument + 'a'
+
+    async def scenario(client):
+        return await (await client.post('/method', json={'argument': 'a'})).json()
+
+    assert _run(MyInterface(), scenario) == {'ok': True, 'data': 'aa'}
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_file_argument(monkeypatch, executor):
+    monkeypatch.setenv('EBONITE_AIOHTTP_EXECUTOR', executor)
+
+    class MyInterface(Interface):
+        @expose
+        def method(self, file: BytesDatasetType()) -> StrDataset():
+            return file.read().decode('utf-8') + 'a'
+
+    async def scenario(client):
+        data = FormData()
+        data.add_field('file', b'a', filename='file')
+        return await (await client.post('/method', data=data)).json()
+
+    assert _run(MyInterface(), scenario) == {'ok': True, 'data': 'aa'}
+
+
+def test_batch_and_stream(monkeypatch):
+    monkeypatch.setenv('EBONITE_STREAM_CHUNK_SIZE', '2')
+
+    class MyInterface(Interface):
+        @expose
+        def method(self, argument: StrDataset()) -> StrDataset():
+            return argument + 'a'
+
+    async def scenario(client):
+        batch = await (await client.post('/method/batch', json=[{'argument': 'a'}, {'argument': 'b'}])).json()
+
+        async def body():
+            for arg in 'abc':
+                yield (json.dumps({'argument': arg}) + '\n').encode('utf-8')
+
+        stream = await (await client.post('/method/stream', data=body())).text()
+        return batch, [json.loads(line)['data'] for line in stream.splitlines()]
+
+    batch, stream = _run(MyInterface(), scenario)
+    assert batch == {'ok': True, 'data': [{'ok': True, 'data': 'aa'}, {'ok': True, 'data': 'ba'}]}
+    assert stream == ['aa', 'ba', 'ca']
+
+
+def test_stream__long_lines():
+    class MyInterface(Interface):
+        @expose
+        def method(self, argument: StrDataset()) -> StrDataset():
+            return str(len(argument))
+
+    async def scenario(client):
+        body = '\n'.join(json.dumps({'argument': 'a' * size}) for size in (10 ** 5, 1, 2 * 10 ** 6))
+        stream = await (await client.post('/method/stream', data=body.encode('utf-8'))).text()
+        return [json.loads(line)['data'] for line in stream.splitlines()]
+
+    assert _run(MyInterface(), scenario) == ['100000', '1', '2000000']
+
+
+def test_batch_and_stream__binary_output():
+    class MyInterface(Interface):
+        @expose
+        def method(self, argument: StrDataset()) -> BytesDatasetType():
+            return argument.encode('utf-8')
+
+    async def scenario(client):
+        responses = [await client.post(route, json=[{'argument': 'a'}])
+                     for route in ('/method/batch', '/method/stream')]
+        return [(r.status, 'binary' in (await r.json())['error']) for r in responses]
+
+    assert _run(MyInterface(), scenario) == [(400, True), (400, True)]
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_metrics(monkeypatch, executor):
+    monkeypatch.setenv('EBONITE_AIOHTTP_EXECUTOR', executor)
+
+    class MyInterface(Interface):
+        @expose
+        def method(self, argument: StrDataset()) -> StrDataset():
+            return argument + 'a'
+
+    async def scenario(client):
+        await client.post('/method', json={'argument': 'a'})
+        await (await client.post('/method/stream', data=b'{"argument": "a"}\n{"argument": "b"}')).read()
+        return await (await client.get('/metrics')).text()
+
+    metrics = _run(MyInterface(), scenario)
+    assert 'ebonite_requests_total{method="method"} 1' in metrics
+    assert 'ebonite_requests_total{method="method/stream"} 1' in metrics
+    assert 'ebonite_request_errors_total{method="method"}' not in metrics
+    for phase in ('deserialize', 'model', 'serialize'):
+        assert f'ebonite_request_phase_seconds_count{{method="method",phase="{phase}"}} 1' in metrics
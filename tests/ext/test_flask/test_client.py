@@ -8,6 +8,7 @@ from requests.exceptions import HTTPError
 
 import ebonite
 from ebonite.ext.flask.client import HTTPClient
+from ebonite.ext.numpy.dataset import NPY_CONTENT_TYPE, ndarray_to_npy
 
 interface_json = '''
 {
@@ -111,3 +112,52 @@ def _mock_interface_json():
 def _mock_predict():
     responses.add(responses.POST, 'http://localhost:9000/predict',
                   json={'data': [0.7, 0.3]}, status=200)
+
+
+@responses.activate
+def test_http_client__binary(data_frame, ndarray):
+    _mock_interface_json()
+    responses.add(responses.POST, 'http://localhost:9000/predict',
+                  body=ndarray_to_npy(ndarray), content_type=NPY_CONTENT_TYPE, status=200)
+    assert np.array_equal(HTTPClient(binary=True).predict(data_frame), ndarray)
+    assert responses.calls[-1].request.headers['Accept'] == NPY_CONTENT_TYPE
+
+
+@responses.activate
+def test_http_client__retries(data_frame, ndarray):
+    _mock_interface_json()
+    responses.add(responses.POST, 'http://localhost:9000/predict', json={}, status=503)
+    _mock_predict()
+    assert np.array_equal(HTTPClient(backoff=0).predict(data_frame), ndarray)
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_http_client__retries_exhausted(data_frame):
+    _mock_interface_json()
+    responses.add(responses.POST, 'http://localhost:9000/predict', json={}, status=503)
+    with pytest.raises(HTTPError):
+        HTTPClient(retries=2, backoff=0).predict(data_frame)
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_http_client__map(ndarray):
+    _mock_interface_json()
+    _mock_predict()
+    data = DataFrame([[i, i] for i in range(5)], columns=['a', 'b'])
+    result = HTTPClient().map('predict', data, chunk_size=2)
+
+    assert result.tolist() == [0.7, 0.3] * 3
+    sent = sorted(json.loads(c.request.body)['vector']['values'][0]['a'] for c in responses.calls[1:])
+    assert sent == [0, 2, 4]
+
+
+@responses.activate
+def test_http_client__map_empty():
+    _mock_interface_json()
+    result = HTTPClient().map('predict', DataFrame({'a': [], 'b': []}, dtype='int64'))
+
+    assert isinstance(result, np.ndarray)
+    assert result.shape == (0,) and result.dtype == np.float64
+    assert len(responses.calls) == 1
@@ -1,12 +1,21 @@
 import json
 import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+import pandas as pd
 import pytest
+import requests
+from flask import Flask
 from pyjackson.core import ArgList, Field
 
+from ebonite.core.analyzer.dataset import DatasetAnalyzer
 from ebonite.core.objects import DatasetType
-from ebonite.ext.flask.server import FlaskServer
+from ebonite.core.objects.dataset_type import BytesDatasetType
+from ebonite.ext.flask.server import FlaskServer, create_wsgi_server
+from ebonite.ext.numpy.dataset import NPY_CONTENT_TYPE, ndarray_from_npy, ndarray_to_npy
 from ebonite.runtime import Interface
 from ebonite.runtime.interface import ExecutionError, expose
 
@@ -81,3 +90,195 @@ def test_errors(client):
     assert r.status_code == 400
     resp = r.get_json()
     assert resp == {'ok': False, 'error': 'message'}
+
+
+def test_binary_request_and_response(client):
+    array_type = DatasetAnalyzer.analyze(np.array([[1., 2.]]))
+
+    class MyInterface(Interface):
+        @expose
+        def method(self, vector: array_type) -> array_type:
+            return array_type.serialize(vector * 2)
+
+    server: FlaskServer = client.flask_server
+    server._prepare_app(client.application, MyInterface())
+
+    payload = ndarray_to_npy(np.array([[1., 2.], [3., 4.]]))
+    r = client.post('/method', data=payload, content_type=NPY_CONTENT_TYPE, headers={'Accept': NPY_CONTENT_TYPE})
+    assert r.status_code == 200
+    assert r.mimetype == NPY_CONTENT_TYPE
+    assert ndarray_from_npy(r.data).tolist() == [[2., 4.], [6., 8.]]
+
+    r = client.post('/method', data=payload, content_type=NPY_CONTENT_TYPE)
+    assert r.get_json() == {'ok': True, 'data': [[2., 4.], [6., 8.]]}
+
+    r = client.post('/method', data=b'garbage', content_type=NPY_CONTENT_TYPE)
+    assert r.status_code == 400
+
+
+def test_columnar_response(client):
+    df_type = DatasetAnalyzer.analyze(pd.DataFrame({'a': [1]}))
+
+    class MyInterface(Interface):
+        @expose
+        def method(self, data: df_type) -> df_type:
+            return df_type.serialize(data * 2)
+
+    server: FlaskServer = client.flask_server
+    server._prepare_app(client.application, MyInterface())
+
+    payload = json.dumps({'data': {'columns': {'a': [1, 2]}}})
+    r = client.post('/method?orient=columns', data=payload, content_type='application/json')
+    assert r.get_json() == {'ok': True, 'data': {'columns': {'a': [2, 4]}}}
+
+    r = client.post('/method', data=payload, content_type='application/json')
+    assert r.get_json() == {'ok': True, 'data': {'values': [{'a': 2}, {'a': 4}]}}
+
+    r = client.post('/method?orient=index', data=payload, content_type='application/json')
+    assert r.status_code == 400
+
+
+def test_batch_and_stream(client):
+    class MyInterface(Interface):
+        @expose
+        def method(self, argument: StrDataset()) -> StrDataset():
+            if argument == 'error':
+                raise ExecutionError('message')
+            return argument + 'a'
+
+    server: FlaskServer = client.flask_server
+    server._prepare_app(client.application, MyInterface())
+
+    r = client.post('/method/batch', json=[{'argument': 'a'}, {'argument': 'error'}, {'nonexisting': 'a'}])
+    assert r.status_code == 200
+    data = r.get_json()['data']
+    assert data[0] == {'ok': True, 'data': 'aa'}
+    assert data[1] == {'ok': False, 'error': 'message'}
+    assert data[2]['ok'] is False
+
+    assert client.post('/method/batch', json={'argument': 'a'}).status_code == 400
+
+    body = b'{"argument": "a"}\n\n{"argument": "b"}\nnot json\n{"argument": "c"}'
+    r = client.post('/method/stream', data=body, content_type='application/x-ndjson')
+    assert r.status_code == 200
+    lines = [json.loads(line) for line in r.data.decode('utf-8').splitlines()]
+    assert [line.get('data') for line in lines] == ['aa', 'ba', None, 'ca']
+    assert lines[2]['ok'] is False
+
+
+def test_batch_and_stream__decoder_created_once(client, monkeypatch):
+    import ebonite.ext.flask.server
+    import ebonite.runtime.server.base
+    original = ebonite.runtime.server.base.create_json_decoder
+    created = []
+
+    def create_json_decoder(interface, method):
+        created.append(method)
+        return original(interface, method)
+
+    monkeypatch.setattr(ebonite.ext.flask.server, 'create_json_decoder', create_json_decoder)
+    monkeypatch.setattr(ebonite.runtime.server.base, 'create_json_decoder', create_json_decoder)
+
+    class MyInterface(Interface):
+        @expose
+        def method(self, argument: StrDataset()) -> StrDataset():
+            return argument + 'a'
+
+    server: FlaskServer = client.flask_server
+    server._prepare_app(client.application, MyInterface())
+    assert created.count('method') == 3
+    created.clear()
+
+    for _ in range(3):
+        assert client.post('/method/batch', json=[{'argument': 'a'}]).get_json()['data'] == [{'ok': True, 'data': 'aa'}]
+        assert client.post('/method/stream', data=b'{"argument": "a"}\n{"argument": "b"}').status_code == 200
+    assert created == []
+
+
+def test_batch_and_stream__binary_output(client):
+    class MyInterface(Interface):
+        @expose
+        def method(self, argument: StrDataset()) -> BytesDatasetType():
+            return argument.encode('utf-8')
+
+    server: FlaskServer = client.flask_server
+    server._prepare_app(client.application, MyInterface())
+
+    for route in ('/method/batch', '/method/stream'):
+        r = client.post(route, data=b'[{"argument": "a"}]')
+        assert r.status_code == 400
+        assert 'binary' in r.get_json()['error']
+
+
+def test_batch_concatenates_batchable_inputs(client, monkeypatch):
+    monkeypatch.setenv('EBONITE_STREAM_CHUNK_SIZE', '2')
+    array_type = DatasetAnalyzer.analyze(np.array([[1., 2.]]))
+    calls = []
+
+    class MyInterface(Interface):
+        @expose
+        def method(self, vector: array_type) -> array_type:
+            calls.append(len(vector))
+            return array_type.serialize(vector * 2)
+
+    server: FlaskServer = client.flask_server
+    server._prepare_app(client.application, MyInterface())
+
+    r = client.post('/method/batch', json=[{'vector': [[1., 2.]]}, {'vector': [[3., 4.], [5., 6.]]}])
+    assert r.get_json()['data'] == [{'ok': True, 'data': [[2., 4.]]}, {'ok': True, 'data': [[6., 8.], [10., 12.]]}]
+    assert calls == [3]
+
+    body = '\n'.join(json.dumps({'vector': [[float(i), 0.]]}) for i in range(3))
+    r = client.post('/method/stream', data=body)
+    assert [json.loads(line)['data'] for line in r.data.splitlines()] == [[[0., 0.]], [[2., 0.]], [[4., 0.]]]
+    assert calls == [3, 2, 1]
+
+
+def test_metrics(client):
+    class MyInterface(Interface):
+        @expose
+        def method(self, argument: StrDataset()) -> StrDataset():
+            return argument + 'a'
+
+    server: FlaskServer = client.flask_server
+    server._prepare_app(client.application, MyInterface())
+
+    client.post('/method', data=json.dumps({'argument': 'a'}), content_type='application/json')
+    client.post('/method', data=json.dumps({'wrong': 'a'}), content_type='application/json')
+
+    client.post('/method/stream', data=b'{"argument": "a"}\n{"argument": "b"}')
+
+    metrics = client.get('/metrics').data.decode('utf-8')
+    assert 'ebonite_requests_total{method="method"} 2' in metrics
+    assert 'ebonite_requests_total{method="method/stream"} 1' in metrics
+    assert 'ebonite_request_errors_total{method="method"} 1' in metrics
+    assert 'ebonite_request_phase_seconds_count{method="method",phase="model"} 1' in metrics
+    assert 'ebonite_request_phase_seconds_count{method="method",phase="deserialize"} 2' in metrics
+
+
+def test_wsgi_server_serves_requests_concurrently(monkeypatch):
+    monkeypatch.setenv('EBONITE_FLASK_THREADS', '2')
+    monkeypatch.setenv('EBONITE_HOST', '127.0.0.1')
+    monkeypatch.setenv('EBONITE_PORT', '0')
+    barrier = threading.Barrier(2, timeout=5)
+
+    app = Flask(__name__)
+
+    @app.route('/wait')
+    def wait():
+        # would time out if requests were served one by one
+        barrier.wait()
+        return 'OK'
+
+    server = create_wsgi_server(app)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        url = f'http://127.0.0.1:{server.server_port}/wait'
+        with ThreadPoolExecutor(2) as executor:
+            responses = list(executor.map(lambda _: requests.get(url, timeout=10).text, range(2)))
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
+    assert responses == ['OK', 'OK']
@@ -5,8 +5,8 @@ from pyjackson.errors import DeserializationError, SerializationError
 
 from ebonite.core.analyzer.dataset import DatasetAnalyzer
 from ebonite.core.objects.dataset_type import DatasetType
-from ebonite.ext.numpy.dataset import (NumpyNdarrayDatasetType, NumpyNumberDatasetType, np_type_from_string,
-                                       python_type_from_np_string_repr, python_type_from_np_type)
+from ebonite.ext.numpy.dataset import (NumpyNdarrayDatasetType, NumpyNumberDatasetType, ndarray_to_npy,
+                                       np_type_from_string, python_type_from_np_string_repr, python_type_from_np_type)
 
 
 @pytest.fixture
@@ -68,3 +68,20 @@ def test_ndarray_serialize_failure(nat, obj):
 def test_ndarray_deserialize_failure(nat, obj):
     with pytest.raises(DeserializationError):
         nat.deserialize(obj)
+
+
+def test_ndarray_binary(nat):
+    array = np.array([[5, 6], [7, 8], [9, 10]])
+    payload = nat.serialize_binary(array)
+    assert isinstance(payload, bytes)
+    assert np.array_equal(nat.deserialize_binary(payload), array)
+
+
+@pytest.mark.parametrize('payload', [
+    b'not an npy payload',
+    ndarray_to_npy(np.array([1, 2])),  # wrong shape
+    ndarray_to_npy(np.array([['a', 'b']]))  # wrong data type
+])
+def test_ndarray_deserialize_binary_failure(nat, payload):
+    with pytest.raises(DeserializationError):
+        nat.deserialize_binary(payload)
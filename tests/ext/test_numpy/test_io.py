@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from ebonite.core.objects.artifacts import LocalFileBlob
+from ebonite.core.objects.core import Model
+from ebonite.core.objects.wrapper import PickleModelIO
+from ebonite.ext.numpy.io import NumpyArrayIO
+from ebonite.repository.artifact.local import LocalArtifactRepository
+
+
+class ArrayModel:
+    def __init__(self, weights):
+        self.weights = weights
+        self.same_weights = weights
+
+    def __call__(self, data):
+        return data @ self.weights
+
+
+@pytest.fixture
+def big_model():
+    return ArrayModel(np.ones((512, 512)))
+
+
+@pytest.fixture
+def out_of_band(monkeypatch):
+    monkeypatch.setenv('EBONITE_NUMPY_OUT_OF_BAND_MIN_SIZE', str(2 ** 20))
+
+
+def _dump_load(model, path):
+    with PickleModelIO().dump(model) as art:
+        art.materialize(path)
+    return PickleModelIO().load(path)
+
+
+def test_numpy_array_io__disabled_by_default(big_model, tmpdir):
+    assert NumpyArrayIO.for_array(big_model.weights) is None
+
+    model = Model.create(big_model, np.ones((1, 512)), 'model')
+    model._id = 'model'
+    LocalArtifactRepository(str(tmpdir)).push_artifacts(model)
+    payloads = model.artifact.bytes_dict()
+    assert not any(name.endswith('.npy') for name in payloads)
+    assert b'ebonite.ext.numpy.io' not in payloads[PickleModelIO.model_filename]
+
+
+@pytest.mark.usefixtures('out_of_band')
+def test_numpy_array_io__for_array():
+    assert NumpyArrayIO.for_array(np.ones(10)) is None
+    assert NumpyArrayIO.for_array(np.array([object()] * 2 ** 20)) is None
+    assert isinstance(NumpyArrayIO.for_array(np.ones(2 ** 20)), NumpyArrayIO)
+
+
+@pytest.mark.usefixtures('out_of_band')
+@pytest.mark.parametrize('array', [
+    np.matrix(np.ones((512, 512))),
+    np.ones(2 ** 17, dtype=[('a', 'f8')]).view(np.recarray),
+])
+def test_pickle_io__array_subclasses_pickled(array, tmpdir):
+    assert NumpyArrayIO.for_array(array) is None
+
+    loaded = _dump_load(ArrayModel(array), str(tmpdir))
+    assert type(loaded.weights) is type(array)
+    np.testing.assert_array_equal(loaded.weights, array)
+
+
+@pytest.mark.usefixtures('out_of_band')
+def test_pickle_io__large_arrays_out_of_band(big_model, tmpdir):
+    with PickleModelIO().dump(big_model) as art:
+        names = set(art.bytes_dict().keys())
+    assert len([n for n in names if n.endswith(NumpyArrayIO.array_filename)]) == 1
+
+    loaded = _dump_load(big_model, str(tmpdir))
+    np.testing.assert_array_equal(loaded.weights, big_model.weights)
+    assert loaded.weights is loaded.same_weights
+
+
+@pytest.mark.usefixtures('out_of_band')
+def test_pickle_io__arrays_memory_mapped_in_runtime(big_model, tmpdir, monkeypatch):
+    monkeypatch.setenv('EBONITE_RUNTIME', 'true')
+    loaded = _dump_load(big_model, str(tmpdir))
+    assert isinstance(loaded.weights, np.memmap)
+    loaded.weights[0, 0] = 2  # copy-on-write, artifact stays untouched
+    assert PickleModelIO().load(str(tmpdir)).weights[0, 0] == 1
+
+
+@pytest.mark.usefixtures('out_of_band')
+def test_pickle_io__large_payloads_spooled(big_model, tmpdir, monkeypatch):
+    monkeypatch.setenv('EBONITE_SPOOL_MAX_SIZE', '1024')
+    with PickleModelIO().dump(big_model) as art, art.blob_dict() as blobs:
+        spooled = [name for name, blob in blobs.items() if isinstance(blob, LocalFileBlob)]
+        assert len(spooled) == 1 and spooled[0].endswith(NumpyArrayIO.array_filename)
+        art.materialize(str(tmpdir))
+
+    loaded = PickleModelIO().load(str(tmpdir))
+    np.testing.assert_array_equal(loaded.weights, big_model.weights)
@@ -9,8 +9,10 @@ from pyjackson.errors import DeserializationError, SerializationError
 from ebonite.core.analyzer.dataset import DatasetAnalyzer
 from ebonite.core.objects import DatasetType
 from ebonite.ext.pandas import DataFrameType
-from ebonite.ext.pandas.dataset import (pd_type_from_string, python_type_from_pd_string_repr, python_type_from_pd_type,
-                                        string_repr_from_pd_type)
+from ebonite.ext.pandas.dataset import (ARROW_CONTENT_TYPE, pd_type_from_string, python_type_from_pd_string_repr,
+                                        python_type_from_pd_type, string_repr_from_pd_type)
+from ebonite.runtime.openapi.spec import type_to_schema
+from ebonite.utils.importing import module_importable
 
 PD_DATA_FRAME = pd.DataFrame([
     {'int': 1, 'str': 'a', 'float': .1, 'dt': datetime.now(), 'bool': True, 'dt_tz': datetime.now(timezone.utc),
@@ -137,3 +139,52 @@ def test_all(data2):
 
     assert data2.equals(data)
     assert data2 is not data
+
+
+def test_dataframe_columns_deserialize(df_type, data):
+    data2 = deserialize({'columns': {'b': [3, 4], 'a': [1, 2]}}, df_type)
+
+    assert data.equals(data2)
+
+
+@pytest.mark.parametrize('obj', [
+    {'columns': [1, 2]},  # not a dict
+    {'columns': {'a': [1, 2], 'b': [1]}},  # different lengths
+    {'columns': {'a': [1, 2]}}  # wrong columns
+])
+def test_dataframe_columns_deserialize_failure(df_type, obj):
+    with pytest.raises(DeserializationError):
+        df_type.deserialize(obj)
+
+
+def test_dataframe_serialize_columnar(df_type, data):
+    obj = df_type.serialize_columnar(data)
+    assert obj == {'columns': {'a': [1, 2], 'b': [3, 4]}}
+    assert data.equals(deserialize(json.loads(json.dumps(obj)), df_type))
+
+
+def test_dataframe_spec(df_type):
+    schema = type_to_schema(df_type)
+    assert set(schema['properties']) == {'values', 'columns'}
+    assert 'required' not in schema
+    assert schema['properties']['columns']['properties']['a'] == {'type': 'array', 'items': {'type': 'integer'}}
+
+
+def test_dataframe_empty(df_type2):
+    empty = df_type2.empty()
+    assert len(empty) == 0
+    assert list(empty.columns) == df_type2.columns
+    df_type2._validate_dtypes(empty, AssertionError)
+
+
+@pytest.mark.skipif(not module_importable('pyarrow'), reason='pyarrow is not installed')
+def test_dataframe_binary(df_type, data):
+    assert df_type.content_type == ARROW_CONTENT_TYPE
+
+    payload = df_type.serialize_binary(data)
+    data2 = df_type.deserialize_binary(payload)
+
+    assert data.equals(data2)
+
+    with pytest.raises(DeserializationError):
+        df_type.deserialize_binary(b'not an arrow payload')
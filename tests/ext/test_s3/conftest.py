@@ -2,6 +2,7 @@ from time import sleep
 
 import pytest
 from everett.manager import config_override
+from moto import mock_s3
 from testcontainers.core.container import DockerContainer
 
 from ebonite.ext.s3.artifact import S3ArtifactRepository
@@ -12,6 +13,7 @@ ACCESS_KEY = 'eboniteAccessKey'
 BUCKET_NAME = 'testbucket'
 PORT = 9000
 SECRET_KEY = 'eboniteSecretKey'
+MB = 2 ** 20
 
 
 def delete_bucket(repo: S3ArtifactRepository):
@@ -49,6 +51,16 @@ def s3_artifact(s3server):
         delete_bucket(repo)
 
 
+@pytest.fixture
+def moto_repo(monkeypatch):
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    # newer botocore sends checksummed aws-chunked payloads, which moto stores as is
+    monkeypatch.setenv('AWS_REQUEST_CHECKSUM_CALCULATION', 'when_required')
+    with mock_s3(), config_override(S3_ACCESS_KEY='key', S3_SECRET_KEY='secret', S3_TRANSFER_WORKERS='4',
+                                    S3_CHUNK_SIZE=str(5 * MB)):
+        yield S3ArtifactRepository(BUCKET_NAME)
+
+
 pytest_runtest_protocol, pytest_collect_file = create_artifact_hooks(s3_artifact, 's3')
 
 
@@ -0,0 +1,110 @@
+import io
+
+import pytest
+from everett.manager import config_override
+
+from ebonite.core.objects.artifacts import InMemoryBlob
+from ebonite.ext.s3.artifact import S3ArtifactRepository, S3Blob
+from ebonite.repository.artifact import ArtifactExistsError, NoSuchArtifactError
+from ebonite.repository.artifact.base import ArtifactError
+from ebonite.repository.artifact.cache import CachedArtifactRepository, CachedBlob
+from tests.ext.test_s3.conftest import BUCKET_NAME
+
+
+@pytest.fixture
+def listings(moto_repo, monkeypatch):
+    prefixes = []
+    list_blobs = moto_repo._list_blobs
+
+    def spy(prefix):
+        prefixes.append(prefix)
+        return list_blobs(prefix)
+
+    monkeypatch.setattr(moto_repo, '_list_blobs', spy)
+    return prefixes
+
+
+def test_get_artifact__more_than_page(moto_repo: S3ArtifactRepository):
+    moto_repo._ensure_bucket()
+    for i in range(1005):
+        moto_repo._s3.upload_fileobj(io.BytesIO(b'data'), BUCKET_NAME, f'model/{i}')
+
+    artifact = moto_repo._get_artifact('model')
+    assert len(artifact.blobs) == 1005
+
+
+def test_delete_artifact__batches(moto_repo: S3ArtifactRepository, monkeypatch):
+    monkeypatch.setattr(S3ArtifactRepository, 'DELETE_BATCH_SIZE', 2)
+    moto_repo._push_artifact('model', {str(i): InMemoryBlob(b'data') for i in range(5)})
+
+    moto_repo._delete_artifact('model')
+    assert moto_repo._list_blobs('model') == {}
+
+
+def test_delete_artifact__errors(moto_repo: S3ArtifactRepository, monkeypatch):
+    monkeypatch.setattr(S3ArtifactRepository, 'DELETE_BATCH_SIZE', 2)
+    moto_repo._push_artifact('model', {str(i): InMemoryBlob(b'data') for i in range(3)})
+    delete_objects = moto_repo._s3.delete_objects
+
+    def fail_one(**kwargs):
+        response = delete_objects(**kwargs)
+        # listing order depends on order of concurrent uploads, so failing key could be anywhere in a batch
+        if {'Key': 'model/0'} in kwargs['Delete']['Objects']:
+            response['Errors'] = [{'Key': 'model/0', 'Code': 'AccessDenied', 'Message': 'Access Denied'}]
+        return response
+
+    monkeypatch.setattr(moto_repo._s3, 'delete_objects', fail_one)
+    with pytest.raises(ArtifactError, match='Failed to delete 1 of 3 files.*model/0: AccessDenied'):
+        moto_repo._delete_artifact('model')
+    assert moto_repo._list_blobs('model') == {}
+
+
+def test_get_artifact__ids_with_same_prefix(moto_repo: S3ArtifactRepository):
+    moto_repo._push_artifact('model', {'a': InMemoryBlob(b'a')})
+    moto_repo._push_artifact('model2', {'b': InMemoryBlob(b'b')})
+
+    assert set(moto_repo._get_artifact('model').blobs) == {'a'}
+    moto_repo._delete_artifact('model')
+    assert set(moto_repo._get_artifact('model2').blobs) == {'b'}
+
+
+def test_listing_cache(moto_repo: S3ArtifactRepository, listings):
+    pushed = moto_repo._push_artifact('model', {'a': InMemoryBlob(b'data')})
+    assert listings == ['model']  # check that artifact doesn't exist
+
+    assert moto_repo._get_artifact('model') == pushed
+    assert moto_repo._get_artifact('model') == pushed
+    assert listings == ['model']
+
+    moto_repo._delete_artifact('model')
+    with pytest.raises(NoSuchArtifactError):
+        moto_repo._get_artifact('model')
+    assert listings == ['model', 'model']
+
+    moto_repo._push_artifact('model', {})
+    assert moto_repo._get_artifact('model').blobs == {}
+    with pytest.raises(ArtifactExistsError):
+        moto_repo._push_artifact('model', {})
+
+
+def test_listing_cache__expires(moto_repo: S3ArtifactRepository, listings, monkeypatch):
+    moto_repo._push_artifact('model', {'a': InMemoryBlob(b'data')})
+    monkeypatch.setattr(moto_repo._listings, 'ttl', 0)
+
+    moto_repo._get_artifact('model')
+    moto_repo._get_artifact('model')
+    assert listings == ['model', 'model', 'model']
+
+
+def test_cached_repository(moto_repo: S3ArtifactRepository, tmpdir):
+    repo = CachedArtifactRepository(moto_repo)
+    with config_override(ARTIFACT_CACHE_PATH=str(tmpdir.join('cache'))):
+        pushed = repo._push_artifact('model', {'a': InMemoryBlob(b'data')})
+        assert isinstance(pushed.blobs['a'], S3Blob)
+        blob = repo._get_artifact('model').blobs['a']
+        assert isinstance(blob, CachedBlob)
+        assert blob.bytes() == b'data'
+
+        # overwritten object has other ETag
+        moto_repo._s3.upload_fileobj(io.BytesIO(b'changed'), BUCKET_NAME, blob.blob.s3path)
+        assert blob.bytes() == b'changed'
@@ -0,0 +1,42 @@
+import pytest
+from everett.manager import config_override
+from moto import mock_s3
+
+from ebonite.core.objects.artifacts import InMemoryBlob
+from ebonite.ext.s3.artifact import S3Blob, S3DedupArtifactRepository
+from ebonite.repository.artifact import ArtifactExistsError, NoSuchArtifactError
+from tests.ext.test_s3.conftest import BUCKET_NAME
+
+
+@pytest.fixture
+def dedup_repo(monkeypatch):
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    monkeypatch.setenv('AWS_REQUEST_CHECKSUM_CALCULATION', 'when_required')
+    with mock_s3(), config_override(S3_ACCESS_KEY='key', S3_SECRET_KEY='secret'):
+        yield S3DedupArtifactRepository(BUCKET_NAME)
+
+
+def keys(repo: S3DedupArtifactRepository, prefix):
+    return [o['Key'] for o in repo._s3.list_objects_v2(Bucket=BUCKET_NAME, Prefix=prefix).get('Contents', [])]
+
+
+def test_push_get_delete(dedup_repo):
+    first = dedup_repo._push_artifact('model1', {'a': InMemoryBlob(b'data'), 'b': InMemoryBlob(b'other')})
+    second = dedup_repo._push_artifact('model2', {'c': InMemoryBlob(b'data')})
+    assert len(keys(dedup_repo, 'blobs/')) == 2
+    assert isinstance(second.blobs['c'], S3Blob) and second.blobs['c'].size == 4
+    assert dedup_repo._get_artifact('model1') == first
+    with pytest.raises(ArtifactExistsError):
+        dedup_repo._push_artifact('model1', {})
+
+    dedup_repo._delete_artifact('model1')
+    with pytest.raises(NoSuchArtifactError):
+        dedup_repo._get_artifact('model1')
+    assert keys(dedup_repo, 'blobs/') == [second.blobs['c'].s3path]
+    with second.blobs['c'].bytestream() as f:
+        assert f.read() == b'data'
+
+    dedup_repo._delete_artifact('model2')
+    assert keys(dedup_repo, '') == []
+    with pytest.raises(NoSuchArtifactError):
+        dedup_repo._delete_artifact('model2')
@@ -0,0 +1,73 @@
+import os
+import threading
+import time
+
+from ebonite.core.objects.artifacts import Blobs, InMemoryBlob
+from ebonite.ext.s3.artifact import S3ArtifactRepository, S3Blob
+from ebonite.ext.s3.transfer import S3Transfer
+from tests.ext.test_s3.conftest import MB
+
+
+def test_push_and_materialize(moto_repo, tmpdir):
+    blobs = {f'dir/file{i}': InMemoryBlob(f'payload{i}'.encode()) for i in range(20)}
+    blobs['large'] = InMemoryBlob(os.urandom(11 * MB))  # uploaded in 3 parts
+
+    pushed = moto_repo._push_artifact('model', blobs)
+    assert pushed.blobs['large'].size == 11 * MB
+    assert pushed == moto_repo._get_artifact('model')
+
+    Blobs(pushed.blobs).materialize(str(tmpdir))
+    for name, blob in blobs.items():
+        with open(os.path.join(tmpdir, name), 'rb') as f:
+            assert f.read() == blob.payload
+
+
+def test_materialize_many__groups_by_bucket(moto_repo, tmpdir):
+    moto_repo._push_artifact('model', {'file': InMemoryBlob(b'data')})
+    other = S3ArtifactRepository('otherbucket')
+    other._push_artifact('model', {'file': InMemoryBlob(b'other')})
+
+    S3Blob.materialize_many({os.path.join(tmpdir, 'a'): S3Blob('model/file', 'testbucket'),
+                             os.path.join(tmpdir, 'b'): S3Blob('model/file', 'otherbucket')})
+    assert tmpdir.join('a').read_binary() == b'data'
+    assert tmpdir.join('b').read_binary() == b'other'
+
+
+class _SlowClient:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.max_requests = 0
+
+    def download_file(self, bucket, key, path, Config):
+        with self.lock:
+            self.active += 1
+            self.max_requests = max(self.max_requests, self.active * Config.max_concurrency)
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(.05)
+        with self.lock:
+            self.active -= 1
+
+
+def test_transfer__in_flight_budget(tmpdir):
+    client = _SlowClient()
+    transfer = S3Transfer(client, workers=8, chunk_size=100, max_in_flight=200)
+    transfer.download('bucket', {os.path.join(tmpdir, str(i)): (str(i), 100) for i in range(6)})
+    assert client.max_active == 2
+
+    client = _SlowClient()
+    transfer = S3Transfer(client, workers=8, chunk_size=100, max_in_flight=200)
+    transfer.download('bucket', {os.path.join(tmpdir, str(i)): (str(i), 10) for i in range(6)})
+    assert client.max_active == 6
+
+
+def test_transfer__workers_split_between_files(tmpdir):
+    client = _SlowClient()
+    S3Transfer(client, workers=8).download('bucket', {os.path.join(tmpdir, str(i)): (str(i), 10) for i in range(3)})
+    assert client.max_active == 3
+    assert client.max_requests == 6
+
+    client = _SlowClient()
+    S3Transfer(client, workers=8).download('bucket', {os.path.join(tmpdir, 'file'): ('file', 10)})
+    assert client.max_requests == 8
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import event
+
+from ebonite.core.errors import ShallowModelError
+from ebonite.core.objects.core import Model, Project, Task
+from ebonite.ext.sqlalchemy.repository import SQLAlchemyMetaRepository
+
+
+@pytest.fixture
+def filled_meta(dummy_model_wrapper):
+    meta = SQLAlchemyMetaRepository('sqlite://')
+    for p in range(3):
+        project = meta.create_project(Project(f'project{p}'))
+        for t in range(3):
+            task = meta.create_task(Task(f'task{t}', project_id=project.id))
+            for m in range(3):
+                meta.create_model(Model(f'model{m}', dummy_model_wrapper, task_id=task.id))
+    return meta
+
+
+@pytest.fixture
+def queries(filled_meta):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(filled_meta._engine, 'before_cursor_execute', count)
+    yield statements
+    event.remove(filled_meta._engine, 'before_cursor_execute', count)
+
+
+def test_get_projects__fixed_number_of_queries(filled_meta, queries):
+    projects = filled_meta.get_projects()
+
+    assert len(projects) == 3
+    assert all(len(t.models) == 3 for p in projects for t in p.tasks.values())
+    # projects, tasks, models, pipelines and images
+    assert len(queries) == 5
+
+
+def test_get_projects__shallow(filled_meta, queries):
+    projects = filled_meta.get_projects(shallow=True)
+
+    assert len(projects) == 3
+    assert all(len(p.tasks) == 0 for p in projects)
+    assert len(queries) == 1
+
+
+def test_get_models__shallow(filled_meta, queries, dummy_model_wrapper):
+    models = filled_meta.get_models('task0', 'project0', shallow=True)
+
+    assert len(models) == 3
+    assert all(m._wrapper_meta is None and m.artifact is None for m in models)
+    # project and task resolution, models
+    assert len(queries) == 3
+    assert 'wrapper' not in queries[-1]
+    assert all(m.has_meta_repo for m in models)
+
+    model = filled_meta.get_model_by_id(models[0].id)
+    assert model.wrapper == dummy_model_wrapper
+
+
+def test_save_model__shallow(filled_meta):
+    model = filled_meta.get_models('task0', 'project0', shallow=True)[0]
+
+    with pytest.raises(ShallowModelError):
+        filled_meta.save_model(model)
+    with pytest.raises(ShallowModelError):
+        model.save()
+    assert filled_meta.get_model_by_id(model.id).wrapper_meta is not None
@@ -0,0 +1,160 @@
+import json
+import os
+
+import pyjackson
+import pytest
+from everett.manager import config_override
+
+from ebonite.build.provider.ml_model import MLModelProvider
+from ebonite.build.provider.ml_model_multi import MLModelMultiProvider
+from ebonite.core.objects.artifacts import ArtifactCollection, Blob, Blobs, InMemoryBlob, LocalFileBlob
+from ebonite.core.objects.core import Model
+from ebonite.ext.flask import FlaskServer
+from ebonite.repository.artifact import NoSuchArtifactError
+from ebonite.repository.artifact.cache import CachedArtifactRepository, CachedBlob, get_blob_cache
+from ebonite.repository.artifact.local import LocalArtifactRepository
+from ebonite.runtime.interface.ml_model import MODEL_BIN_PATH
+
+
+class RemoteBlob(Blob):
+    """
+    Local file pretending to be remote, counts downloads
+    """
+    type = 'test_remote'
+    downloads = []
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def materialize(self, path):
+        RemoteBlob.downloads.append(self.path)
+        LocalFileBlob(self.path).materialize(path)
+
+    def bytestream(self):
+        return LocalFileBlob(self.path).bytestream()
+
+    def version(self):
+        return str(os.path.getmtime(self.path))
+
+
+class RemoteArtifactRepository(LocalArtifactRepository):
+    type = 'test_remote'
+
+    def _get_artifact(self, model_id: str):
+        return Blobs({name: RemoteBlob(b.path) for name, b in super()._get_artifact(model_id).blobs.items()})
+
+    def _push_artifact(self, model_id: str, blobs):
+        return Blobs({name: RemoteBlob(b.path) for name, b in super()._push_artifact(model_id, blobs).blobs.items()})
+
+
+@pytest.fixture
+def cache_path(tmpdir):
+    RemoteBlob.downloads.clear()
+    path = str(tmpdir.join('cache'))
+    with config_override(ARTIFACT_CACHE_PATH=path, ARTIFACT_CACHE_MAX_SIZE='10'):
+        yield path
+
+
+@pytest.fixture
+def repo(tmpdir):
+    return CachedArtifactRepository(RemoteArtifactRepository(str(tmpdir.join('remote'))))
+
+
+def _push(repo: CachedArtifactRepository, model_id: str, blobs) -> Blobs:
+    return repo.read_artifact(repo._push_artifact(model_id, blobs))
+
+
+def test_read_through(repo, cache_path, tmpdir):
+    pushed = repo._push_artifact('model', {'a': InMemoryBlob(b'data'), 'b': InMemoryBlob(b'other')})
+    artifact = repo._get_artifact('model')
+    assert all(isinstance(b, CachedBlob) for b in artifact.blobs.values())
+    assert artifact == repo.read_artifact(pushed)
+
+    artifact.materialize(str(tmpdir.join('first')))
+    artifact.materialize(str(tmpdir.join('second')))
+    assert tmpdir.join('second', 'a').read_binary() == b'data'
+    with artifact.blobs['b'].bytestream() as f:
+        assert f.read() == b'other'
+    assert len(RemoteBlob.downloads) == 2
+
+
+def test_pushed_artifact_is_not_wrapped(repo, cache_path, tmpdir):
+    pushed = repo._push_artifact('model', {'a': InMemoryBlob(b'data')})
+    assert isinstance(pushed.blobs['a'], RemoteBlob)
+
+    # persisted artifact could be read by process which doesn't use cache
+    payload = pyjackson.serialize(pushed, ArtifactCollection)
+    assert 'cached' not in json.dumps(payload)
+    assert pyjackson.deserialize(payload, ArtifactCollection).blobs['a'].bytes() == b'data'
+
+
+def test_model_load_reads_through_cache(repo, cache_path, created_model: Model):
+    model = created_model
+    model._id = 'model'
+    repo.push_artifacts(model)
+    assert not any(isinstance(b, CachedBlob) for b in model.artifact.blobs.values())
+
+    model.load()
+    model.load()
+    assert len(RemoteBlob.downloads) == len(model.artifact.blobs)
+
+
+def test_build_providers_read_through_cache(repo, cache_path, created_model: Model, tmpdir):
+    model = created_model
+    model._id = 'model'
+    repo.push_artifacts(model)
+
+    MLModelProvider(model, FlaskServer()).get_artifacts().materialize(str(tmpdir.join('single')))
+    MLModelMultiProvider([model], FlaskServer()).get_artifacts().materialize(str(tmpdir.join('multi')))
+    assert len(RemoteBlob.downloads) == len(model.artifact.blobs)
+    assert sorted(os.listdir(str(tmpdir.join('single', MODEL_BIN_PATH)))) == sorted(model.artifact.blobs)
+
+
+def test_changed_payload_is_downloaded(repo, cache_path):
+    blob = _push(repo, 'model', {'a': InMemoryBlob(b'data')}).blobs['a']
+    assert blob.bytes() == b'data'
+
+    with open(blob.blob.path, 'wb') as f:
+        f.write(b'changed')
+    os.utime(blob.blob.path, (0, 0))
+    assert blob.bytes() == b'changed'
+    assert len(RemoteBlob.downloads) == 2
+
+
+def test_corrupted_entry(repo, cache_path):
+    blob = _push(repo, 'model', {'a': InMemoryBlob(b'data')}).blobs['a']
+    key = get_blob_cache().key(blob.blob)
+    path = get_blob_cache().put_many({key: blob.blob})[key]
+    with open(path, 'wb') as f:
+        f.write(b'corrupted')
+    assert get_blob_cache().get(blob.blob) is None  # size differs
+
+    with open(path, 'wb') as f:
+        f.write(b'DATA')
+    assert get_blob_cache().get(blob.blob) is not None
+    with config_override(ARTIFACT_CACHE_VERIFY='true'):
+        assert get_blob_cache().get(blob.blob) is None
+
+
+def test_eviction(repo, cache_path):
+    blobs = _push(repo, 'model', {'a': InMemoryBlob(b'aaaa'), 'b': InMemoryBlob(b'bbbb')}).blobs
+    c = _push(repo, 'model2', {'c': InMemoryBlob(b'cccc')}).blobs['c']
+    cache = get_blob_cache()
+    for i, blob in enumerate([blobs['a'], blobs['b'], blobs['a'], c]):
+        blob.bytes()
+        os.utime(cache.get(blob.blob), (i, i))
+
+    # max size is 10 bytes, so only two entries fit and "b" is the least recently used
+    assert cache.get(blobs['b'].blob) is None
+    assert cache.get(blobs['a'].blob) is not None
+    assert cache.get(c.blob) is not None
+    assert not any(name.startswith('.tmp') for name in os.listdir(cache_path))
+
+
+def test_delete_removes_entries(repo, cache_path):
+    blob = _push(repo, 'model', {'a': InMemoryBlob(b'data')}).blobs['a']
+    blob.bytes()
+    repo._delete_artifact('model')
+    assert os.listdir(cache_path) == []
+    with pytest.raises(NoSuchArtifactError):
+        repo._get_artifact('model')
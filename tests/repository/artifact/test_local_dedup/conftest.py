@@ -0,0 +1,12 @@
+import pytest
+
+from ebonite.repository.artifact.dedup import LocalDedupArtifactRepository
+from tests.repository.artifact.conftest import create_artifact_hooks
+
+
+@pytest.fixture
+def local_dedup_artifact(tmpdir_factory):
+    yield LocalDedupArtifactRepository(tmpdir_factory.mktemp('repo'))
+
+
+pytest_runtest_protocol, pytest_collect_file = create_artifact_hooks(local_dedup_artifact, 'local_dedup')
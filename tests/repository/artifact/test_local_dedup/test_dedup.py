@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from ebonite.core.objects.artifacts import InMemoryBlob
+from ebonite.repository.artifact import ArtifactExistsError, NoSuchArtifactError
+from ebonite.repository.artifact.dedup import LocalDedupArtifactRepository
+
+
+@pytest.fixture
+def repo(tmpdir):
+    return LocalDedupArtifactRepository(str(tmpdir))
+
+
+def payloads(repo: LocalDedupArtifactRepository):
+    return [f for _, _, files in os.walk(os.path.join(repo.path, 'blobs')) for f in files]
+
+
+def test_push__shared_payload_stored_once(repo):
+    first = repo._push_artifact('model1', {'a': InMemoryBlob(b'data'), 'b': InMemoryBlob(b'data')})
+    second = repo._push_artifact('model2', {'c': InMemoryBlob(b'data'), 'd': InMemoryBlob(b'other')})
+
+    assert len(payloads(repo)) == 2
+    assert first.blobs['a'] == first.blobs['b'] == second.blobs['c']
+    assert repo._get_artifact('model2') == second
+
+
+def test_delete__payload_kept_until_last_reference(repo):
+    repo._push_artifact('model1', {'a': InMemoryBlob(b'data')})
+    repo._push_artifact('model2', {'b': InMemoryBlob(b'data')})
+
+    repo._delete_artifact('model1')
+    with pytest.raises(NoSuchArtifactError):
+        repo._get_artifact('model1')
+    with repo._get_artifact('model2').blobs['b'].bytestream() as f:
+        assert f.read() == b'data'
+
+    repo._delete_artifact('model2')
+    assert payloads(repo) == []
+    assert os.listdir(os.path.join(repo.path, 'refs')) == []
+
+
+def test_push__existing(repo):
+    repo._push_artifact('model', {})
+    assert repo._get_artifact('model').blobs == {}
+    with pytest.raises(ArtifactExistsError):
+        repo._push_artifact('model', {'a': InMemoryBlob(b'data')})
@@ -10,7 +10,7 @@ from ebonite.core.errors import (ExistingEnvironmentError, ExistingImageError, E
                                  NonExistingImageError, NonExistingInstanceError, NonExistingModelError,
                                  NonExistingPipelineError, NonExistingProjectError, NonExistingTaskError,
                                  PipelineNotInTaskError, TaskNotInProjectError)
-from ebonite.core.objects.core import Model, Pipeline, Project, Task
+from ebonite.core.objects.core import Model, Pipeline, PipelineStep, Project, Task
 from ebonite.repository.metadata import MetadataRepository
 
 # from tests.ext.sqlalchemy.conftest import sqlalchemy_meta as meta
@@ -869,6 +869,16 @@ def test_get_pipeline(meta: MetadataRepository, project: Project, task: Task, pi
     assert pipeline.has_meta_repo
 
 
+def test_get_pipeline__dag_steps(meta: MetadataRepository, project: Project, task: Task):
+    task.project = meta.create_project(project)
+    task = meta.create_task(task)
+    steps = [PipelineStep('a', 'b'), PipelineStep('c', 'd', [Pipeline.INPUT]), PipelineStep('e', 'f', [0, 1])]
+    pipeline = meta.create_pipeline(Pipeline('DAG Pipeline', steps, None, None, task_id=task.id))
+
+    pipeline = meta.get_pipeline_by_id(pipeline.id)
+    assert [s.inputs for s in pipeline.steps] == [None, [Pipeline.INPUT], [0, 1]]
+
+
 def test_get_pipeline_by_id(meta: MetadataRepository, project: Project, task: Task, pipeline: Pipeline):
     task.project = meta.create_project(project)
     task = meta.create_task(task)
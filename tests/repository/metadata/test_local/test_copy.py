@@ -0,0 +1,61 @@
+from ebonite.core.objects.artifacts import Blobs, InMemoryBlob
+from ebonite.core.objects.core import Model, Project, Task
+from ebonite.repository.metadata import local
+from ebonite.repository.metadata.local import LocalMetadataRepository
+
+
+def test_reads__do_not_copy_repository():
+    meta = LocalMetadataRepository()
+    project = meta.create_project(Project('project'))
+    task = meta.create_task(Task('task', project_id=project.id))
+    meta.update_task(task)  # task is bound to meta
+
+    stored = meta.data.get_task_by_id(task.id)
+    assert stored._meta is meta
+
+    read = meta.get_project_by_id(project.id)
+    assert read is not meta.data.get_project_by_id(project.id)
+    assert read._meta is meta
+    assert read.tasks(task.name) is not stored
+    assert read.tasks(task.name)._meta is meta
+
+
+def test_reads__share_in_memory_artifacts():
+    meta = LocalMetadataRepository()
+    project = meta.create_project(Project('project'))
+    task = meta.create_task(Task('task', project_id=project.id))
+    model = Model('model', {}, task_id=task.id)
+    model._unpersisted_artifacts = Blobs({'data': InMemoryBlob(b'data')})
+    model = meta.create_model(model)
+
+    read = meta.get_model_by_id(model.id)
+    stored = meta.data.get_model_by_id(model.id)
+    assert read is not stored
+    assert read._unpersisted_artifacts is stored._unpersisted_artifacts
+
+    read.params['key'] = 'value'
+    assert 'key' not in meta.get_model_by_id(model.id).params
+
+
+def test_lookups__copy_only_returned_object(monkeypatch):
+    meta = LocalMetadataRepository()
+    project = meta.create_project(Project('project'))
+    task = meta.create_task(Task('task', project_id=project.id))
+    for i in range(3):
+        meta.create_model(Model(f'model{i}', {}, task_id=task.id))
+
+    copied = []
+    copy = local._copy
+
+    def copy_spy(obj):
+        copied.append(obj)
+        return copy(obj)
+
+    monkeypatch.setattr('ebonite.repository.metadata.local._copy', copy_spy)
+    model = meta.get_model_by_name('model1', 'task', 'project')
+    assert model.name == 'model1'
+    assert copied == [meta.data.get_model_by_id(model.id)]
+
+    copied.clear()
+    meta.create_model(Model('model3', {}, task_id=task.id))
+    assert [type(o) for o in copied] == [Model]
@@ -0,0 +1,89 @@
+import os
+
+from ebonite.core.objects.core import Model, Project, Task
+from ebonite.repository.metadata.local import LocalMetadataRepository
+
+
+def _journal_lines(meta: LocalMetadataRepository):
+    if not os.path.exists(meta.journal_path):
+        return []
+    with open(meta.journal_path) as f:
+        return f.readlines()
+
+
+def test_journal__updates_are_appended(tmpdir):
+    meta = LocalMetadataRepository(os.path.join(tmpdir, 'db.json'))
+    snapshot_mtime = os.path.getmtime(meta.path)
+
+    project = meta.create_project(Project('project'))
+    meta.create_task(Task('task', project_id=project.id))
+    assert len(_journal_lines(meta)) == 2
+    assert os.path.getmtime(meta.path) == snapshot_mtime
+
+
+def test_journal__replayed_on_load(tmpdir):
+    path = os.path.join(tmpdir, 'db.json')
+    meta = LocalMetadataRepository(path)
+    project = meta.create_project(Project('project'))
+    task = meta.create_task(Task('task', project_id=project.id))
+    task.name = 'renamed'
+    meta.update_task(task)
+    meta.delete_project(meta.create_project(Project('deleted')))
+
+    meta.load()
+    assert [p.name for p in meta.get_projects()] == ['project']
+    assert meta.get_task_by_id(task.id).name == 'renamed'
+    assert meta.get_task_by_name(project, 'task') is None
+    assert meta.data.next_project_id == 2
+
+    reopened = LocalMetadataRepository(path)
+    assert _journal_lines(reopened) == []
+    assert [t.name for t in reopened.get_tasks(project)] == ['renamed']
+    assert reopened.create_project(Project('new')).id == 2
+
+
+def test_journal__compaction(tmpdir):
+    meta = LocalMetadataRepository(os.path.join(tmpdir, 'db.json'), compact_every=3)
+    project = meta.create_project(Project('project'))
+    meta.create_task(Task('task1', project_id=project.id))
+    assert len(_journal_lines(meta)) == 2
+
+    meta.create_task(Task('task2', project_id=project.id))
+    assert _journal_lines(meta) == []
+
+    meta.load()
+    assert {t.name for t in meta.get_tasks(project)} == {'task1', 'task2'}
+
+
+def test_journal__incomplete_line_skipped(tmpdir):
+    meta = LocalMetadataRepository(os.path.join(tmpdir, 'db.json'))
+    meta.create_project(Project('project'))
+    with open(meta.journal_path, 'a') as f:
+        f.write('{"op": "add", "kin')
+
+    meta.load()
+    assert [p.name for p in meta.get_projects()] == ['project']
+
+
+def test_journal__stale_journal_with_removed_parent(tmpdir):
+    path = os.path.join(tmpdir, 'db.json')
+    meta = LocalMetadataRepository(path)
+    project = meta.create_project(Project('project'))
+    task = meta.create_task(Task('task', project_id=project.id))
+    meta.compact()
+
+    model = Model('model', wrapper_meta={}, task_id=task.id)
+    meta.delete_model(meta.create_model(model))
+    meta.delete_task(task)
+    with open(meta.journal_path) as f:
+        stale_journal = f.read()
+    # process crashed after new snapshot was written but before journal was removed
+    meta.compact()
+    with open(meta.journal_path, 'w') as f:
+        f.write(stale_journal)
+
+    reopened = LocalMetadataRepository(path)
+    assert [p.name for p in reopened.get_projects()] == ['project']
+    assert reopened.get_tasks(project) == []
+    assert reopened.data.models == {}
+    assert reopened.create_task(Task('new', project_id=project.id)).id == 1
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ebonite.core.analyzer.dataset import DatasetAnalyzer
+from ebonite.runtime.interface.batching import MethodBatcher, create_batcher, is_batchable
+
+
+class CountingModel:
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, data):
+        self.calls.append(len(data))
+        if (data < 0).any():
+            raise ValueError('negative input')
+        return data.sum(axis=1)
+
+
+@pytest.fixture
+def model():
+    return CountingModel()
+
+
+@pytest.fixture
+def types():
+    in_type = DatasetAnalyzer.analyze(np.array([[1, 2]]))
+    out_type = DatasetAnalyzer.analyze(np.array([3]))
+    return in_type, out_type
+
+
+def test_is_batchable(types):
+    in_type, out_type = types
+    assert is_batchable(in_type, out_type)
+    assert not is_batchable(in_type, DatasetAnalyzer.analyze(1))
+
+
+def test_create_batcher__disabled_by_default(model, types):
+    func = model.predict
+    assert create_batcher(func, *types) is func
+
+
+def test_method_batcher__groups_concurrent_calls(model, types):
+    batcher = MethodBatcher(model.predict, *types, max_size=64, max_wait_ms=200)
+    inputs = [np.array([[i, i]]) for i in range(8)]
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(batcher, inputs))
+
+    assert [r.tolist() for r in results] == [[2 * i] for i in range(8)]
+    assert len(model.calls) < 8
+    assert sum(model.calls) == 8
+
+
+def test_method_batcher__large_input_bypasses_queue(model, types):
+    batcher = MethodBatcher(model.predict, *types, max_size=2, max_wait_ms=200)
+    assert batcher(np.array([[1, 1], [2, 2]])).tolist() == [2, 4]
+    assert batcher._worker is None
+
+
+def test_method_batcher__errors_are_isolated(model, types):
+    batcher = MethodBatcher(model.predict, *types, max_size=64, max_wait_ms=200)
+    inputs = [np.array([[1, 1]]), np.array([[-1, -1]]), np.array([[2, 2]])]
+    with ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(batcher, i) for i in inputs]
+
+    assert futures[0].result().tolist() == [2]
+    with pytest.raises(ValueError):
+        futures[1].result()
+    assert futures[2].result().tolist() == [4]
+
+
+def test_dataframe_type__concat_split():
+    df_type = DatasetAnalyzer.analyze(pd.DataFrame({'a': [1], 'b': [.5]}))
+    parts = [pd.DataFrame({'a': [1, 2], 'b': [.5, .6]}), pd.DataFrame({'a': [3], 'b': [.7]})]
+    batch = df_type.concat(parts)
+
+    assert df_type.get_batch_size(batch) == 3
+    for expected, actual in zip(parts, df_type.split(batch, [2, 1])):
+        pd.testing.assert_frame_equal(expected, actual)
@@ -0,0 +1,126 @@
+import time
+
+import numpy as np
+import pytest
+
+from ebonite.core.objects.core import Model
+from ebonite.runtime.interface import ExecutionError, Interface
+from ebonite.runtime.interface.base import expose
+from ebonite.runtime.interface.cache import LRUCacheBackend, cache_configured_methods, cache_methods, input_hash
+from ebonite.runtime.interface.ml_model import model_interface
+
+
+class CountingInterface(Interface):
+    def __init__(self):
+        self.calls = 0
+
+    @expose
+    def inc(self, value: int) -> int:
+        self.calls += 1
+        return value + 1
+
+    @expose
+    def random(self, value: int) -> int:
+        self.calls += 1
+        return value + self.calls
+
+    @expose
+    def nothing(self, value: int) -> None:
+        self.calls += 1
+
+
+class CountingModel:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, data):
+        self.calls += 1
+        return data * 2
+
+
+def test_lru_cache_backend__evicts_least_recently_used():
+    backend = LRUCacheBackend(max_size=2, ttl=0)
+    backend.set('a', 1)
+    backend.set('b', 2)
+    assert backend.get('a') == 1
+    backend.set('c', 3)
+    assert backend.get('b') is None
+    assert backend.get('a') == 1
+    assert backend.get('c') == 3
+
+
+def test_lru_cache_backend__expires():
+    backend = LRUCacheBackend(max_size=2, ttl=.01)
+    backend.set('a', 1)
+    time.sleep(.02)
+    assert backend.get('a') is None
+    assert len(backend) == 0
+
+
+def test_cache_methods__only_declared_methods():
+    interface = CountingInterface()
+    caches = cache_methods(interface, ['inc'])
+
+    assert interface.execute('inc', {'value': 1}) == 2
+    assert interface.execute('inc', {'value': 1}) == 2
+    assert interface.execute('inc', {'value': 2}) == 3
+    assert interface.calls == 2
+    assert (caches['inc'].hits, caches['inc'].misses) == (1, 2)
+
+    assert interface.execute('random', {'value': 1}) != interface.execute('random', {'value': 1})
+    assert interface.caches is caches
+
+
+def test_cache_methods__model_interface_raw_and_serialized():
+    model = CountingModel()
+    interface = model_interface(Model.create(model, np.array([[1., 2.]]), 'model'))
+    model.calls = 0
+    cache = cache_methods(interface, ['predict'])['predict']
+
+    data = np.array([[1., 2.]])
+    assert interface.execute('predict', {'vector': data}) == [[2., 4.]]
+    raw = interface.execute('predict', {'vector': data.copy()}, raw=True)
+    np.testing.assert_array_equal(raw, np.array([[2., 4.]]))
+    interface.execute('predict', {'vector': np.array([[1., 3.]])}, raw=True)
+
+    assert model.calls == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_input_hash():
+    signature = CountingInterface.exposed['inc']
+    assert input_hash(signature, {'value': 1}) == input_hash(signature, {'value': 1})
+    assert input_hash(signature, {'value': 1}) != input_hash(signature, {'value': 2})
+
+
+def test_input_hash__arrays():
+    interface = model_interface(Model.create(CountingModel(), np.array([[1., 2.]]), 'model'))
+    signature = interface.exposed_method_signature('predict')
+    data = np.array([[1., 2.], [3., 4.]])
+    assert input_hash(signature, {'vector': data}) == input_hash(signature, {'vector': data.copy()})
+    # non-contiguous array with the same values
+    assert input_hash(signature, {'vector': data}) == input_hash(signature, {'vector': np.asfortranarray(data)})
+    assert input_hash(signature, {'vector': data}) != input_hash(signature, {'vector': data[:1]})
+    assert input_hash(signature, {'vector': data}) != input_hash(signature, {'vector': data.T})
+
+
+def test_cache_methods__none_results():
+    interface = CountingInterface()
+    cache = cache_methods(interface, ['nothing'])['nothing']
+
+    assert interface.execute('nothing', {'value': 1}) is None
+    assert interface.execute('nothing', {'value': 1}) is None
+    assert interface.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_configured_methods(monkeypatch):
+    interface = CountingInterface()
+    assert cache_configured_methods(interface) is None
+
+    monkeypatch.setenv('EBONITE_CACHE_METHODS', 'inc, random')
+    assert set(cache_configured_methods(interface)) == {'inc', 'random'}
+
+    monkeypatch.setenv('EBONITE_CACHE_METHODS', 'unknown')
+    with pytest.raises(ExecutionError):
+        cache_configured_methods(CountingInterface())
@@ -4,7 +4,7 @@ from pyjackson.core import Field, Signature
 import ebonite
 from ebonite.core.objects import DatasetType
 from ebonite.runtime import Interface
-from ebonite.runtime.interface import expose
+from ebonite.runtime.interface import ExecutionError, expose
 from ebonite.runtime.interface.base import InterfaceDescriptor, InterfaceMethodDescriptor
 
 
@@ -50,3 +50,14 @@ def test_interface_descriptor__to_dict(interface: Interface):
             },
             'out_type': {'field': 5, 'type': 'test_container'}
         }]}
+
+
+def test_interface__validates_args(interface: Interface):
+    with pytest.raises(ExecutionError):
+        interface.execute('method1', {})
+    with pytest.raises(ExecutionError):
+        interface.execute('unknown', {})
+
+    arg = object()
+    assert interface.execute('method1', {'arg1': arg}) is arg
+    assert set(interface._validators.keys()) == {'method1'}
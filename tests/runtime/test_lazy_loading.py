@@ -0,0 +1,111 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pyjackson import deserialize, serialize
+
+from ebonite.core.objects.core import Model
+from ebonite.core.objects.wrapper import ModelWrapper
+from ebonite.runtime.interface.ml_model import LazyModelPool, model_interface
+
+
+class Multiplier:
+    def __init__(self, factor):
+        self.factor = factor
+
+    def __call__(self, data):
+        return [x * self.factor for x in data]
+
+
+def _dump(model: Model, path: str) -> Model:
+    with model.wrapper.dump() as art:
+        art.materialize(path)
+    # fresh model meta without model object bound, as runtime reads it
+    return Model(model.name, deserialize(serialize(model.wrapper), ModelWrapper))
+
+
+@pytest.fixture
+def models(tmpdir):
+    result = []
+    for i in range(3):
+        model = Model.create(Multiplier(i + 1), [1, 2], f'model{i}')
+        result.append((_dump(model, os.path.join(tmpdir, str(i))), os.path.join(tmpdir, str(i))))
+    return result
+
+
+def test_lazy_model_pool__loads_on_first_call(models):
+    pool = LazyModelPool()
+    model, path = models[0]
+    pool.register(model.wrapper, path)
+    interface = model_interface(model, pool)
+
+    assert model.wrapper.model is None
+    assert interface.exposed_methods() == ['predict']
+    assert model.wrapper.model is None
+
+    assert interface.execute('predict', {'vector': [1, 2]}) == [1, 2]
+    assert model.wrapper.model is not None
+
+
+def test_lazy_model_pool__evicts_least_recently_used(models):
+    pool = LazyModelPool()
+    for model, path in models:
+        pool.register(model.wrapper, path)
+    interfaces = [model_interface(m, pool) for m, _ in models]
+    sizes = [e.size for e in pool._entries.values()]
+    pool.memory_budget = sizes[0] + sizes[1]
+
+    assert interfaces[0].execute('predict', {'vector': [1, 1]}) == [1, 1]
+    assert interfaces[1].execute('predict', {'vector': [1, 1]}) == [2, 2]
+    assert interfaces[0].execute('predict', {'vector': [1, 1]}) == [1, 1]
+    assert interfaces[2].execute('predict', {'vector': [1, 1]}) == [3, 3]
+
+    wrappers = [m.wrapper for m, _ in models]
+    assert wrappers[0].model is not None
+    assert wrappers[1].model is None
+    assert wrappers[2].model is not None
+    assert pool.loaded_size <= pool.memory_budget
+
+    assert interfaces[1].execute('predict', {'vector': [1, 1]}) == [2, 2]
+
+
+def test_lazy_model_pool__does_not_evict_models_in_use(models):
+    (model0, path0), (model1, path1), _ = models
+    pool = LazyModelPool(memory_budget=1)
+    pool.register(model0.wrapper, path0)
+    pool.register(model1.wrapper, path1)
+
+    with pool.use(model0.wrapper):
+        with pool.use(model1.wrapper):
+            assert model0.wrapper.model is not None
+            assert model1.wrapper.model is not None
+
+
+def test_lazy_model_pool__loading_does_not_block_other_models(models, monkeypatch):
+    (model0, path0), (model1, path1), _ = models
+    pool = LazyModelPool()
+    pool.register(model0.wrapper, path0)
+    pool.register(model1.wrapper, path1)
+    with pool.use(model0.wrapper):
+        pass
+
+    started, release = threading.Event(), threading.Event()
+    load, loads = model1.wrapper.load, []
+
+    def slow_load(path):
+        loads.append(path)
+        started.set()
+        release.wait(5)
+        load(path)
+
+    monkeypatch.setattr(model1.wrapper, 'load', slow_load)
+    with ThreadPoolExecutor(3) as executor:
+        slow = executor.submit(lambda: pool.use(model1.wrapper).__enter__())
+        assert started.wait(5)
+        # second caller of model being loaded waits for the first one instead of loading it again
+        waiting = executor.submit(lambda: pool.use(model1.wrapper).__enter__())
+        assert executor.submit(lambda: pool.use(model0.wrapper).__enter__()).result(1) is model0.wrapper
+        release.set()
+        assert slow.result(5) is waiting.result(5) is model1.wrapper
+    assert loads == [path1]
@@ -0,0 +1,37 @@
+import pytest
+
+from ebonite.runtime.server.metrics import Histogram, ServerMetrics
+
+
+def test_histogram():
+    histogram = Histogram((1, 10))
+    for value in (.5, 1, 5, 100):
+        histogram.observe(value)
+
+    assert histogram.render('h', 'm="a"') == ['h_bucket{m="a",le="1"} 2',
+                                              'h_bucket{m="a",le="10"} 3',
+                                              'h_bucket{m="a",le="+Inf"} 4',
+                                              'h_sum{m="a"} 106.5',
+                                              'h_count{m="a"} 4']
+
+
+def test_server_metrics():
+    metrics = ServerMetrics()
+    with metrics.track('method') as tracker:
+        assert metrics.in_flight['method'] == 1
+        with tracker.phase('model'):
+            pass
+        tracker.request_size = 10
+    with pytest.raises(ValueError):
+        with metrics.track('method'):
+            raise ValueError()
+
+    assert metrics.requests['method'] == 2
+    assert metrics.errors['method'] == 1
+    assert metrics.in_flight['method'] == 0
+    assert metrics.latency[('method', 'model')].count == 1
+
+    text = metrics.render()
+    assert '# TYPE ebonite_request_phase_seconds histogram' in text
+    assert 'ebonite_request_size_bytes_count{method="method"} 1' in text
+    assert 'ebonite_requests_in_flight{method="method"} 0' in text
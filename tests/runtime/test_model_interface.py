@@ -1,3 +1,7 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -54,3 +58,39 @@ def test_with_serde(pd_model: Model):
     data = deserialize(obj, data_type)
 
     interface.execute('predict', {'vector': data})
+
+
+def test_raw_execute(pd_model: Model, data, prediction):
+    interface = model_interface(pd_model)
+    pred = interface.execute('predict', {'vector': data}, raw=True)
+    assert isinstance(pred, np.ndarray)
+    assert (pred == prediction).all()
+
+
+class ConcurrencyModel:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def predict(self, df: 'pd.DataFrame'):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(.05)
+        with self.lock:
+            self.running -= 1
+        return np.zeros(len(df))
+
+
+@pytest.mark.parametrize('thread_safe', [False, True])
+def test_concurrent_calls(model: Model, data, thread_safe, monkeypatch):
+    monkeypatch.setattr(SklearnModelWrapper, 'thread_safe', thread_safe)
+    model_obj = ConcurrencyModel()
+    model.wrapper.bind_model(model_obj, input_data=data)
+    interface = model_interface(model)
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda _: interface.execute('predict', {'vector': data}), range(4)))
+
+    assert (model_obj.max_running > 1) is thread_safe
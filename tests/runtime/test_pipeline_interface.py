@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ebonite.runtime.interface.pipeline import pipeline_interface
+
+
+def test_pipeline_interface(converting_pipeline):
+    interface = pipeline_interface(converting_pipeline)
+    assert interface.execute('run', {'data': np.array([[1., 2.]])}) == [6.]
+
+
+def test_pipeline_interface__batching(converting_pipeline, pipeline_calls, monkeypatch):
+    monkeypatch.setenv('EBONITE_BATCH_MAX_SIZE', '100')
+    monkeypatch.setenv('EBONITE_BATCH_MAX_WAIT_MS', '200')
+    interface = pipeline_interface(converting_pipeline)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda i: interface.execute('run', {'data': np.array([[i, i]], dtype=float)}),
+                                    range(4)))
+
+    assert results == [[4. * i] for i in range(4)]
+    assert len(pipeline_calls) < 4
@@ -0,0 +1,126 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+import requests
+
+from ebonite.ext.flask import FlaskServer
+from ebonite.runtime.interface import Interface, InterfaceLoader
+from ebonite.runtime.server.prefork import PreforkMaster, create_listening_socket
+
+_fork = multiprocessing.get_context('fork')
+
+
+def _serve_once(sock: socket.socket):
+    conn, _ = sock.accept()
+    with conn:
+        conn.sendall(str(os.getpid()).encode('utf-8'))
+
+
+def _read_pid(port):
+    with socket.create_connection(('localhost', port), timeout=5) as conn:
+        return int(conn.recv(32).decode('utf-8'))
+
+
+def _stop(process):
+    os.kill(process.pid, signal.SIGTERM)
+    process.join(10)
+    assert not process.is_alive()
+    assert process.exitcode == 0
+
+
+def test_prefork_master__recycles_workers():
+    sock = create_listening_socket('localhost', 0)
+    port = sock.getsockname()[1]
+    master = _fork.Process(target=PreforkMaster(_serve_once, 2).run, args=(sock,))
+    master.start()
+    sock.close()
+
+    pids = [_read_pid(port) for _ in range(4)]
+    assert len(set(pids)) == 4
+    assert master.pid not in pids
+
+    _stop(master)
+
+
+def _serve_until_stopped(sock: socket.socket):
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopping.append(signum))
+    sock.settimeout(.1)
+    while not stopping:
+        try:
+            conn, _ = sock.accept()
+        except socket.timeout:
+            continue
+        with conn:
+            conn.sendall(str(os.getpid()).encode('utf-8'))
+
+
+def test_prefork_master__rolling_restart():
+    sock = create_listening_socket('localhost', 0)
+    port = sock.getsockname()[1]
+    master = _fork.Process(target=PreforkMaster(_serve_until_stopped, 2).run, args=(sock,))
+    master.start()
+    sock.close()
+
+    old = {_read_pid(port) for _ in range(10)}
+    os.kill(master.pid, signal.SIGHUP)
+    for _ in range(100):
+        if not old.intersection(_read_pid(port) for _ in range(10)):
+            break
+        time.sleep(.1)
+    else:
+        assert False, 'workers were not restarted'
+
+    _stop(master)
+
+
+def test_prefork_master__restarts_one_worker_at_a_time(monkeypatch):
+    master = PreforkMaster(_serve_once, 3)
+    master.pids = {1, 2, 3}
+    killed = []
+    monkeypatch.setattr(os, 'kill', lambda pid, sig: killed.append(pid))
+    monkeypatch.setattr(master, '_spawn', lambda sock: master.pids.add(max(master.pids) + 1))
+
+    master._restart(signal.SIGHUP, None)
+    assert killed == [1] and master.pids == {1, 2, 3, 4}
+
+    for old in (1, 2, 3):
+        # what master loop does when old worker exits
+        master.pids.discard(old)
+        master.replaced.discard(old)
+        master._restart_next()
+    assert killed == [1, 2, 3]
+    assert master.pids == {4, 5, 6}
+
+
+class _EmptyLoader(InterfaceLoader):
+    def load(self) -> Interface:
+        return Interface()
+
+
+def test_flask_server__prefork(monkeypatch):
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        port = s.getsockname()[1]
+    monkeypatch.setenv('EBONITE_HOST', 'localhost')
+    monkeypatch.setenv('EBONITE_PORT', str(port))
+    monkeypatch.setenv('EBONITE_WORKERS', '2')
+    monkeypatch.setenv('EBONITE_WORKER_MAX_REQUESTS', '1')
+
+    server = _fork.Process(target=FlaskServer().start, args=(_EmptyLoader(),))
+    server.start()
+    try:
+        for _ in range(10):
+            try:
+                requests.get(f'http://localhost:{port}/health', timeout=5)
+                break
+            except requests.ConnectionError:
+                time.sleep(.5)
+
+        for _ in range(4):
+            assert requests.get(f'http://localhost:{port}/health', timeout=5).text == 'OK'
+    finally:
+        _stop(server)
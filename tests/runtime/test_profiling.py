@@ -0,0 +1,51 @@
+import os
+import sys
+import threading
+
+from ebonite.core.objects.core import Model
+from ebonite.core.objects.hooks import CallInfo, remove_hook
+from ebonite.runtime.profiling import SamplingProfiler, profile_configured
+
+
+def _slow(a):
+    threading.Event().wait(.1)
+    return a
+
+
+def test_sampling_profiler(tmpdir):
+    wrapper = Model.create(_slow, [1], 'slow').wrapper
+    profiler = SamplingProfiler(str(tmpdir), interval=.005, dump_interval=100)
+    profiler.pre(_info(wrapper, 'probe'))  # starts sampling thread
+
+    info = _info(wrapper, 'predict')
+    profiler.pre(info)
+    try:
+        _slow([1])
+    finally:
+        profiler.post(info)
+    profiler.stop()
+
+    files = os.listdir(str(tmpdir))
+    assert len(files) == 1 and files[0].endswith('.collapsed')
+    with open(os.path.join(str(tmpdir), files[0])) as f:
+        lines = f.read().splitlines()
+    assert any('test_sampling_profiler' in line.split(';')[0] and '_slow' in line for line in lines)
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in lines) > 1
+
+
+def test_profile_configured(tmpdir, monkeypatch):
+    assert profile_configured() is None
+
+    monkeypatch.setenv('EBONITE_PROFILE_DIR', str(tmpdir))
+    monkeypatch.setenv('EBONITE_PROFILE_INTERVAL', '0.005')
+    profiler = profile_configured()
+    try:
+        Model.create(_slow, [1], 'slow').wrapper.call_method('predict', [1])
+    finally:
+        remove_hook(profiler)
+        profiler.stop()
+    assert len(os.listdir(str(tmpdir))) == 1
+
+
+def _info(wrapper, name):
+    return CallInfo(wrapper, name, [1], None, sys._getframe(1))
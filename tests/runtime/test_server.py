@@ -0,0 +1,46 @@
+from typing import List
+
+import numpy as np
+import pytest
+from pyjackson import deserialize
+
+from ebonite.core.analyzer.dataset import DatasetAnalyzer
+from ebonite.runtime import Interface
+from ebonite.runtime.interface import expose
+from ebonite.runtime.server import MalformedHTTPRequestException
+from ebonite.runtime.server.base import create_deserializer, create_json_decoder
+
+array_type = DatasetAnalyzer.analyze(np.array([[1., 2.]]))
+
+
+class MyInterface(Interface):
+    @expose
+    def method(self, vector: array_type, count: int) -> array_type:
+        return array_type.serialize(vector * count)
+
+
+@pytest.mark.parametrize(('obj', 'as_class'), [
+    ([[1., 2.]], array_type),
+    (1, int),
+    ([1, 2], List[int]),
+    ('a', str)
+])
+def test_create_deserializer(obj, as_class):
+    result = create_deserializer(as_class)(obj)
+    expected = deserialize(obj, as_class)
+    assert type(result) is type(expected)
+    assert np.array_equal(result, expected)
+
+
+def test_create_json_decoder():
+    decode = create_json_decoder(MyInterface(), 'method')
+    data = decode({'vector': [[1., 2.]], 'count': 2})
+    assert data['count'] == 2
+    assert data['vector'].tolist() == [[1., 2.]]
+
+    with pytest.raises(MalformedHTTPRequestException):
+        decode({'vector': [[1., 2.]], 'unknown': 2})
+    with pytest.raises(MalformedHTTPRequestException):
+        decode({'vector': [[1., 2., 3.]]})
+    with pytest.raises(MalformedHTTPRequestException):
+        decode([1])